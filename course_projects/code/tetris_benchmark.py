@@ -0,0 +1,83 @@
+"""
+Games-per-second benchmark: list-of-lists Field vs. bitboard engine
+
+tetris_ver1.py still uses the original 4x4 `i * 4 + j in image` scans over the
+list-of-lists Field, while tetris_ver2.py wraps the bitboard engine in
+tetris_bitboard.py. Both follow the same rules, so the same seed must give the
+same game. The benchmark plays random headless games on both and compares.
+
+Usage:
+    python3 tetris_benchmark.py [games]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import tetris_ver1
+import tetris_ver2
+
+# a random bot: mostly moves sideways and rotates, sometimes drops
+ACTIONS = ("left", "right", "rotate", "down", "down", "space")
+
+
+def play_game(game, seed, max_steps=10000):
+    # make_figure() uses the global random module, the bot uses its own stream
+    random.seed(seed)
+    bot = random.Random(seed)
+    game.initialize(20, 10)
+    game.Score = 0
+    game.make_figure(3, 0)
+    steps = 0
+    while game.State == "start" and steps < max_steps:
+        action = bot.choice(ACTIONS)
+        if action == "left":
+            game.go_side(-1)
+        elif action == "right":
+            game.go_side(1)
+        elif action == "rotate":
+            game.rotate()
+        elif action == "down":
+            game.go_down()
+        else:
+            game.go_space()
+        steps += 1
+    return steps, [row[:] for row in game.Field]
+
+
+def measure(game, games):
+    total_steps = 0
+    start = time.perf_counter()
+    for seed in range(games):
+        steps, _ = play_game(game, seed)
+        total_steps += steps
+    elapsed = time.perf_counter() - start
+    return elapsed, total_steps
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    # both engines must play exactly the same games
+    for seed in range(20):
+        if play_game(tetris_ver1, seed) != play_game(tetris_ver2, seed):
+            print(f"Mismatch between engines for seed {seed}")
+            sys.exit(1)
+
+    print(f"Playing {games} random games per engine (20x10 board)")
+    results = {}
+    for label, game in (("list Field (tetris_ver1)", tetris_ver1),
+                        ("bitboard (tetris_ver2)", tetris_ver2)):
+        elapsed, steps = measure(game, games)
+        results[label] = elapsed
+        print(f"  {label:26s} {games / elapsed:9.1f} games/s "
+              f"{steps / elapsed:12.0f} steps/s")
+
+    baseline, bitboard = results.values()
+    print(f"  speedup: {baseline / bitboard:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
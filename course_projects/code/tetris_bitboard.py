@@ -0,0 +1,121 @@
+"""
+Bitboard Tetris engine
+
+The Field is stored as one integer per row: bit j is set when column j is
+occupied. Every rotation of a figure is precomputed once as a list of
+(row offset, column mask) pairs, so collision, freeze and line clear become
+a few bitwise operations per row instead of a 4x4 `i * 4 + j in image` scan.
+
+The engine keeps a list-of-lists color grid (`field`) next to the bit rows,
+because the renderer needs the color of each cell. The color grid is only
+written on freeze and line clear, which are rare compared to collision tests.
+"""
+
+# A figure image is a list of cell numbers in a 4x4 grid (cell = row * 4 + col)
+FIGURE_SIZE = 4
+
+
+class Shape:
+    """One rotation of a figure, precomputed as row masks and bounds."""
+
+    __slots__ = ("image", "rows", "min_col", "max_col", "max_row")
+
+    def __init__(self, image):
+        self.image = tuple(image)
+        masks = [0] * FIGURE_SIZE
+        for cell in image:
+            masks[cell // FIGURE_SIZE] |= 1 << (cell % FIGURE_SIZE)
+        # only the rows that hold a block matter for collision and freeze
+        self.rows = tuple((i, mask) for i, mask in enumerate(masks) if mask)
+        cols = [cell % FIGURE_SIZE for cell in image]
+        self.min_col = min(cols)
+        self.max_col = max(cols)
+        self.max_row = max(cell // FIGURE_SIZE for cell in image)
+
+
+class BitBoard:
+    """
+    Tetris field with rows stored as integer bitmasks.
+
+    The rules match the original list-based functions in tetris_ver2.py,
+    including which rows break_lines() checks and how rows are shifted down.
+    """
+
+    def __init__(self, height, width, figures=None):
+        self.height = height
+        self.width = width
+        self.full_row = (1 << width) - 1
+        self.rows = [0] * height
+        self.field = [[0] * width for _ in range(height)]
+        self._shapes = {}
+        if figures is not None:
+            self.shapes = [[self.shape(image) for image in rotations]
+                           for rotations in figures]
+
+    def shape(self, image):
+        """Return the precomputed Shape for an image (cached per image)."""
+        key = tuple(image)
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = self._shapes[key] = Shape(key)
+        return shape
+
+    def reset(self):
+        self.rows = [0] * self.height
+        # clear the color grid in place so that aliases (e.g. Field) stay valid
+        for line in self.field:
+            line[:] = [0] * self.width
+
+    def intersects(self, shape, shift_x, shift_y):
+        # out of bounds: left, right and bottom walls
+        if shift_x + shape.min_col < 0 or \
+           shift_x + shape.max_col > self.width - 1 or \
+           shift_y + shape.max_row > self.height - 1:
+            return True
+        rows = self.rows
+        if shift_x >= 0:
+            for i, mask in shape.rows:
+                if rows[shift_y + i] & (mask << shift_x):
+                    return True
+        else:
+            # the bounds check above guarantees no block is shifted out
+            for i, mask in shape.rows:
+                if rows[shift_y + i] & (mask >> -shift_x):
+                    return True
+        return False
+
+    def freeze(self, shape, shift_x, shift_y, color):
+        rows = self.rows
+        field = self.field
+        for i, mask in shape.rows:
+            if shift_x >= 0:
+                rows[shift_y + i] |= mask << shift_x
+            else:
+                rows[shift_y + i] |= mask >> -shift_x
+            line = field[shift_y + i]
+            j = 0
+            while mask:
+                if mask & 1:
+                    line[j + shift_x] = color
+                mask >>= 1
+                j += 1
+
+    def break_lines(self):
+        """
+        Remove full rows and return the number of rows removed.
+
+        Like the original, row 0 is never checked and a cleared row is
+        replaced by shifting rows 1..i-1 down one step (row 1 is kept).
+        """
+        rows = self.rows
+        field = self.field
+        full_row = self.full_row
+        lines = 0
+        for i in range(1, self.height):
+            if rows[i] == full_row:
+                lines += 1
+                rows[2:i + 1] = rows[1:i]
+                # copy the colors in place so existing row lists stay valid
+                for k in range(i, 1, -1):
+                    field[k][:] = field[k - 1]
+        return lines
@@ -0,0 +1,29 @@
+"""
+Tetris figures and colors
+
+Shared by tetris_ver2.py and tetris_headless.py. This module must not
+import pygame, so that the headless simulator can use it.
+"""
+
+# Global constants - it's OK as it's read only
+# code smell - why list when tuple (immutable) is OK? Use immutable objects as much as possible
+Colors = [
+    (0, 0, 0),
+    (120, 37, 179),
+    (100, 179, 179),
+    (80, 34, 22),
+    (80, 134, 22),
+    (180, 34, 22),
+    (180, 34, 122),
+]
+
+# code smell - why use mutable list when tuple (immutable) is OK? Use immutable objects as much as possible
+Figures = [
+    [[1, 5, 9, 13], [4, 5, 6, 7]],
+    [[4, 5, 9, 10], [2, 6, 5, 9]],
+    [[6, 7, 9, 10], [1, 5, 6, 10]],
+    [[1, 2, 5, 9], [0, 4, 5, 6], [1, 5, 9, 8], [4, 5, 6, 10]],
+    [[1, 2, 6, 10], [5, 6, 7, 9], [2, 6, 10, 11], [3, 5, 6, 7]],
+    [[1, 4, 5, 6], [1, 4, 5, 9], [4, 5, 6, 9], [1, 5, 6, 9]],
+    [[1, 2, 5, 6]],
+]
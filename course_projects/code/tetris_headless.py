@@ -0,0 +1,401 @@
+"""
+Headless Tetris simulator for batch self-play
+
+Runs the go_down/go_side/rotate/go_space rules of tetris_ver2.py on the
+bitboard engine with no pygame import and no frame pacing. All game state
+(Field, ShiftX, ShiftY, Score, ...) lives on the TetrisSim instance instead of
+module globals, so many independent games can run in one process.
+
+One step() is one frame of main() in tetris_ver2.py: the gravity tick runs
+first (every `gravity_every` frames, fps // 2 in the GUI), then the action.
+
+    sim = TetrisSim(seed=1)
+    state = sim.reset()
+    state, reward, done = sim.step(LEFT)
+
+TetrisVecSim runs N games as stacked NumPy arrays (one row of bitmasks per
+game) and steps all of them with a few array operations per action.
+
+    sims = TetrisVecSim(1024, seed=0)
+    states, rewards, dones = sims.step_many(actions)   # one action per game
+"""
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # only TetrisVecSim needs NumPy
+    np = None
+
+from tetris_bitboard import BitBoard
+from tetris_figures import Colors, Figures
+
+# actions, one per frame (the keys handled in main())
+NOOP, LEFT, RIGHT, ROTATE, DOWN, DROP = range(6)
+ACTIONS = (NOOP, LEFT, RIGHT, ROTATE, DOWN, DROP)
+
+# rows: the Field as one bitmask per row (bit j = column j is occupied)
+TetrisState = namedtuple("TetrisState", "rows type rotation x y score")
+# the same fields for N games, as arrays (rows has one row of bitmasks per game)
+TetrisBatchState = namedtuple("TetrisBatchState", "rows type rotation x y score")
+
+
+class TetrisSim:
+    """One Tetris game with per-instance state."""
+
+    def __init__(self, height=20, width=10, seed=None, gravity_every=12):
+        self.height = height
+        self.width = width
+        self.gravity_every = gravity_every
+        self.rng = random.Random(seed)
+        self.board = BitBoard(height, width, Figures)
+        self.shapes = self.board.shapes
+        self.reset()
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng.seed(seed)
+        self.board.reset()
+        self.state = "start"
+        self.score = 0
+        self.counter = 0
+        self.make_figure(3, 0)
+        return self.observe()
+
+    def observe(self):
+        return TetrisState(tuple(self.board.rows), self.type, self.rotation,
+                           self.shift_x, self.shift_y, self.score)
+
+    @property
+    def field(self):
+        """The color grid, as Field in tetris_ver2.py."""
+        return self.board.field
+
+    @property
+    def done(self):
+        return self.state == "gameover"
+
+    # game rules, same as the module-level functions in tetris_ver2.py
+
+    def make_figure(self, x, y):
+        self.shift_x = x
+        self.shift_y = y
+        self.type = self.rng.randint(0, len(Figures) - 1)
+        self.color = self.rng.randint(1, len(Colors) - 1)
+        self.rotation = 0
+
+    def intersects(self):
+        return self.board.intersects(self.shapes[self.type][self.rotation],
+                                     self.shift_x, self.shift_y)
+
+    def freeze(self):
+        board = self.board
+        board.freeze(self.shapes[self.type][self.rotation],
+                     self.shift_x, self.shift_y, self.color)
+        self.score += board.break_lines() ** 2
+        self.make_figure(3, 0)
+        if self.intersects():
+            self.state = "gameover"
+
+    def go_space(self):
+        while not self.intersects():
+            self.shift_y += 1
+        self.shift_y -= 1
+        self.freeze()
+
+    def go_down(self):
+        self.shift_y += 1
+        if self.intersects():
+            self.shift_y -= 1
+            self.freeze()
+
+    def go_side(self, dx):
+        old_x = self.shift_x
+        self.shift_x += dx
+        if self.intersects():
+            self.shift_x = old_x
+
+    def rotate(self):
+        old_rotation = self.rotation
+        self.rotation = (self.rotation + 1) % len(Figures[self.type])
+        if self.intersects():
+            self.rotation = old_rotation
+
+    def step(self, action):
+        """
+        Advance one frame and apply an action.
+
+        Returns:
+            (TetrisState, reward, done): reward is the score gained this step
+        """
+        if self.state == "gameover":
+            return self.observe(), 0, True
+        score = self.score
+        self.counter += 1
+        if self.counter % self.gravity_every == 0:
+            self.go_down()
+        if self.state == "start":
+            if action == LEFT:
+                self.go_side(-1)
+            elif action == RIGHT:
+                self.go_side(1)
+            elif action == ROTATE:
+                self.rotate()
+            elif action == DOWN:
+                self.go_down()
+            elif action == DROP:
+                self.go_space()
+        return self.observe(), self.score - score, self.state == "gameover"
+
+
+class TetrisVecSim:
+    """
+    N independent games stepped together (finished games auto-reset).
+
+    The boards are one (N, height) array of row bitmasks, and the figures of
+    all games move, collide and freeze with array operations. Only the rare
+    events, a new figure and a line clear, are done per game: each game
+    draws its figures from its own random.Random(seed + i), so game i plays
+    exactly like TetrisSim(seed=seed + i) given the same actions.
+    """
+
+    def __init__(self, n, height=20, width=10, seed=0, gravity_every=12):
+        if np is None:
+            raise ImportError("TetrisVecSim requires NumPy")
+        if width > 62:
+            raise ValueError("width must be at most 62 (rows are 64-bit masks)")
+        self.n = n
+        self.height = height
+        self.width = width
+        self.gravity_every = gravity_every
+        self.full_row = (1 << width) - 1
+        self.rngs = [random.Random(seed + i) for i in range(n)]
+
+        # every rotation of every figure as 4 row masks and its bounds
+        shapes = BitBoard(height, width, Figures).shapes
+        self._first_shape = np.cumsum([0] + [len(r) for r in shapes[:-1]])
+        self._rotations = np.array([len(r) for r in shapes])
+        flat = [shape for rotations in shapes for shape in rotations]
+        self._masks = np.zeros((len(flat), 4), dtype=np.int64)
+        for k, shape in enumerate(flat):
+            for i, mask in shape.rows:
+                self._masks[k, i] = mask
+        self._min_col = np.array([shape.min_col for shape in flat])
+        self._max_col = np.array([shape.max_col for shape in flat])
+        self._max_row = np.array([shape.max_row for shape in flat])
+
+        self.rows = np.zeros((n, height), dtype=np.int64)
+        self.type = np.zeros(n, dtype=np.int64)
+        self.rotation = np.zeros(n, dtype=np.int64)
+        self.color = np.zeros(n, dtype=np.int64)
+        self.x = np.zeros(n, dtype=np.int64)
+        self.y = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.counter = np.zeros(n, dtype=np.int64)
+        self.over = np.zeros(n, dtype=bool)
+        self._reset_games(np.arange(n))
+
+    def __len__(self):
+        return self.n
+
+    def reset(self):
+        self._reset_games(np.arange(self.n))
+        return self.observe_all()
+
+    def observe(self, i):
+        """The state of game i, as TetrisSim.observe() returns it."""
+        return TetrisState(tuple(int(row) for row in self.rows[i]), int(self.type[i]),
+                           int(self.rotation[i]), int(self.x[i]), int(self.y[i]),
+                           int(self.score[i]))
+
+    def observe_all(self):
+        return TetrisBatchState(self.rows.copy(), self.type.copy(), self.rotation.copy(),
+                                self.x.copy(), self.y.copy(), self.score.copy())
+
+    # the game rules on a subset of the games (an array of game indexes)
+
+    def _reset_games(self, games):
+        self.rows[games] = 0
+        self.score[games] = 0
+        self.counter[games] = 0
+        self.over[games] = False
+        self._make_figures(games)
+
+    def _make_figures(self, games):
+        # per game, in the same order of random calls as TetrisSim.make_figure
+        for g in games.tolist():
+            rng = self.rngs[g]
+            self.type[g] = rng.randint(0, len(Figures) - 1)
+            self.color[g] = rng.randint(1, len(Colors) - 1)
+        self.rotation[games] = 0
+        self.x[games] = 3
+        self.y[games] = 0
+
+    def _placed(self, shape, x, y):
+        """Row indexes and shifted row masks of figures placed at (x, y)."""
+        masks = self._masks[shape]
+        left = x[:, None]
+        placed = np.where(left >= 0, masks << np.maximum(left, 0),
+                          masks >> np.maximum(-left, 0))
+        # rows past the bottom only ever hold empty masks
+        rows = np.minimum(y[:, None] + np.arange(4), self.height - 1)
+        return rows, placed
+
+    def _intersects(self, games, shape, x, y):
+        hit = ((x + self._min_col[shape] < 0)
+               | (x + self._max_col[shape] > self.width - 1)
+               | (y + self._max_row[shape] > self.height - 1))
+        inside = ~hit
+        if inside.any():
+            games, shape, x, y = games[inside], shape[inside], x[inside], y[inside]
+            rows, placed = self._placed(shape, x, y)
+            hit[inside] = (self.rows[games[:, None], rows] & placed).any(axis=1)
+        return hit
+
+    def _shape(self, games):
+        return self._first_shape[self.type[games]] + self.rotation[games]
+
+    def _freeze(self, games):
+        rows, placed = self._placed(self._shape(games), self.x[games], self.y[games])
+        # np.bitwise_or.at, since clipped row indexes can repeat
+        np.bitwise_or.at(self.rows, (games[:, None], rows), placed)
+        full = (self.rows[games, 1:] == self.full_row).any(axis=1)
+        for g in games[full].tolist():
+            self.score[g] += self._break_lines(g) ** 2
+        self._make_figures(games)
+        self.over[games] |= self._intersects(games, self._shape(games),
+                                             self.x[games], self.y[games])
+
+    def _break_lines(self, g):
+        # same rows and shifting as BitBoard.break_lines
+        rows = self.rows[g].tolist()
+        lines = 0
+        for i in range(1, self.height):
+            if rows[i] == self.full_row:
+                lines += 1
+                rows[2:i + 1] = rows[1:i]
+        self.rows[g] = rows
+        return lines
+
+    def _go_down(self, games):
+        hit = self._intersects(games, self._shape(games), self.x[games], self.y[games] + 1)
+        self.y[games[~hit]] += 1
+        if hit.any():
+            self._freeze(games[hit])
+
+    def _go_side(self, games, dx):
+        hit = self._intersects(games, self._shape(games), self.x[games] + dx, self.y[games])
+        self.x[games[~hit]] += dx
+
+    def _rotate(self, games):
+        types = self.type[games]
+        rotation = (self.rotation[games] + 1) % self._rotations[types]
+        hit = self._intersects(games, self._first_shape[types] + rotation,
+                               self.x[games], self.y[games])
+        self.rotation[games[~hit]] = rotation[~hit]
+
+    def _go_space(self, games):
+        falling = games
+        while falling.size:
+            hit = self._intersects(falling, self._shape(falling),
+                                   self.x[falling], self.y[falling] + 1)
+            falling = falling[~hit]
+            self.y[falling] += 1
+        self._freeze(games)
+
+    def step_many(self, actions):
+        """
+        Step every game with its own action.
+
+        Args:
+            actions: one action per game (sequence or integer array)
+
+        Returns:
+            (states, rewards, dones): states is a TetrisBatchState, rewards
+            and dones are arrays with one entry per game. A game that ends is
+            reset, and its entry in states is the first state of the new game.
+        """
+        actions = np.asarray(actions)
+        if actions.shape != (self.n,):
+            raise ValueError(f"expected {self.n} actions, got shape {actions.shape}")
+        score = self.score.copy()
+        games = np.arange(self.n)
+        self.counter += 1
+        gravity = games[self.counter % self.gravity_every == 0]
+        if gravity.size:
+            self._go_down(gravity)
+        games = games[~self.over]
+        actions = actions[games]
+        for action, move in ((LEFT, lambda g: self._go_side(g, -1)),
+                             (RIGHT, lambda g: self._go_side(g, 1)),
+                             (ROTATE, self._rotate),
+                             (DOWN, self._go_down),
+                             (DROP, self._go_space)):
+            selected = games[actions == action]
+            if selected.size:
+                move(selected)
+        rewards = self.score - score
+        dones = self.over.copy()
+        if dones.any():
+            self._reset_games(np.flatnonzero(dones))
+        return self.observe_all(), rewards, dones
+
+
+def random_policy(state, rng):
+    return rng.choice(ACTIONS)
+
+
+def play_games(seeds, policy=random_policy, max_steps=100000, **sim_args):
+    """
+    Play one game per seed and return (score, steps) for each.
+
+    A top-level function so that it can run in a worker process.
+    """
+    results = []
+    for seed in seeds:
+        sim = TetrisSim(seed=seed, **sim_args)
+        bot = random.Random(seed)
+        state = sim.observe()
+        steps = 0
+        done = False
+        while not done and steps < max_steps:
+            state, _, done = sim.step(policy(state, bot))
+            steps += 1
+        results.append((sim.score, steps))
+    return results
+
+
+def play_games_parallel(seeds, policy=random_policy, workers=None,
+                        chunk_size=64, **play_args):
+    """Spread play_games() over a process pool, results in seed order."""
+    seeds = list(seeds)
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_games, chunk, policy, **play_args)
+                   for chunk in chunks]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    results = play_games_parallel(range(2000))
+    elapsed = time.perf_counter() - start
+    steps = sum(steps for _, steps in results)
+    print(f"{len(results)} games, {steps} steps in {elapsed:.2f}s "
+          f"({steps / elapsed:,.0f} steps/s)")
+
+    if np is not None:
+        sims = TetrisVecSim(4096)
+        bot = np.random.default_rng(0)
+        start = time.perf_counter()
+        for _ in range(200):
+            sims.step_many(bot.integers(0, len(ACTIONS), len(sims)))
+        elapsed = time.perf_counter() - start
+        print(f"TetrisVecSim: {len(sims)} games x 200 steps in {elapsed:.2f}s "
+              f"({len(sims) * 200 / elapsed:,.0f} steps/s)")
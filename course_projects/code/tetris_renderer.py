@@ -0,0 +1,231 @@
+"""
+Dirty-rectangle renderer for the Tetris draw loop
+
+draw_board() in tetris_ver2.py fills the whole screen and draws every cell and
+grid line on every frame, and main() creates its fonts on every frame. This
+renderer draws the static grid once on a background surface, creates fonts
+once, and on each frame redraws only the cells that changed since the last
+frame (figure moved, figure frozen, lines cleared). Only those rectangles are
+passed to pygame.display.update().
+
+Cell drawing matches draw_board()/draw_figure() pixel for pixel.
+"""
+import time
+
+import pygame
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (128, 128, 128)
+
+
+class TetrisRenderer:
+    def __init__(self, screen, height, width, colors, x=100, y=60, zoom=20):
+        self.screen = screen
+        self.height = height
+        self.width = width
+        self.colors = colors
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+
+        # static grid, drawn once
+        self.background = pygame.Surface(screen.get_size())
+        self.background.fill(WHITE)
+        for i in range(height):
+            for j in range(width):
+                pygame.draw.rect(self.background, GRAY, self.cell_rect(i, j), 1)
+
+        # fonts and the fixed game over text, rendered once
+        self.font = pygame.font.SysFont('Calibri', 25, True, False)
+        font1 = pygame.font.SysFont('Calibri', 65, True, False)
+        self.game_over_text = (
+            (font1.render("Game Over", True, (255, 125, 0)), (20, 200)),
+            (font1.render("Enter q to Quit", True, (255, 215, 0)), (25, 265)),
+        )
+
+        # what is on the screen now
+        self._field = None
+        self._figure_cells = frozenset()
+        self._figure_color = 0
+        self._score = None
+        self._score_rect = None
+        self._game_over = False
+
+        # per-frame draw time in seconds
+        self.frames = 0
+        self.last_time = 0.0
+        self.max_time = 0.0
+        self.total_time = 0.0
+
+    def cell_rect(self, i, j):
+        return pygame.Rect(self.x + self.zoom * j, self.y + self.zoom * i,
+                           self.zoom, self.zoom)
+
+    def figure_cells(self, image, shift_x, shift_y):
+        cells = set()
+        for p in image:
+            i = p // 4 + shift_y
+            j = p % 4 + shift_x
+            if 0 <= i < self.height and 0 <= j < self.width:
+                cells.add((i, j))
+        return frozenset(cells)
+
+    def _draw_cell(self, field, i, j, figure_cells, figure_color):
+        zoom = self.zoom
+        rect = self.cell_rect(i, j)
+        self.screen.blit(self.background, rect, rect)
+        if field[i][j] > 0:
+            pygame.draw.rect(self.screen, self.colors[field[i][j]],
+                             [rect.x + 1, rect.y + 1, zoom - 2, zoom - 1])
+        if (i, j) in figure_cells:
+            pygame.draw.rect(self.screen, self.colors[figure_color],
+                             [rect.x + 1, rect.y + 1, zoom - 2, zoom - 2])
+        return rect
+
+    def _draw_score(self, score):
+        rects = []
+        if self._score_rect is not None:
+            self.screen.blit(self.background, self._score_rect, self._score_rect)
+            rects.append(self._score_rect)
+        text = self.font.render("Score: " + str(score), True, BLACK)
+        self._score_rect = self.screen.blit(text, [0, 0])
+        rects.append(self._score_rect)
+        self._score = score
+        return rects
+
+    def _draw_full(self, field, figure_cells, figure_color, score, game_over):
+        self.screen.blit(self.background, (0, 0))
+        self._score_rect = None
+        for i in range(self.height):
+            for j in range(self.width):
+                self._draw_cell(field, i, j, figure_cells, figure_color)
+        self._draw_score(score)
+        if game_over:
+            for text, position in self.game_over_text:
+                self.screen.blit(text, position)
+
+    def draw(self, field, image, color, shift_x, shift_y, score, game_over):
+        """
+        Draw one frame and update only the changed parts of the display.
+
+        Returns:
+            list: the rectangles passed to pygame.display.update()
+        """
+        start = time.perf_counter()
+        figure_cells = self.figure_cells(image, shift_x, shift_y)
+
+        if self._field is None or game_over or self._game_over:
+            changed = (self._field != field or
+                       figure_cells != self._figure_cells or
+                       color != self._figure_color or
+                       score != self._score or
+                       game_over != self._game_over)
+            if changed:
+                # the game over text covers the board, redraw everything
+                self._draw_full(field, figure_cells, color, score, game_over)
+                self._field = [line[:] for line in field]
+                rects = [self.screen.get_rect()]
+            else:
+                rects = []
+        else:
+            dirty = set()
+            # cells of the field changed by a freeze or a line clear
+            for i, line in enumerate(field):
+                old_line = self._field[i]
+                if line != old_line:
+                    for j in range(self.width):
+                        if line[j] != old_line[j]:
+                            dirty.add((i, j))
+                    self._field[i] = line[:]
+            # cells the figure left or entered
+            if color != self._figure_color:
+                dirty |= figure_cells | self._figure_cells
+            else:
+                dirty |= figure_cells ^ self._figure_cells
+            rects = [self._draw_cell(field, i, j, figure_cells, color)
+                     for i, j in dirty]
+            if score != self._score:
+                rects.extend(self._draw_score(score))
+
+        self._figure_cells = figure_cells
+        self._figure_color = color
+        self._game_over = game_over
+
+        if rects:
+            pygame.display.update(rects)
+
+        elapsed = time.perf_counter() - start
+        self.frames += 1
+        self.last_time = elapsed
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        return rects
+
+    def report(self, fps=None):
+        """Average and worst per-frame draw time, and share of the frame budget."""
+        if self.frames == 0:
+            return "no frames drawn"
+        average = self.total_time / self.frames
+        text = (f"{self.frames} frames, draw time avg {average * 1000:.3f} ms, "
+                f"max {self.max_time * 1000:.3f} ms")
+        if fps:
+            budget = 1.0 / fps
+            text += f" ({average / budget:.1%} of the {budget * 1000:.1f} ms frame budget)"
+        return text
+
+
+def benchmark(frames=2000, sizes=((20, 10), (40, 20), (80, 40))):
+    """Per-frame draw time of draw_board()+draw_figure() vs. TetrisRenderer."""
+    import os
+    import random
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import tetris_ver2
+    from tetris_headless import TetrisSim, ACTIONS
+
+    def frames_of(height, width):
+        # the same random game for both renderers
+        sim = TetrisSim(height, width, seed=0)
+        bot = random.Random(0)
+        for _ in range(frames):
+            _, _, done = sim.step(bot.choice(ACTIONS))
+            if done:
+                sim.reset()
+            yield sim, tetris_ver2.Figures[sim.type][sim.rotation]
+
+    pygame.init()
+    zoom = 10
+    for height, width in sizes:
+        screen = pygame.display.set_mode((width * zoom + 200, height * zoom + 120))
+
+        # what main() in tetris_ver2.py does on every frame
+        full_time = 0.0
+        tetris_ver2.Height, tetris_ver2.Width = height, width
+        for sim, image in frames_of(height, width):
+            start = time.perf_counter()
+            tetris_ver2.Field, tetris_ver2.Color = sim.field, sim.color
+            tetris_ver2.draw_board(screen, 100, 60, zoom)
+            tetris_ver2.draw_figure(screen, image, 100, 60,
+                                    sim.shift_x, sim.shift_y, zoom)
+            font = pygame.font.SysFont('Calibri', 25, True, False)
+            screen.blit(font.render("Score: " + str(sim.score), True, BLACK),
+                        [0, 0])
+            pygame.display.flip()
+            full_time += time.perf_counter() - start
+
+        renderer = TetrisRenderer(screen, height, width, tetris_ver2.Colors,
+                                  zoom=zoom)
+        for sim, image in frames_of(height, width):
+            renderer.draw(sim.field, image, sim.color, sim.shift_x,
+                          sim.shift_y, sim.score, sim.done)
+
+        print(f"{height}x{width} board")
+        print(f"  full redraw: {full_time / frames * 1000:.3f} ms/frame")
+        print(f"  renderer:    {renderer.report(fps=200)}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,33 +1,14 @@
 import pygame
 import random
-
-# Global constants - it's OK as it's read only
-# code smell - why list when tuple (immutable) is OK? Use immutable objects as much as possible
-Colors = [
-    (0, 0, 0),
-    (120, 37, 179),
-    (100, 179, 179),
-    (80, 34, 22),
-    (80, 134, 22),
-    (180, 34, 22),
-    (180, 34, 122),
-]
+from tetris_bitboard import BitBoard
+from tetris_renderer import TetrisRenderer
+from tetris_figures import Colors, Figures
 
 # Define some colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GRAY = (128, 128, 128)
 
-# code smell - why use mutable list when tuple (immutable) is OK? Use immutable objects as much as possible
-Figures = [
-    [[1, 5, 9, 13], [4, 5, 6, 7]],
-    [[4, 5, 9, 10], [2, 6, 5, 9]],
-    [[6, 7, 9, 10], [1, 5, 6, 10]],
-    [[1, 2, 5, 9], [0, 4, 5, 6], [1, 5, 9, 8], [4, 5, 6, 10]],
-    [[1, 2, 6, 10], [5, 6, 7, 9], [2, 6, 10, 11], [3, 5, 6, 7]],
-    [[1, 4, 5, 6], [1, 4, 5, 9], [4, 5, 6, 9], [1, 5, 6, 9]],
-    [[1, 2, 5, 6]],
-]
 size = (400, 500)
 
 # Global variables (code smell - we should remove them by refactoring)
@@ -37,6 +18,7 @@ Rotation = 0
 
 State = "start" # or "gameover"
 Field = []
+Board = None
 
 # Tetris block Height and Width
 Height = 0
@@ -62,49 +44,17 @@ def make_figure(x, y):
     Rotation = 0
 
 def intersects(image):
-    intersection = False
-    # code smell - what is 4? Magic number
-    for i in range(4):
-        for j in range(4):
-            if i * 4 + j in image:
-                # out of bounds
-                # code smell - confusing, why Y is related i and X is related j?
-                if i + ShiftY > Height - 1 or \
-                   j + ShiftX > Width - 1 or \
-                   j + ShiftX < 0 or \
-                   Field[i + ShiftY][j + ShiftX] > 0:
-                       intersection = True
-    return intersection
+    # the 4x4 scan lives in the bitboard engine (tetris_bitboard.py)
+    return Board.intersects(Board.shape(image), ShiftX, ShiftY)
 
 def break_lines():
-    # code smell - why is it hard to read code? why make two sub-functions
-    # for i in ...
-    #  is_filled = check_row_filled(...)
-    #  if is_filled:
-    #.   delete_row(...)
-    global Height, Field, Score
-    lines = 0
-    for i in range(1, Height):
-        zeros = 0
-        for j in range(Width):
-            if Field[i][j] == 0:
-                zeros += 1
-        # this row is full
-        if zeros == 0:
-            lines += 1
-            for k in range(i, 1, -1):
-                for j in range(Width):
-                    Field[k][j] = Field[k - 1][j]
-                    
+    global Score
+    lines = Board.break_lines()
     Score += lines ** 2 # code smell - what if I want to use other stragies for score computation?    
 
 def freeze(image):
-    # code smell - can you guess what it does? why there is no comments on what it does, how, and why?
-    global Field, State
-    for i in range(4):
-        for j in range(4):
-            if i * 4 + j in image:
-                Field[i + ShiftY][j + ShiftX] = Color
+    global State
+    Board.freeze(Board.shape(image), ShiftX, ShiftY, Color)
     break_lines()
     make_figure(3, 0) 
     if intersects(Figures[Type][Rotation]):
@@ -143,9 +93,10 @@ def rotate():
         Rotation = old_rotation
         
 def init_board():
-    for i in range(Height):
-        new_line = [0] * Width # polymorphism using * 
-        Field.append(new_line)
+    global Board, Field
+    Board = BitBoard(Height, Width, Figures)
+    # Field is the engine's color grid, draw_board() reads it
+    Field = Board.field
 
 def draw_board(screen, x, y, zoom):
     screen.fill(WHITE)
@@ -190,6 +141,8 @@ def main():
 
     initialize(20, 10) # code smell - what is 20 and 10? Can we use keyword argument? 
     make_figure(3,0)
+    # grid and fonts are drawn/created once, not on every frame
+    renderer = TetrisRenderer(screen, Height, Width, Colors, x = StartX, y = StartY, zoom = Tzoom)
     done = False
     while not done:
         counter += 1
@@ -222,27 +175,13 @@ def main():
             if event.type == pygame.KEYUP and event.key == pygame.K_DOWN:
                 pressing_down = False
                 
-        draw_board(screen = screen, x = StartX, y = StartY, zoom = Tzoom)
-        
-        # code smell - how many values duplication Figures[Type][Rotation]
-        draw_figure(screen = screen, image = Figures[Type][Rotation], x = StartX, y = StartY, shift_x = ShiftX, shift_y = ShiftY, zoom = Tzoom)
-
-        font = pygame.font.SysFont('Calibri', 25, True, False)
-        global Score
-        text = font.render("Score: " + str(Score), True, BLACK)
-        screen.blit(text, [0, 0])
-        
-        if State == "gameover":
-            font1 = pygame.font.SysFont('Calibri', 65, True, False)
-            text_game_over = font1.render("Game Over", True, (255, 125, 0))
-            text_game_over1 = font1.render("Enter q to Quit", True, (255, 215, 0))        
-            screen.blit(text_game_over, [20, 200])
-            screen.blit(text_game_over1, [25, 265])
-
-        # refresh the screen
-        pygame.display.flip()
+        # only the cells changed since the last frame are redrawn
+        renderer.draw(field = Field, image = Figures[Type][Rotation], color = Color,
+                      shift_x = ShiftX, shift_y = ShiftY, score = Score,
+                      game_over = State == "gameover")
         clock.tick(fps)
 
+    print(renderer.report(fps))
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""
+Benchmark for iterating a BookShelf
+
+Fills a shelf with 10M books and iterates it in different ways, compared
+with the fixed-size shelf and has_next()/next() iterator BookShelf used to
+have, where every book went through a bounds-checked get_book_at() call.
+
+Usage:
+    python3 benchmark.py [books]
+"""
+
+import sys
+import time
+from itertools import cycle, islice
+
+from book import Book
+from book_shelf import BookShelf
+
+
+class FixedBookShelf:
+  """BookShelf's previous implementation."""
+
+  def __init__(self, max_size: int):
+    self._books = [None] * max_size
+    self._last = 0
+    self._max_size = max_size
+
+  def get_book_at(self, index):
+    if 0 <= index < self._last:
+      return self._books[index]
+    else:
+      raise IndexError(f"Index {index} is out of bounds")
+
+  def append_book(self, book: Book):
+    if self._last >= self._max_size:
+      raise ValueError("BookShelf is full, cannot add more books")
+    self._books[self._last] = book
+    self._last += 1
+
+  def iterator(self):
+    return FixedBookShelfIterator(self)
+
+  def get_length(self):
+    return self._last
+
+
+class FixedBookShelfIterator:
+  """BookShelfIterator's previous implementation."""
+
+  def __init__(self, book_shelf):
+    self._book_shelf = book_shelf
+    self._index = 0
+
+  def next(self):
+    if not self.has_next():
+      raise StopIteration("No more books in the shelf")
+    book = self._book_shelf.get_book_at(self._index)
+    self._index += 1
+    return book
+
+  def has_next(self):
+    return self._index < self._book_shelf.get_length()
+
+
+def timed(label: str, count: int, function):
+  start = time.perf_counter()
+  result = function()
+  elapsed = time.perf_counter() - start
+  print(f"  {label:38} {elapsed:8.3f}s {count / elapsed:>14,.0f} books/sec")
+  return result
+
+
+def count_with_has_next(iterator):
+  count = 0
+  while iterator.has_next():
+    iterator.next()
+    count += 1
+  return count
+
+
+def main():
+  count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+  # A thousand different books, each on the shelf many times
+  books = [Book(f"Book {i:04}") for i in range(1000)]
+  is_even = lambda book: book.get_name()[-1] in "02468"
+  print(f"{count:,} books")
+
+  fixed = FixedBookShelf(count)
+  timed("fill: previous append_book()", count,
+        lambda: [fixed.append_book(book) for book in islice(cycle(books), count)])
+  shelf = BookShelf()
+  timed("fill: extend()", count, lambda: shelf.extend(islice(cycle(books), count)))
+
+  old = timed("previous has_next()/next() loop", count,
+              lambda: count_with_has_next(fixed.iterator()))
+  new = timed("has_next()/next() loop", count, lambda: count_with_has_next(shelf.iterator()))
+  timed("for book in shelf", count, lambda: sum(1 for _ in shelf))
+  timed("for book in iterator(where=even)", count,
+        lambda: sum(1 for _ in shelf.iterator(where=is_even)))
+  timed("pages(1000) of all books", count, lambda: sum(len(page) for page in shelf.pages(1000)))
+  assert old == new == count
+
+  start = time.perf_counter()
+  page = shelf.page(count // 1000 - 1, 1000)
+  print(f"  {'last page(number, 1000)':38} {(time.perf_counter() - start) * 1000:8.3f}ms "
+        f"({len(page)} books)")
+
+
+if __name__ == "__main__":
+  main()
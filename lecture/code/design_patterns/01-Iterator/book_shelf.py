@@ -1,32 +1,77 @@
+from itertools import islice
 from book import Book
 from book_shelf_iterator import BookShelfIterator
 from interfaces.abstract_book_shelf import AbstractBookShelf
 
 class BookShelf(AbstractBookShelf):
-  def __init__(self, max_size: int):
-    self._books = [None] * max_size  # Fixed-size array like Java
-    self._last = 0  # Index of the next available position
-    self._max_size = max_size
+  def __init__(self, max_size: int = None):
+    self._books = []  # Grows as needed (amortized O(1) append)
+    self._max_size = max_size  # None for no limit
   
   def get_book_at(self, index):
-    if 0 <= index < self._last:
+    if 0 <= index < len(self._books):
       return self._books[index]
     else:
       raise IndexError(f"Index {index} is out of bounds")
   
   def append_book(self, book: Book):
-    if self._last >= self._max_size:
+    if self._max_size is not None and len(self._books) >= self._max_size:
       raise ValueError("BookShelf is full, cannot add more books")
       
-    self._books[self._last] = book
-    self._last += 1
+    self._books.append(book)
   
-  def iterator(self):
-    return BookShelfIterator(self)
+  def extend(self, books):
+    if self._max_size is None:
+      self._books.extend(books)
+      return
+    books = list(books)
+    if len(self._books) + len(books) > self._max_size:
+      raise ValueError("BookShelf is full, cannot add more books")
+    self._books.extend(books)
+  
+  def iterator(self, where=None, start: int = 0, stop: int = None):
+    # Optionally only the books in [start, stop) for which where(book) is true,
+    # found lazily without copying the shelf
+    return BookShelfIterator(self, where, start, stop)
+  
+  def page(self, number: int, page_size: int, where=None):
+    if number < 0 or page_size <= 0:
+      raise ValueError("Page number must not be negative and page size must be positive")
+    start = number * page_size
+    if where is None:
+      # Unfiltered pages start at a known index
+      return self._books[start:start + page_size]
+    return list(islice(filter(where, self._books), start, start + page_size))
+  
+  def pages(self, page_size: int, where=None):
+    if page_size <= 0:
+      raise ValueError("Page size must be positive")
+    books = iter(self._books) if where is None else filter(where, self._books)
+    while True:
+      page = list(islice(books, page_size))
+      if not page:
+        return
+      yield page
   
   def get_length(self):
-    return self._last
+    return len(self._books)
+  
+  def __len__(self):
+    return len(self._books)
+  
+  def __iter__(self):
+    return iter(self._books)
+  
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      book_shelf = BookShelf(self._max_size)
+      book_shelf._books = self._books[index]
+      return book_shelf
+    try:
+      return self._books[index]
+    except IndexError:
+      raise IndexError(f"Index {index} is out of bounds") from None
   
   def __str__(self):
-    book_names = [book.get_name() for book in self._books[:self._last]]
-    return f"BookShelf with {self._last} books: {book_names}"
+    book_names = [book.get_name() for book in self._books]
+    return f"BookShelf with {len(self._books)} books: {book_names}"
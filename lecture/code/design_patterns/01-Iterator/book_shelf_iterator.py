@@ -1,18 +1,58 @@
 from book import Book
 from interfaces.abstract_shelf_iterator import AbstractIterator
 
+_NO_BOOK = object()
+
 class BookShelfIterator(AbstractIterator):
-  def __init__(self, book_shelf):
+  def __init__(self, book_shelf, where=None, start: int = 0, stop: int = None):
     self._book_shelf = book_shelf
-    self._index = 0
+    self._where = where
+    self._index = max(0, start)
+    self._stop = stop  # None: up to the end of the shelf, books appended later included
+    self._next_book = _NO_BOOK  # Looked up by has_next()
+    self._plain = where is None and stop is None  # No lookahead needed
+  
+  def _find(self):
+    # The length is read on every lookup, so books appended while
+    # iterating are visited too
+    book_shelf = self._book_shelf
+    stop = book_shelf.get_length()
+    if self._stop is not None:
+      stop = min(stop, self._stop)
+    where = self._where
+    while self._index < stop:
+      book = book_shelf.get_book_at(self._index)
+      self._index += 1
+      if where is None or where(book):
+        return book
+    return _NO_BOOK
   
   def next(self):
-    if not self.has_next():
+    book = self._next_book
+    if book is not _NO_BOOK:
+      self._next_book = _NO_BOOK
+      return book
+    if self._plain:
+      try:
+        book = self._book_shelf.get_book_at(self._index)
+      except IndexError:
+        raise StopIteration("No more books in the shelf") from None
+      self._index += 1
+      return book
+    book = self._find()
+    if book is _NO_BOOK:
       raise StopIteration("No more books in the shelf")
-      
-    book = self._book_shelf.get_book_at(self._index)
-    self._index += 1
     return book
   
   def has_next(self):
-    return self._index < self._book_shelf.get_length()
+    if self._next_book is not _NO_BOOK:
+      return True
+    if self._plain:
+      return self._index < self._book_shelf.get_length()
+    self._next_book = self._find()
+    return self._next_book is not _NO_BOOK
+  
+  def __iter__(self):
+    return self
+  
+  __next__ = next
@@ -19,5 +19,24 @@ def main():
         print(f"   {book.get_name()}")
     print()
     
+    # A shelf without max_size grows as books are added
+    big_shelf = BookShelf()
+    big_shelf.extend(Book(f"Book {i}") for i in range(1, 26))
+    print(f"Growable shelf with {len(big_shelf)} books")
+    
+    print("Python iteration over a slice:")
+    for book in big_shelf[:3]:
+        print(f"   {book.get_name()}")
+    
+    print("Books ending in 5, found lazily:")
+    it = big_shelf.iterator(where=lambda book: book.get_name().endswith("5"))
+    while it.has_next():
+        print(f"   {it.next().get_name()}")
+    
+    print("Pages of 10 books:")
+    for number, page in enumerate(big_shelf.pages(10)):
+        print(f"   Page {number}: {page[0].get_name()} - {page[-1].get_name()}")
+    print()
+    
 if __name__ == "__main__":
     main()
@@ -0,0 +1,82 @@
+"""
+Microbenchmark for ProbStrategy moves
+
+Two ProbStrategy players play a generalized Rock-Paper-Scissors with N
+hands (N odd: hand i beats the N // 2 hands after it, cyclically). A move
+is one next_hand_value() and one study() call. The benchmark reports
+moves/sec for growing N, compared with summing and scanning the whole
+history row on every move, as ProbStrategy used to.
+
+Usage:
+    python3 benchmark.py [rounds]
+"""
+
+import random
+import sys
+import time
+
+from prob_strategy import ProbStrategy
+
+
+class RowScanStrategy:
+    """ProbStrategy's previous algorithm, generalized to N hands."""
+
+    def __init__(self, seed: int, hand_count: int = 3):
+        self._random = random.Random(seed)
+        self._hand_count = hand_count
+        self._prev_hand_value = 0
+        self._current_hand_value = 0
+        self._history = [[1] * hand_count for _ in range(hand_count)]
+
+    def next_hand_value(self) -> int:
+        row = self._history[self._current_hand_value]
+        bet = self._random.randint(0, sum(row) - 1)
+        total = 0
+        for hand_value, frequency in enumerate(row):
+            total += frequency
+            if bet < total:
+                break
+        self._prev_hand_value = self._current_hand_value
+        self._current_hand_value = hand_value
+        return hand_value
+
+    def study(self, win: bool) -> None:
+        row = self._history[self._prev_hand_value]
+        if win:
+            row[self._current_hand_value] += 1
+        else:
+            for hand_value in range(self._hand_count):
+                if hand_value != self._current_hand_value:
+                    row[hand_value] += 1
+
+
+def play(strategy_class, hand_count: int, rounds: int) -> float:
+    """Play rounds between two strategies; return moves per second."""
+    player1 = strategy_class(314, hand_count)
+    player2 = strategy_class(15, hand_count)
+    half = hand_count // 2
+    start = time.perf_counter()
+    for _ in range(rounds):
+        hand1 = player1.next_hand_value()
+        hand2 = player2.next_hand_value()
+        if hand1 != hand2:
+            win1 = 1 <= (hand2 - hand1) % hand_count <= half
+            player1.study(win1)
+            player2.study(not win1)
+    elapsed = time.perf_counter() - start
+    return 2 * rounds / elapsed
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{rounds:,} rounds per game (moves/sec)")
+    print(f"  {'hands':>6} {'row scan':>12} {'ProbStrategy':>14}")
+    for hand_count in (3, 5, 15, 101, 1001):
+        scan_rounds = rounds if hand_count <= 101 else rounds // 10
+        scan = play(RowScanStrategy, hand_count, scan_rounds)
+        tree = play(ProbStrategy, hand_count, rounds)
+        print(f"  {hand_count:>6} {scan:>12,.0f} {tree:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
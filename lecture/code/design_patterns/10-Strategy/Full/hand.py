@@ -30,7 +30,8 @@ class Hand(Enum):
             name (str): Korean name of the hand
             hand_value (int): Numeric value (0=Rock, 1=Scissors, 2=Paper)
         """
-        self.name = name
+        # Enum reserves .name for the member name (ROCK, ...)
+        self.korean_name = name
         self.hand_value = hand_value
     
     @classmethod
@@ -101,11 +102,11 @@ class Hand(Enum):
     
     def __str__(self) -> str:
         """String representation showing the Korean name."""
-        return self.name
+        return self.korean_name
     
     def __repr__(self) -> str:
         """Developer-friendly representation."""
-        return f"Hand.{self.name}({self.name}, {self.hand_value})"
+        return f"Hand.{self.name}({self.korean_name}, {self.hand_value})"
 
 
 # Alternative implementation without Enum (more similar to Java)
@@ -5,15 +5,27 @@ This concrete strategy implements a probabilistic approach based on game history
 It maintains a 3x3 matrix tracking which hands follow which hands, and uses
 this history to make probabilistic decisions about the next move.
 
+The matrix can also be N x N, for variants of the game with more hands
+(e.g. rock-paper-scissors-lizard-Spock with 5). Each row keeps its total
+and a cumulative-frequency table (a Fenwick tree) that study() updates in
+place, so picking a hand is a binary search over the table: a move costs
+O(log N) instead of summing and scanning a whole row. Rows of up to
+LINEAR_SCAN_MAX hands are still scanned directly, which is faster than
+the tree at that size (the 3-hand game included).
+
 This demonstrates a more sophisticated concrete strategy in the Strategy pattern.
 """
 
 import random
-from typing import List
+from typing import List, Optional
 from strategy import Strategy
 from hand import Hand
 
 
+# Up to this many hands, scanning a row beats descending its Fenwick tree
+LINEAR_SCAN_MAX = 32
+
+
 class ProbStrategy(Strategy):
     """
     A sophisticated strategy that learns from game history.
@@ -24,24 +36,62 @@ class ProbStrategy(Strategy):
     - Adapts its behavior based on win/loss outcomes
     """
     
-    def __init__(self, seed: int):
+    def __init__(self, seed: int, hand_count: int = 3):
         """
         Initialize the ProbStrategy with a random seed.
         
         Args:
             seed (int): Seed for the random number generator
+            hand_count (int): Number of different hands (3 for Rock-Paper-Scissors)
+            
+        Raises:
+            ValueError: If hand_count is less than 2
         """
+        if hand_count < 2:
+            raise ValueError(f"Invalid hand count: {hand_count}. Must be at least 2.")
         self._random = random.Random(seed)
+        self._hand_count = hand_count
         self._prev_hand_value = 0
         self._current_hand_value = 0
         
-        # 3x3 history matrix: history[prev][current] = frequency
-        # Initialized with 1s to avoid zero probabilities
-        self._history: List[List[int]] = [
-            [1, 1, 1],
-            [1, 1, 1], 
-            [1, 1, 1]
-        ]
+        # NxN history matrix: history[prev][current] = frequency
+        # Initialized with 1s to avoid zero probabilities.
+        # A lost game adds 1 to all but one hand of a row; that is stored
+        # as 1 added to the row's offset and 1 taken from that one hand, so
+        # the frequency is _counts[prev][current] + _offsets[prev].
+        self._counts: List[List[int]] = [[1] * hand_count for _ in range(hand_count)]
+        self._offsets: List[int] = [0] * hand_count
+        self._totals: List[int] = [hand_count] * hand_count
+        # Fenwick tree of each row of _counts (1-based), for large rows only
+        self._trees: Optional[List[List[int]]] = None
+        if hand_count > LINEAR_SCAN_MAX:
+            self._trees = [self._build_tree(row) for row in self._counts]
+        self._top_step = 1 << (hand_count.bit_length() - 1)
+    
+    @staticmethod
+    def _build_tree(counts: List[int]) -> List[int]:
+        """
+        Build the Fenwick tree of a row in O(N).
+        
+        tree[i] holds the sum of counts over the (i & -i) positions ending at i.
+        """
+        tree = [0] + counts
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        return tree
+    
+    def _add(self, row: int, hand_value: int, delta: int) -> None:
+        """Add delta to the count of one hand in a row, keeping its tree in sync."""
+        self._counts[row][hand_value] += delta
+        if self._trees is None:
+            return
+        tree = self._trees[row]
+        i = hand_value + 1
+        while i <= self._hand_count:
+            tree[i] += delta
+            i += i & -i
     
     def next_hand(self) -> Hand:
         """
@@ -52,29 +102,62 @@ class ProbStrategy(Strategy):
         
         Returns:
             Hand: The next hand to play
+            
+        Raises:
+            ValueError: If the strategy plays with more than the 3 Hand values
+                        (use next_hand_value() then)
         """
-        # Generate random number for probabilistic selection
-        bet = self._random.randint(0, self._get_sum(self._current_hand_value) - 1)
+        return Hand.get_hand(self.next_hand_value())
+    
+    def next_hand_value(self) -> int:
+        """
+        Determine the numeric value of the next hand.
+        
+        Picks hand h with probability history[current][h] / sum of the row:
+        a random bet in [0, sum) selects the first hand whose cumulative
+        frequency exceeds it, found by scanning the row (small rows) or by
+        descending the row's Fenwick tree.
+        
+        Returns:
+            int: The next hand value (0 to hand_count - 1)
+        """
+        current = self._current_hand_value
+        bet = self._random.randint(0, self._totals[current] - 1)
+        offset = self._offsets[current]
         
-        # Select hand based on accumulated probabilities
-        hand_value = 0
-        if bet < self._history[self._current_hand_value][0]:
-            hand_value = 0  # Rock
-        elif bet < (self._history[self._current_hand_value][0] + 
-                   self._history[self._current_hand_value][1]):
-            hand_value = 1  # Scissors
+        if self._trees is None:
+            # Subtract frequencies until the bet falls inside one
+            position = 0
+            for count in self._counts[current]:
+                bet -= count + offset
+                if bet < 0:
+                    break
+                position += 1
         else:
-            hand_value = 2  # Paper
+            # Find the largest position whose cumulative frequency is <= bet
+            tree = self._trees[current]
+            hand_count = self._hand_count
+            position = 0
+            step = self._top_step
+            while step:
+                candidate = position + step
+                if candidate <= hand_count:
+                    # tree[candidate] covers the `step` hands after position
+                    frequency = tree[candidate] + offset * step
+                    if frequency <= bet:
+                        position = candidate
+                        bet -= frequency
+                step >>= 1
         
         # Update hand values for next iteration
-        self._prev_hand_value = self._current_hand_value
-        self._current_hand_value = hand_value
+        self._prev_hand_value = current
+        self._current_hand_value = position
         
-        return Hand.get_hand(hand_value)
+        return position
     
     def _get_sum(self, hand_value: int) -> int:
         """
-        Calculate the sum of frequencies for a given hand value.
+        Get the sum of frequencies for a given hand value.
         
         Args:
             hand_value (int): The hand value to get sum for
@@ -82,7 +165,7 @@ class ProbStrategy(Strategy):
         Returns:
             int: Sum of all frequencies for the given hand value
         """
-        return sum(self._history[hand_value])
+        return self._totals[hand_value]
     
     def study(self, win: bool) -> None:
         """
@@ -90,29 +173,42 @@ class ProbStrategy(Strategy):
         
         Strategy for updating:
         - If we won: increase frequency of the winning combination
-        - If we lost: increase frequency of the other two combinations
-          (the hands that would have beaten our opponent)
+        - If we lost: increase frequency of all the other combinations
+          (with 3 hands, the two hands that would have beaten our opponent)
         
         Args:
             win (bool): True if we won the last game, False if we lost
         """
+        row = self._prev_hand_value
         if win:
             # Reinforce the winning combination
-            self._history[self._prev_hand_value][self._current_hand_value] += 1
+            self._add(row, self._current_hand_value, 1)
+            self._totals[row] += 1
         else:
-            # Reinforce the combinations that would have won
-            # Increase frequency of the two hands that would have beaten the opponent
-            self._history[self._prev_hand_value][(self._current_hand_value + 1) % 3] += 1
-            self._history[self._prev_hand_value][(self._current_hand_value + 2) % 3] += 1
+            # Reinforce the combinations that would have won:
+            # every hand of the row but the current one
+            self._offsets[row] += 1
+            self._add(row, self._current_hand_value, -1)
+            self._totals[row] += self._hand_count - 1
+    
+    def get_hand_count(self) -> int:
+        """
+        Get the number of different hands.
+        
+        Returns:
+            int: Number of hands the strategy chooses from
+        """
+        return self._hand_count
     
     def get_history_matrix(self) -> List[List[int]]:
         """
         Get a copy of the current history matrix.
         
         Returns:
-            List[List[int]]: Copy of the 3x3 history matrix
+            List[List[int]]: Copy of the NxN history matrix
         """
-        return [row[:] for row in self._history]  # Deep copy
+        return [[count + offset for count in row]
+                for row, offset in zip(self._counts, self._offsets)]
     
     def get_probabilities(self, hand_value: int) -> List[float]:
         """
@@ -122,10 +218,11 @@ class ProbStrategy(Strategy):
             hand_value (int): The current hand value
             
         Returns:
-            List[float]: Probabilities for [Rock, Scissors, Paper]
+            List[float]: Probabilities for each hand ([Rock, Scissors, Paper])
         """
         total = self._get_sum(hand_value)
-        return [freq / total for freq in self._history[hand_value]]
+        offset = self._offsets[hand_value]
+        return [(count + offset) / total for count in self._counts[hand_value]]
     
     def __str__(self) -> str:
         """String representation of the strategy."""
@@ -134,7 +231,12 @@ class ProbStrategy(Strategy):
     def print_history(self) -> None:
         """Print the current history matrix in a readable format."""
         print("History Matrix (frequency of hand transitions):")
+        history = self.get_history_matrix()
+        if self._hand_count != 3:
+            for i, row in enumerate(history):
+                print(f"    {i:3d}: " + " ".join(f"{count:5d}" for count in row))
+            return
         print("    From\\To  Rock  Scissors  Paper")
         hand_names = ["Rock    ", "Scissors", "Paper   "]
-        for i, row in enumerate(self._history):
+        for i, row in enumerate(history):
             print(f"    {hand_names[i]}  {row[0]:4d}  {row[1]:8d}  {row[2]:5d}")
@@ -0,0 +1,116 @@
+"""
+Benchmark for the Composite file tree
+
+Builds a generated tree (default: about 1M entries) and measures:
+- path lookup with resolve() (name index) vs. scanning each directory's
+  entries the way find() used to
+- lazy walk() and glob() over the whole tree
+- root size queries (cached aggregates) vs. a full recursive walk
+
+Usage:
+    python3 benchmark.py [entries]
+"""
+
+import random
+import sys
+import time
+
+from directory import Directory
+from file import File
+
+
+def build_tree(total_entries: int, fanout: int = 100):
+    """
+    Build root -> fanout dirs -> fanout subdirs -> files, about total_entries in all.
+
+    Returns:
+        (Directory, list): The root and the paths of all files
+    """
+    files_per_dir = max(1, total_entries // (fanout * fanout))
+    root = Directory("root")
+    paths = []
+    for i in range(fanout):
+        top = Directory(f"dir{i}")
+        root.add(top)
+        for j in range(fanout):
+            sub = Directory(f"sub{j}")
+            top.add(sub)
+            for k in range(files_per_dir):
+                name = f"file{k}.txt"
+                sub.add(File(name, k))
+                paths.append(f"/dir{i}/sub{j}/{name}")
+    return root, paths
+
+
+def linear_resolve(root: Directory, path: str):
+    """Path lookup by scanning entries, as find() did before the name index."""
+    entry = root
+    for name in path.split("/"):
+        if not name:
+            continue
+        for child in entry:
+            if child.get_name() == name:
+                entry = child
+                break
+        else:
+            return None
+    return entry
+
+
+def recursive_size(directory: Directory) -> int:
+    """Total size by walking every descendant, as get_size() did before caching."""
+    total = 0
+    for entry in directory:
+        if isinstance(entry, Directory):
+            total += recursive_size(entry)
+        else:
+            total += entry.get_size()
+    return total
+
+
+def timed(label: str, function, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed / repeat * 1000:10.3f} ms")
+    return result
+
+
+def main():
+    total_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    start = time.perf_counter()
+    root, paths = build_tree(total_entries)
+    elapsed = time.perf_counter() - start
+    print(f"Built tree with {root.get_total_files()} files and "
+          f"{root.get_total_directories()} directories in {elapsed:.2f} s")
+
+    lookups = random.Random(0).sample(paths, 1000)
+
+    print("\nPath lookup (1000 random paths):")
+    timed("resolve() with name index",
+          lambda: [root.resolve(path) for path in lookups])
+    timed("scan entries per component",
+          lambda: [linear_resolve(root, path) for path in lookups])
+
+    print("\nTraversal:")
+    count = timed("walk() over all entries", lambda: sum(1 for _ in root.walk()))
+    print(f"  ({count} entries)")
+    timed("glob('dir1*/sub?/file1.txt')",
+          lambda: list(root.glob("dir1*/sub?/file1.txt")))
+    timed("glob('**/file0.txt')", lambda: list(root.glob("**/file0.txt")))
+
+    print("\nRoot size query:")
+    cached = timed("get_size() (cached aggregates)", root.get_size, repeat=1000)
+    walked = timed("recursive walk", lambda: recursive_size(root))
+    assert cached == walked
+
+    print("\nMutation (set_size on 1000 files, O(depth) each):")
+    files = [root.resolve(path) for path in lookups]
+    timed("File.set_size()", lambda: [f.set_size(f.get_size() + 1) for f in files])
+    assert root.get_size() == recursive_size(root)
+
+
+if __name__ == "__main__":
+    main()
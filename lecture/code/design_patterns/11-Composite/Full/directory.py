@@ -5,12 +5,27 @@ This class represents a composite node in the Composite pattern.
 A directory can contain other entries (files or other directories).
 
 This is a "Composite" in the Composite pattern.
+
+Each directory caches the totals of its subtree (size, number of files,
+number of directories). The caches are updated incrementally along the path
+to the root whenever an entry is added or removed or a file changes size, so
+get_size() and get_total_files() are O(1) and mutations are O(depth).
+
+Each directory also keeps a name -> entry index, so find() is O(1) and
+resolve("/usr/youngjin/diary.html") is O(depth). walk() and glob() are
+generators that visit the tree lazily.
 """
 
-from typing import List, Iterator, Optional
+from fnmatch import fnmatchcase
+from typing import Dict, List, Iterator, Optional, Tuple
 from entry import Entry
 
 
+def _has_magic(pattern: str) -> bool:
+    """Check whether a glob pattern component contains wildcards."""
+    return any(c in pattern for c in "*?[")
+
+
 class Directory(Entry):
     """
     Concrete implementation of Entry representing a directory.
@@ -28,7 +43,17 @@ class Directory(Entry):
             name (str): The name of the directory
         """
         self._name = name
-        self._entries: List[Entry] = []
+        self._parent = None
+        # id(entry) -> entry, in insertion order (O(1) add and remove)
+        self._entries: Dict[int, Entry] = {}
+        # name -> first entry with that name, kept in sync by add/remove
+        self._index: Dict[str, Entry] = {}
+        # name -> number of further entries with an already indexed name
+        self._shadowed: Dict[str, int] = {}
+        # cached totals of the whole subtree
+        self._size = 0
+        self._file_count = 0
+        self._directory_count = 0
     
     def get_name(self) -> str:
         """
@@ -43,16 +68,38 @@ class Directory(Entry):
         """
         Get the total size of this directory.
         
-        The size is calculated as the sum of all contained entries' sizes.
-        This demonstrates the Composite pattern's recursive behavior.
+        The size is the sum of all contained entries' sizes. It is cached
+        and kept up to date by add/remove and File.set_size, so this is O(1).
         
         Returns:
             int: The total size of all contained entries in bytes
         """
-        total_size = 0
-        for entry in self._entries:
-            total_size += entry.get_size()
-        return total_size
+        return self._size
+    
+    def _get_aggregates(self) -> Tuple[int, int, int]:
+        """
+        Get what this directory adds to the totals of its parents.
+        
+        Returns:
+            Tuple[int, int, int]: (size, number of files, number of directories)
+        """
+        return self._size, self._file_count, self._directory_count + 1
+    
+    def _update_aggregates(self, size: int, files: int, directories: int) -> None:
+        """
+        Add deltas to the cached totals of this directory and all its parents.
+        
+        Args:
+            size (int): Change in total size
+            files (int): Change in number of files
+            directories (int): Change in number of directories
+        """
+        directory = self
+        while directory is not None:
+            directory._size += size
+            directory._file_count += files
+            directory._directory_count += directories
+            directory = directory._parent
     
     def _print_list(self, prefix: str) -> None:
         """
@@ -68,7 +115,7 @@ class Directory(Entry):
         print(f"{prefix}/{self}")
         
         # Recursively print all contained entries
-        for entry in self._entries:
+        for entry in self._entries.values():
             entry._print_list(f"{prefix}/{self._name}")
     
     def add(self, entry: Entry) -> 'Directory':
@@ -78,6 +125,9 @@ class Directory(Entry):
         This method allows building the composite structure by adding
         child components. Returns self to allow method chaining.
         
+        An entry has exactly one parent: adding an entry that is already
+        in another directory moves it here.
+        
         Args:
             entry (Entry): The entry (file or directory) to add
             
@@ -86,13 +136,65 @@ class Directory(Entry):
             
         Raises:
             TypeError: If entry is not an Entry instance
+            ValueError: If entry is this directory or one of its parents
         """
         if not isinstance(entry, Entry):
             raise TypeError("Can only add Entry instances to directory")
         
-        self._entries.append(entry)
+        if entry._parent is self:
+            return self
+        
+        # A directory cannot be added below itself
+        ancestor = self
+        while ancestor is not None:
+            if ancestor is entry:
+                raise ValueError("Cannot add a directory to itself or its subdirectory")
+            ancestor = ancestor._parent
+        
+        if entry._parent is not None:
+            entry._parent._detach(entry)
+        
+        self._entries[id(entry)] = entry
+        name = entry.get_name()
+        if name in self._index:
+            self._shadowed[name] = self._shadowed.get(name, 0) + 1
+        else:
+            self._index[name] = entry
+        entry._parent = self
+        self._update_aggregates(*entry._get_aggregates())
         return self
     
+    def _detach(self, entry: Entry) -> None:
+        """
+        Remove a child entry and subtract its totals (O(depth)).
+        
+        Args:
+            entry (Entry): A direct child of this directory
+        """
+        del self._entries[id(entry)]
+        name = entry.get_name()
+        if self._index.get(name) is entry:
+            if name in self._shadowed:
+                # index the next entry with the same name, in insertion order
+                self._index[name] = next(e for e in self._entries.values()
+                                         if e.get_name() == name)
+                self._unshadow(name)
+            else:
+                del self._index[name]
+        else:
+            self._unshadow(name)
+        entry._parent = None
+        size, files, directories = entry._get_aggregates()
+        self._update_aggregates(-size, -files, -directories)
+    
+    def _unshadow(self, name: str) -> None:
+        """Decrement the count of further entries with the given name."""
+        count = self._shadowed[name] - 1
+        if count:
+            self._shadowed[name] = count
+        else:
+            del self._shadowed[name]
+    
     def remove(self, entry: Entry) -> bool:
         """
         Remove an entry from this directory.
@@ -103,11 +205,13 @@ class Directory(Entry):
         Returns:
             bool: True if the entry was found and removed, False otherwise
         """
-        try:
-            self._entries.remove(entry)
-            return True
-        except ValueError:
-            return False
+        if getattr(entry, "_parent", None) is not self:
+            # Not this object, but maybe an equal one (e.g. same file name and size)
+            entry = next((e for e in self._entries.values() if e == entry), None)
+            if entry is None:
+                return False
+        self._detach(entry)
+        return True
     
     def remove_by_name(self, name: str) -> bool:
         """
@@ -119,15 +223,17 @@ class Directory(Entry):
         Returns:
             bool: True if an entry with the name was found and removed
         """
-        for entry in self._entries:
-            if entry.get_name() == name:
-                self._entries.remove(entry)
-                return True
-        return False
+        entry = self._index.get(name)
+        if entry is None:
+            return False
+        self._detach(entry)
+        return True
     
     def find(self, name: str) -> Optional[Entry]:
         """
-        Find an entry by name in this directory.
+        Find an entry by name in this directory (O(1) using the name index).
+        
+        If several entries have the same name, the first one added is found.
         
         Args:
             name (str): The name of the entry to find
@@ -135,10 +241,124 @@ class Directory(Entry):
         Returns:
             Optional[Entry]: The entry if found, None otherwise
         """
-        for entry in self._entries:
-            if entry.get_name() == name:
-                return entry
-        return None
+        return self._index.get(name)
+    
+    def resolve(self, path: str) -> Optional[Entry]:
+        """
+        Find an entry by path, relative to this directory.
+        
+        Components are looked up in the name index one by one, so the cost
+        is O(depth) no matter how many entries the tree holds. "." and ".."
+        are supported; a leading "/" is ignored.
+        
+        Args:
+            path (str): A path such as "/usr/youngjin/diary.html"
+            
+        Returns:
+            Optional[Entry]: The entry if found, None otherwise
+        """
+        entry: Entry = self
+        for name in path.split("/"):
+            if not name or name == ".":
+                continue
+            if not isinstance(entry, Directory):
+                return None
+            if name == "..":
+                entry = entry._parent if entry._parent is not None else entry
+            else:
+                entry = entry._index.get(name)
+                if entry is None:
+                    return None
+        return entry
+    
+    def walk(self) -> Iterator[Entry]:
+        """
+        Yield every entry below this directory, depth-first.
+        
+        Entries are produced lazily (no intermediate lists), and the walk
+        uses an explicit stack, so very deep trees do not hit the recursion
+        limit. Each directory is yielded before its contents.
+        
+        Returns:
+            Iterator[Entry]: All entries of the subtree, this directory excluded
+        """
+        stack = [iter(self._entries.values())]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+            yield entry
+            if isinstance(entry, Directory):
+                stack.append(iter(entry._entries.values()))
+    
+    def glob(self, pattern: str) -> Iterator[Entry]:
+        """
+        Yield the entries below this directory that match a glob pattern.
+        
+        Each path component may use the fnmatch wildcards *, ? and [...];
+        a "**" component matches any number of directories. Components
+        without wildcards are looked up in the name index.
+        
+        Examples:
+            root.glob("usr/*/*.html")
+            root.glob("**/*.py")
+        
+        Args:
+            pattern (str): Slash-separated pattern, relative to this directory
+            
+        Returns:
+            Iterator[Entry]: The matching entries
+        """
+        parts = []
+        for part in pattern.split("/"):
+            # "**/**" matches the same as "**"
+            if part and not (part == "**" and parts and parts[-1] == "**"):
+                parts.append(part)
+        if not parts:
+            return iter(())
+        if parts.count("**") > 1:
+            # e.g. "**/*/**/x": an entry can be reached by several matches
+            return self._unique(self._glob(parts, 0))
+        return self._glob(parts, 0)
+    
+    @staticmethod
+    def _unique(entries: Iterator[Entry]) -> Iterator[Entry]:
+        """Yield each entry once (by identity), in first-match order."""
+        seen = set()
+        for entry in entries:
+            if id(entry) not in seen:
+                seen.add(id(entry))
+                yield entry
+    
+    def _glob(self, parts: List[str], i: int) -> Iterator[Entry]:
+        """Match parts[i:] against the contents of this directory."""
+        part = parts[i]
+        last = i == len(parts) - 1
+        if part == "**":
+            if last:
+                yield from self.walk()
+                return
+            # "**" matches zero directories here, or one more level below
+            yield from self._glob(parts, i + 1)
+            for entry in self._entries.values():
+                if isinstance(entry, Directory):
+                    yield from entry._glob(parts, i)
+        elif _has_magic(part):
+            for entry in self._entries.values():
+                if fnmatchcase(entry.get_name(), part):
+                    if last:
+                        yield entry
+                    elif isinstance(entry, Directory):
+                        yield from entry._glob(parts, i + 1)
+        else:
+            entry = self._index.get(part)
+            if entry is None:
+                return
+            if last:
+                yield entry
+            elif isinstance(entry, Directory):
+                yield from entry._glob(parts, i + 1)
     
     def get_entries(self) -> List[Entry]:
         """
@@ -147,7 +367,7 @@ class Directory(Entry):
         Returns:
             List[Entry]: List of all contained entries
         """
-        return self._entries.copy()
+        return list(self._entries.values())
     
     def get_files(self) -> List['File']:
         """
@@ -157,7 +377,7 @@ class Directory(Entry):
             List[File]: List of all files in this directory
         """
         from file import File  # Import here to avoid circular imports
-        return [entry for entry in self._entries if isinstance(entry, File)]
+        return [entry for entry in self._entries.values() if isinstance(entry, File)]
     
     def get_directories(self) -> List['Directory']:
         """
@@ -166,26 +386,27 @@ class Directory(Entry):
         Returns:
             List[Directory]: List of all subdirectories
         """
-        return [entry for entry in self._entries if isinstance(entry, Directory)]
+        return [entry for entry in self._entries.values() if isinstance(entry, Directory)]
     
     def get_total_files(self) -> int:
         """
         Get the total number of files in this directory and all subdirectories.
         
-        This demonstrates recursive traversal of the composite structure.
+        The count is cached like the size, so this is O(1).
         
         Returns:
             int: Total number of files in the entire subtree
         """
-        from file import File  # Import here to avoid circular imports
+        return self._file_count
+    
+    def get_total_directories(self) -> int:
+        """
+        Get the total number of subdirectories in this directory's subtree.
         
-        count = 0
-        for entry in self._entries:
-            if isinstance(entry, File):
-                count += 1
-            elif isinstance(entry, Directory):
-                count += entry.get_total_files()
-        return count
+        Returns:
+            int: Total number of directories below this one
+        """
+        return self._directory_count
     
     def is_empty(self) -> bool:
         """
@@ -212,7 +433,7 @@ class Directory(Entry):
         Returns:
             Iterator[Entry]: Iterator over contained entries
         """
-        return iter(self._entries)
+        return iter(self._entries.values())
     
     def __contains__(self, entry: Entry) -> bool:
         """
@@ -224,7 +445,9 @@ class Directory(Entry):
         Returns:
             bool: True if the entry is in this directory
         """
-        return entry in self._entries
+        if getattr(entry, "_parent", None) is self:
+            return True
+        return entry in self._entries.values()
     
     def __eq__(self, other) -> bool:
         """
@@ -239,7 +462,7 @@ class Directory(Entry):
         if not isinstance(other, Directory):
             return False
         return (self._name == other._name and 
-                self._entries == other._entries)
+                list(self._entries.values()) == list(other._entries.values()))
     
     def __hash__(self) -> int:
         """
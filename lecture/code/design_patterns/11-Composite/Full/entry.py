@@ -9,6 +9,7 @@ This is the "Component" in the Composite pattern.
 """
 
 from abc import ABC, abstractmethod
+from typing import Optional, Tuple
 
 
 class Entry(ABC):
@@ -18,8 +19,13 @@ class Entry(ABC):
     This class defines the common interface for both files and directories
     in a file system hierarchy. The Composite pattern allows clients to
     treat individual objects (files) and compositions (directories) uniformly.
+    
+    Every entry knows the directory that contains it (its parent), so that
+    directories can keep cached totals up to date when an entry changes.
     """
     
+    _parent: Optional['Directory'] = None
+    
     @abstractmethod
     def get_name(self) -> str:
         """
@@ -43,6 +49,43 @@ class Entry(ABC):
         """
         pass
     
+    def get_parent(self) -> Optional['Directory']:
+        """
+        Get the directory that contains this entry.
+        
+        Returns:
+            Optional[Directory]: The parent directory, or None for a root
+        """
+        return self._parent
+    
+    def get_path(self) -> str:
+        """
+        Get the path of this entry from the root of its tree.
+        
+        The root itself is "/", so the result can be passed to
+        Directory.resolve() on the root.
+        
+        Returns:
+            str: A path such as "/usr/youngjin/diary.html"
+        """
+        names = []
+        entry = self
+        while entry._parent is not None:
+            names.append(entry.get_name())
+            entry = entry._parent
+        return "/" + "/".join(reversed(names))
+    
+    def _get_aggregates(self) -> Tuple[int, int, int]:
+        """
+        Get what this entry adds to the totals of its parent directories.
+        
+        The default describes a leaf: its own size and one file.
+        
+        Returns:
+            Tuple[int, int, int]: (size, number of files, number of directories)
+        """
+        return self.get_size(), 1, 0
+    
     def print_list(self, prefix: str = "") -> None:
         """
         Print the directory listing.
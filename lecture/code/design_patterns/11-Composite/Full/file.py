@@ -35,6 +35,7 @@ class File(Entry):
         
         self._name = name
         self._size = size
+        self._parent = None
     
     def get_name(self) -> str:
         """
@@ -69,6 +70,9 @@ class File(Entry):
         """
         Update the size of this file.
         
+        The cached totals of all parent directories are updated along
+        the path to the root (O(depth)).
+        
         Args:
             size (int): The new size in bytes
             
@@ -77,7 +81,10 @@ class File(Entry):
         """
         if size < 0:
             raise ValueError("File size cannot be negative")
+        delta = size - self._size
         self._size = size
+        if self._parent is not None and delta:
+            self._parent._update_aggregates(delta, 0, 0)
     
     def get_extension(self) -> str:
         """
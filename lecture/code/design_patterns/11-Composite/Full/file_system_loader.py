@@ -0,0 +1,370 @@
+"""
+FileSystemLoader class for Composite Pattern Example
+
+Builds a Directory/File tree from a real directory on disk instead of a
+hand-coded one. Directories are read with os.scandir, and subdirectories are
+fanned out across a thread pool: each worker streams the entries of one
+directory straight into a fresh Directory, and the main thread links the
+finished directories into the tree (so the cached totals are only ever
+updated from one thread).
+
+A scanned tree can be saved to a compact binary snapshot and loaded back
+through mmap. load() reuses the snapshot when nothing on disk has changed
+since: every directory must have the same modification time (so no entry
+was added, removed or renamed) and every file the same size and
+modification time (so none was rewritten in place). Checking costs one
+stat per entry but no directory reads, thread pool or sorting of results.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from typing import Iterable, Optional
+
+from directory import Directory
+from file import File
+
+
+SNAPSHOT_MAGIC = b"CPST"
+SNAPSHOT_VERSION = 2
+
+# magic, version, length of the JSON settings block
+_HEADER = struct.Struct("<4sHI")
+# file record: kind, name length, size, mtime in ns
+_FILE_RECORD = struct.Struct("<BHQq")
+# directory record: kind, name length, number of children, mtime in ns
+_DIR_RECORD = struct.Struct("<BHIq")
+_FILE, _DIRECTORY = 0, 1
+
+
+class DiskDirectory(Directory):
+    """
+    Directory scanned from disk.
+
+    Remembers the modification time of the directory on disk, which is
+    what a snapshot uses to tell whether the directory has changed.
+    """
+
+    def __init__(self, name: str, mtime_ns: int = 0):
+        """
+        Initialize a scanned directory.
+
+        Args:
+            name (str): The name of the directory
+            mtime_ns (int): Modification time on disk in nanoseconds
+        """
+        super().__init__(name)
+        self._mtime_ns = mtime_ns
+
+    def get_mtime_ns(self) -> int:
+        """
+        Get the modification time recorded when the directory was scanned.
+
+        Returns:
+            int: Modification time in nanoseconds
+        """
+        return self._mtime_ns
+
+
+class DiskFile(File):
+    """
+    File scanned from disk.
+
+    Remembers the modification time of the file on disk, which together
+    with its size is what a snapshot uses to tell whether it has changed.
+    """
+
+    def __init__(self, name: str, size: int, mtime_ns: int = 0):
+        """
+        Initialize a scanned file.
+
+        Args:
+            name (str): The name of the file
+            size (int): The size of the file in bytes
+            mtime_ns (int): Modification time on disk in nanoseconds
+        """
+        super().__init__(name, size)
+        self._mtime_ns = mtime_ns
+
+    def get_mtime_ns(self) -> int:
+        """
+        Get the modification time recorded when the file was scanned.
+
+        Returns:
+            int: Modification time in nanoseconds
+        """
+        return self._mtime_ns
+
+
+class FileSystemLoader:
+    """
+    Loads Composite trees from the file system, with optional snapshots.
+
+    Usage:
+        loader = FileSystemLoader(ignore=["__pycache__", "*.pyc"])
+        root = loader.load("/some/path", snapshot_path="tree.snapshot")
+    """
+
+    def __init__(self, max_workers: int = None,
+                 max_depth: Optional[int] = None,
+                 ignore: Iterable[str] = ()):
+        """
+        Initialize the loader.
+
+        Args:
+            max_workers (int, optional): Number of scanning threads
+            max_depth (int, optional): Deepest level to descend into; 0 reads
+                                       only the top directory. Directories
+                                       below the limit are kept, but empty.
+            ignore (Iterable[str]): fnmatch patterns of names to skip
+        """
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth cannot be negative")
+        self._max_workers = max_workers
+        self._max_depth = max_depth
+        self._ignore = tuple(ignore)
+
+    def _is_ignored(self, name: str) -> bool:
+        """Check a file or directory name against the ignore patterns."""
+        return any(fnmatchcase(name, pattern) for pattern in self._ignore)
+
+    def _scan_directory(self, path: str, name: str, depth: int):
+        """
+        Read one directory into a new DiskDirectory (runs on a worker).
+
+        Files are added while the directory is being read; subdirectories
+        are only returned, for the caller to schedule.
+
+        Returns:
+            (DiskDirectory, list): The directory and (path, name, depth)
+                                   of the subdirectories to read next
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        directory = DiskDirectory(name, mtime_ns)
+        subdirectories = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if self._is_ignored(entry.name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append((entry.path, entry.name, depth + 1))
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                            directory.add(DiskFile(entry.name, stat.st_size, stat.st_mtime_ns))
+                    except OSError:
+                        continue  # vanished or unreadable entry
+        except OSError:
+            pass  # unreadable directory stays empty
+        return directory, subdirectories
+
+    def scan(self, path: str) -> DiskDirectory:
+        """
+        Build a tree from a directory on disk.
+
+        Args:
+            path (str): The directory to read
+
+        Returns:
+            DiskDirectory: The root of the tree
+        """
+        path = os.path.abspath(path)
+        root_name = os.path.basename(path) or path
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            root_future = pool.submit(self._scan_directory, path, root_name, 0)
+            pending = deque([(None, root_future)])
+            root = None
+            # Link directories in submission order, so the tree is the same
+            # on every run no matter which worker finishes first
+            while pending:
+                parent, future = pending.popleft()
+                directory, subdirectories = future.result()
+                if parent is None:
+                    root = directory
+                else:
+                    parent.add(directory)
+                for sub_path, sub_name, depth in subdirectories:
+                    if self._max_depth is not None and depth > self._max_depth:
+                        # kept in the tree, but not read (mtime 0)
+                        directory.add(DiskDirectory(sub_name))
+                    else:
+                        pending.append((directory, pool.submit(
+                            self._scan_directory, sub_path, sub_name, depth)))
+        return root
+
+    def _settings(self, path: str) -> bytes:
+        """Encode what a snapshot depends on besides the tree itself."""
+        return json.dumps({"path": os.path.abspath(path),
+                           "max_depth": self._max_depth,
+                           "ignore": list(self._ignore)}).encode("utf-8")
+
+    def save_snapshot(self, root: Directory, path: str, snapshot_path: str) -> None:
+        """
+        Write a tree to a binary snapshot file.
+
+        Records are written depth-first to a new temporary file next to
+        snapshot_path, which is synced to disk and then renamed, so a reader
+        (or a crash) never leaves a partial snapshot behind.
+
+        Args:
+            root (Directory): The tree to save
+            path (str): The directory on disk the tree was scanned from
+            snapshot_path (str): Where to write the snapshot
+        """
+        settings = self._settings(path)
+        directory, name = os.path.split(os.path.abspath(snapshot_path))
+        with tempfile.NamedTemporaryFile(dir=directory, prefix=name + ".",
+                                         suffix=".tmp", delete=False) as out:
+            temp_path = out.name
+            try:
+                self._write_records(out, root, settings)
+                out.flush()
+                os.fsync(out.fileno())
+            except BaseException:
+                out.close()
+                os.remove(temp_path)
+                raise
+        os.replace(temp_path, snapshot_path)
+
+    @staticmethod
+    def _write_records(out, root: Directory, settings: bytes) -> None:
+        """Write the header and the records of a tree, depth-first."""
+        out.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(settings)))
+        out.write(settings)
+        stack = [root]
+        while stack:
+            entry = stack.pop()
+            name = entry.get_name().encode("utf-8", "surrogateescape")
+            if isinstance(entry, Directory):
+                children = entry.get_entries()
+                mtime_ns = entry.get_mtime_ns() if isinstance(entry, DiskDirectory) else 0
+                out.write(_DIR_RECORD.pack(_DIRECTORY, len(name), len(children), mtime_ns))
+                out.write(name)
+                stack.extend(reversed(children))
+            else:
+                mtime_ns = entry.get_mtime_ns() if isinstance(entry, DiskFile) else 0
+                out.write(_FILE_RECORD.pack(_FILE, len(name), entry.get_size(), mtime_ns))
+                out.write(name)
+
+    def load_snapshot(self, snapshot_path: str, path: str = None) -> Optional[DiskDirectory]:
+        """
+        Load a tree from a snapshot file through mmap.
+
+        If path is given, the snapshot is only used when it was made from
+        that directory with the same settings and no directory or file has
+        changed on disk since; otherwise None is returned.
+
+        Args:
+            snapshot_path (str): The snapshot file
+            path (str, optional): The directory on disk to validate against
+
+        Returns:
+            Optional[DiskDirectory]: The tree, or None if the snapshot is stale
+        """
+        with open(snapshot_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, version, settings_length = _HEADER.unpack_from(data, 0)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    return None
+                offset = _HEADER.size
+                settings = data[offset:offset + settings_length]
+                offset += settings_length
+                if path is not None:
+                    if settings != self._settings(path):
+                        return None
+                    base = os.path.dirname(os.path.abspath(path))
+                else:
+                    base = None
+                return self._read_records(data, offset, base)
+
+    def _read_records(self, data, offset: int, base: Optional[str]):
+        """Rebuild the tree from the records; validate them against disk if base is set."""
+        root = None
+        # (directory, its path on disk, children still to read)
+        stack = []
+        while True:
+            kind = data[offset]
+            if kind == _DIRECTORY:
+                _, name_length, children, mtime_ns = _DIR_RECORD.unpack_from(data, offset)
+                offset += _DIR_RECORD.size
+            else:
+                _, name_length, size, mtime_ns = _FILE_RECORD.unpack_from(data, offset)
+                offset += _FILE_RECORD.size
+            name = data[offset:offset + name_length].decode("utf-8", "surrogateescape")
+            offset += name_length
+
+            if stack:
+                parent, parent_path, remaining = stack[-1]
+                stack[-1] = (parent, parent_path, remaining - 1)
+            else:
+                parent, parent_path = None, base
+
+            entry_path = None
+            if base is not None:
+                entry_path = os.path.join(parent_path, name)
+                # mtime 0: not read from disk (e.g. below max_depth), nothing to check
+                if mtime_ns:
+                    try:
+                        # like scan(): a symlink to a file is recorded as itself
+                        if kind == _DIRECTORY:
+                            stat = os.stat(entry_path)
+                        else:
+                            stat = os.lstat(entry_path)
+                    except OSError:
+                        return None
+                    if stat.st_mtime_ns != mtime_ns or (
+                            kind != _DIRECTORY and stat.st_size != size):
+                        return None
+
+            if kind == _DIRECTORY:
+                entry = DiskDirectory(name, mtime_ns)
+                if children:
+                    stack.append((entry, entry_path, children))
+            else:
+                entry = DiskFile(name, size, mtime_ns)
+
+            if parent is None:
+                root = entry
+            else:
+                parent.add(entry)
+            # close the directories whose children have all been read
+            while stack and stack[-1][2] == 0:
+                stack.pop()
+            if not stack:
+                return root
+
+    def load(self, path: str, snapshot_path: str = None) -> DiskDirectory:
+        """
+        Load a directory tree, reusing a snapshot when it is still valid.
+
+        Without snapshot_path this is the same as scan(). With it, a valid
+        snapshot is loaded; otherwise the directory is scanned and the
+        snapshot is rewritten.
+
+        Args:
+            path (str): The directory to read
+            snapshot_path (str, optional): Snapshot file to use and update
+
+        Returns:
+            DiskDirectory: The root of the tree
+        """
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            try:
+                root = self.load_snapshot(snapshot_path, path)
+            except (OSError, ValueError, struct.error, IndexError):
+                root = None  # unreadable or truncated snapshot
+            if root is not None:
+                return root
+        root = self.scan(path)
+        if snapshot_path is not None:
+            self.save_snapshot(root, path, snapshot_path)
+        return root
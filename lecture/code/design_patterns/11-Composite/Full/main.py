@@ -20,6 +20,10 @@ The file system metaphor perfectly illustrates this pattern:
 from entry import Entry
 from file import File
 from directory import Directory
+from file_system_loader import FileSystemLoader
+import os
+import tempfile
+import time
 
 
 def create_file_system() -> Directory:
@@ -250,6 +254,32 @@ def create_complex_hierarchy() -> Directory:
     return project
 
 
+def demonstrate_file_system_loader() -> None:
+    """Demonstrate building the composite tree from a real directory."""
+    print("=== Loading a Real Directory ===")
+    
+    # Read the directory of this example, skipping Python caches
+    path = os.path.dirname(os.path.abspath(__file__))
+    loader = FileSystemLoader(max_depth=2, ignore=["__pycache__", "*.pyc"])
+    snapshot_path = os.path.join(tempfile.gettempdir(), "composite_example.snapshot")
+    
+    start_time = time.perf_counter()
+    tree = loader.scan(path)
+    scan_time = time.perf_counter() - start_time
+    tree.print_list()
+    print(f"Scanned {tree.get_total_files()} files in {scan_time * 1000:.2f} ms")
+    
+    # Second load reuses the snapshot because nothing changed on disk
+    loader.save_snapshot(tree, path, snapshot_path)
+    start_time = time.perf_counter()
+    reloaded = loader.load(path, snapshot_path)
+    load_time = time.perf_counter() - start_time
+    print(f"Reloaded {reloaded.get_total_files()} files from snapshot in {load_time * 1000:.2f} ms")
+    os.remove(snapshot_path)
+    
+    print()
+
+
 def main():
     """Main function demonstrating the Composite pattern."""
     
@@ -287,6 +317,9 @@ def main():
     project.print_list()
     print()
     
+    # Build the tree from the file system instead of by hand
+    demonstrate_file_system_loader()
+    
     print("="*60)
     print("Pattern Analysis:")
     print("="*60)
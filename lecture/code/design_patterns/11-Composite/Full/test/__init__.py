@@ -0,0 +1 @@
+# Test package initialization for the Composite pattern example
@@ -0,0 +1,56 @@
+"""
+Unit tests for Directory.glob
+Tests wildcard, literal and "**" pattern components
+"""
+import os
+import sys
+import unittest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from directory import Directory
+from file import File
+
+
+class TestDirectoryGlob(unittest.TestCase):
+    """Test cases for Directory.glob"""
+
+    def setUp(self):
+        """Build root/{x.txt, a/{x.txt, b/{x.txt, y.py}}}"""
+        self.root = Directory("root")
+        self.a = Directory("a")
+        self.b = Directory("b")
+        self.root.add(File("x.txt", 1))
+        self.root.add(self.a)
+        self.a.add(File("x.txt", 2))
+        self.a.add(self.b)
+        self.b.add(File("x.txt", 3))
+        self.b.add(File("y.py", 4))
+
+    def sizes(self, pattern):
+        return sorted(entry.get_size() for entry in self.root.glob(pattern))
+
+    def test_literal_and_wildcard_components(self):
+        """Test patterns without "**" """
+        self.assertEqual(self.sizes("a/b/x.txt"), [3])
+        self.assertEqual(self.sizes("*/x.txt"), [2])
+        self.assertEqual(self.sizes("a/*/*.py"), [4])
+        self.assertEqual(self.sizes("a/missing/x.txt"), [])
+
+    def test_double_star_matches_any_depth(self):
+        """Test that "**" matches zero or more directories"""
+        self.assertEqual(self.sizes("**/x.txt"), [1, 2, 3])
+        self.assertEqual(self.sizes("a/**/x.txt"), [2, 3])
+        self.assertEqual(self.sizes("**/b/*"), [3, 4])
+
+    def test_repeated_double_star_yields_each_entry_once(self):
+        """Test that repeated or adjacent "**" do not yield duplicates"""
+        self.assertEqual(self.sizes("**/**/x.txt"), [1, 2, 3])
+        self.assertEqual(self.sizes("**/**/**/y.py"), [4])
+        self.assertEqual(self.sizes("**/*/**/x.txt"), [2, 3])
+        self.assertEqual(self.sizes("**/a/**/**/x.txt"), [2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
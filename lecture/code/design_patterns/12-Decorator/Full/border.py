@@ -34,6 +34,70 @@ class Border(Display, ABC):
             raise TypeError("Border can only decorate Display objects")
         
         self._display = display
+        # (columns, rows), valid while Display._modification_count == _size_count
+        self._size = (0, 0)
+        self._size_count = -1
+    
+    def _get_size(self) -> tuple[int, int]:
+        """
+        Get (columns, rows) of this border, cached until a display changes.
+        
+        The sizes of the decorators below are computed from the innermost one
+        outward in a loop, so deep decorator stacks don't recurse, and each
+        layer is only computed once.
+        
+        Returns:
+            tuple[int, int]: (columns, rows)
+        """
+        count = Display._modification_count
+        if self._size_count == count:
+            return self._size
+        stale = []
+        current = self
+        while isinstance(current, Border) and current._size_count != count:
+            stale.append(current)
+            current = current._display
+        if isinstance(current, Border):
+            columns, rows = current._size
+        else:
+            columns, rows = current.get_columns(), current.get_rows()
+        for border in reversed(stale):
+            columns, rows = border._grow(columns, rows)
+            border._size = (columns, rows)
+            border._size_count = count
+        return self._size
+    
+    def _grow(self, columns: int, rows: int) -> tuple[int, int]:
+        """
+        Get the size of this border around a display of the given size.
+        
+        Subclasses that use _get_size() override this. The default asks the
+        subclass's own get_columns() and get_rows().
+        
+        Args:
+            columns (int): Width of the wrapped display
+            rows (int): Height of the wrapped display
+            
+        Returns:
+            tuple[int, int]: (columns, rows) of this border
+        """
+        return self.get_columns(), self.get_rows()
+    
+    def get_frame(self, inner_columns: int) -> tuple[str, str, "str | None"]:
+        """
+        Get what this border adds around the wrapped display, for compiling.
+        
+        Args:
+            inner_columns (int): Width of the wrapped display
+            
+        Returns:
+            tuple: (left, right, line) - the text added on each side of every
+                   row, and the top and bottom line (None if there is none)
+                   
+        Raises:
+            NotImplementedError: If the border cannot be compiled
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot be compiled")
     
     def get_wrapped_display(self) -> Display:
         """
@@ -70,8 +134,10 @@ class Border(Display, ABC):
             int: The number of decorator layers
         """
         depth = 1  # This decorator
-        if isinstance(self._display, Border):
-            depth += self._display.get_decoration_depth()
+        current = self._display
+        while isinstance(current, Border):
+            depth += 1
+            current = current._display
         return depth
     
     def __str__(self) -> str:
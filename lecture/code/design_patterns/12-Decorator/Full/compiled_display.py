@@ -0,0 +1,157 @@
+"""
+CompiledDisplay class for Decorator Pattern Example
+
+This class flattens a chain of border decorators into one table, so that a
+deeply decorated display can be rendered without going through every
+decorator for every row.
+
+Every row of a decorated display is some text from one layer (a row of the
+innermost display, or the top/bottom line of a border) with the sides of
+all the borders outside that layer around it. Compiling walks the chain
+once and stores each row as (prefix, middle, suffix). A row is then a
+single join, and a stack of N borders renders in time linear in the size
+of its output instead of O(N^2) per row.
+
+A compiled display recompiles itself when any display has changed since
+it was compiled (see Display._changed()).
+"""
+
+from typing import List, Tuple
+from border import Border
+from display import Display
+
+
+class CompiledDisplay(Display):
+    """
+    Flattened, read-only view of a decorated display.
+
+    Usage:
+        compiled = CompiledDisplay(FullBorder(SideBorder(StringDisplay("Hi"))))
+        compiled.show()
+    """
+
+    def __init__(self, display: Display):
+        """
+        Compile a display.
+
+        Args:
+            display (Display): The (decorated) display to compile
+
+        Raises:
+            TypeError: If display is not a Display instance
+            NotImplementedError: If a border in the chain cannot be compiled
+        """
+        if not isinstance(display, Display):
+            raise TypeError("CompiledDisplay can only compile Display objects")
+        self._display = display
+        self._rows: List[Tuple[str, str, str]] = []
+        self._columns = 0
+        self._compiled_count = -1
+        self._compile()
+
+    def _compile(self) -> None:
+        """Build the (prefix, middle, suffix) table of the display."""
+        borders = []
+        current = self._display
+        while isinstance(current, Border):
+            borders.append(current)
+            current = current.get_wrapped_display()
+        component = current
+
+        # Frames from the innermost border outward, with the width inside each
+        columns = component.get_columns()
+        frames = []
+        for border in reversed(borders):
+            left, right, line = border.get_frame(columns)
+            frames.append((left, right, line))
+            columns += len(left) + len(right)
+
+        # Prefixes and suffixes from the outermost border inward
+        top = []
+        prefix = suffix = ""
+        for left, right, line in reversed(frames):
+            if line is not None:
+                top.append((prefix, line, suffix))
+            prefix += left
+            suffix = right + suffix
+
+        middle = [(prefix, component.get_row_text(row), suffix)
+                  for row in range(component.get_rows())]
+        self._rows = top + middle + top[::-1]
+        self._columns = columns
+        self._compiled_count = Display._modification_count
+
+    def _get_rows_table(self) -> List[Tuple[str, str, str]]:
+        """Get the row table, recompiling it if a display has changed."""
+        if self._compiled_count != Display._modification_count:
+            self._compile()
+        return self._rows
+
+    def get_columns(self) -> int:
+        """
+        Get the number of columns of the compiled display.
+
+        Returns:
+            int: The width in characters
+        """
+        self._get_rows_table()
+        return self._columns
+
+    def get_rows(self) -> int:
+        """
+        Get the number of rows of the compiled display.
+
+        Returns:
+            int: The height in lines
+        """
+        return len(self._get_rows_table())
+
+    def get_row_text(self, row: int) -> str:
+        """
+        Get the text for a specific row.
+
+        Args:
+            row (int): The row number
+
+        Returns:
+            str: The row text, with all borders
+
+        Raises:
+            IndexError: If row is out of bounds
+        """
+        rows = self._get_rows_table()
+        if row < 0 or row >= len(rows):
+            raise IndexError(f"Row {row} is out of bounds (0-{len(rows)-1})")
+        prefix, middle, suffix = rows[row]
+        return prefix + middle + suffix
+
+    def show(self) -> None:
+        """Display all rows of the content."""
+        print(self.get_all_text())
+
+    def get_all_text(self) -> str:
+        """
+        Get all text as a single string with newlines.
+
+        Returns:
+            str: Complete text content with line breaks
+        """
+        return '\n'.join([''.join(row) for row in self._get_rows_table()])
+
+    def get_compiled_display(self) -> Display:
+        """
+        Get the display that was compiled.
+
+        Returns:
+            Display: The original (decorated) display
+        """
+        return self._display
+
+    def __repr__(self) -> str:
+        """
+        Developer-friendly representation.
+
+        Returns:
+            str: Representation showing the compiled display
+        """
+        return f"CompiledDisplay({repr(self._display)})"
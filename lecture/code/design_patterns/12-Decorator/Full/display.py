@@ -18,8 +18,24 @@ class Display(ABC):
     This class defines the interface for objects that can display text
     in various formats. The Decorator pattern allows new display behaviors
     to be added dynamically by wrapping objects with decorator classes.
+    
+    Decorators cache values computed from the displays they wrap. Every
+    change to any display increments the modification count, and a cached
+    value computed at an older count is recomputed.
     """
     
+    _modification_count = 0
+    
+    @staticmethod
+    def _changed() -> None:
+        """
+        Record that a display has changed.
+        
+        Subclasses with setters that change what they display must call
+        this, so that decorators wrapping them recompute their caches.
+        """
+        Display._modification_count += 1
+    
     @abstractmethod
     def get_columns(self) -> int:
         """
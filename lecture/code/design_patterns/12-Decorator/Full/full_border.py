@@ -39,7 +39,7 @@ class FullBorder(Border):
         Returns:
             int: The width including side borders
         """
-        return 1 + self._display.get_columns() + 1
+        return self._get_size()[0]
     
     def get_rows(self) -> int:
         """
@@ -50,7 +50,23 @@ class FullBorder(Border):
         Returns:
             int: The height including top and bottom borders
         """
-        return 1 + self._display.get_rows() + 1
+        return self._get_size()[1]
+    
+    def _grow(self, columns: int, rows: int) -> tuple[int, int]:
+        """A full border adds one column on each side and a row above and below."""
+        return 1 + columns + 1, 1 + rows + 1
+    
+    def get_frame(self, inner_columns: int) -> tuple[str, str, str]:
+        """
+        Get what this border adds around the wrapped display.
+        
+        Args:
+            inner_columns (int): Width of the wrapped display
+            
+        Returns:
+            tuple: (left, right, line) where line is the top and bottom border
+        """
+        return "|", "|", "+" + self._make_line('-', inner_columns) + "+"
     
     def get_row_text(self, row: int) -> str:
         """
@@ -157,11 +173,20 @@ class CustomBorder(Border):
     
     def get_columns(self) -> int:
         """Get the number of columns including the border."""
-        return 1 + self._display.get_columns() + 1
+        return self._get_size()[0]
     
     def get_rows(self) -> int:
         """Get the number of rows including the border."""
-        return 1 + self._display.get_rows() + 1
+        return self._get_size()[1]
+    
+    def _grow(self, columns: int, rows: int) -> tuple[int, int]:
+        """A custom border adds one column on each side and a row above and below."""
+        return 1 + columns + 1, 1 + rows + 1
+    
+    def get_frame(self, inner_columns: int) -> tuple[str, str, str]:
+        """Get (left, right, top and bottom line) added around the wrapped display."""
+        return (self._vertical, self._vertical,
+                self._corner + self._horizontal * inner_columns + self._corner)
     
     def get_row_text(self, row: int) -> str:
         """Get the text for a specific row with custom border."""
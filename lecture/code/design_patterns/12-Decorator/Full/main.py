@@ -17,10 +17,13 @@ The display/border metaphor perfectly illustrates this pattern:
 - Decorators can be stacked/nested for complex effects
 """
 
+import time
+
 from display import Display
 from string_display import StringDisplay
 from side_border import SideBorder
 from full_border import FullBorder, CustomBorder
+from compiled_display import CompiledDisplay
 
 
 def basic_decorator_demo():
@@ -252,6 +255,43 @@ def performance_comparison():
     print()
 
 
+def demonstrate_compiled_rendering():
+    """Demonstrate compiling deep decorator stacks into a flat table."""
+    print("=== Compiled Rendering ===")
+    
+    base = StringDisplay("Compiled")
+    display = FullBorder(SideBorder(FullBorder(base), '*'))
+    compiled = CompiledDisplay(display)
+    print("Compiled display (same output as the decorators):")
+    compiled.show()
+    
+    base.set_string("Changed!")
+    print("\nAfter set_string() the compiled display recompiles itself:")
+    compiled.show()
+    
+    print("\nRendering deep stacks (alternating SideBorder and FullBorder):")
+    for depth in (100, 200, 1000):
+        deep = StringDisplay("Deep")
+        for i in range(depth):
+            deep = FullBorder(deep) if i % 2 else SideBorder(deep, '*')
+        
+        start = time.perf_counter()
+        text = CompiledDisplay(deep).get_all_text()
+        compiled_ms = (time.perf_counter() - start) * 1000
+        
+        if depth <= 200:
+            start = time.perf_counter()
+            assert deep.get_all_text() == text
+            chained_ms = (time.perf_counter() - start) * 1000
+            chained = f"{chained_ms:7.1f} ms"
+        else:
+            chained = "   (too deep to recurse)"
+        print(f"  {depth:5} layers, {deep.get_columns()}x{deep.get_rows()}: "
+              f"decorators {chained}, compiled {compiled_ms:6.1f} ms")
+    
+    print()
+
+
 def real_world_applications():
     """Show real-world applications of the Decorator pattern."""
     print("=== Real-World Applications ===")
@@ -308,6 +348,9 @@ def main():
     # Performance comparison
     performance_comparison()
     
+    # Compiled rendering of deep stacks
+    demonstrate_compiled_rendering()
+    
     # Real-world applications
     real_world_applications()
     
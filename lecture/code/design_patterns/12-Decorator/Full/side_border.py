@@ -46,7 +46,7 @@ class SideBorder(Border):
         Returns:
             int: The width including side borders
         """
-        return 1 + self._display.get_columns() + 1
+        return self._get_size()[0]
     
     def get_rows(self) -> int:
         """
@@ -57,7 +57,23 @@ class SideBorder(Border):
         Returns:
             int: The same height as the wrapped display
         """
-        return self._display.get_rows()
+        return self._get_size()[1]
+    
+    def _grow(self, columns: int, rows: int) -> tuple[int, int]:
+        """Side borders add one column on each side."""
+        return 1 + columns + 1, rows
+    
+    def get_frame(self, inner_columns: int) -> tuple[str, str, None]:
+        """
+        Get what this border adds around the wrapped display.
+        
+        Args:
+            inner_columns (int): Width of the wrapped display
+            
+        Returns:
+            tuple: (left, right, None) - side borders add no top or bottom line
+        """
+        return self._border_char, self._border_char, None
     
     def get_row_text(self, row: int) -> str:
         """
@@ -101,6 +117,7 @@ class SideBorder(Border):
         if len(border_char) != 1:
             raise ValueError("Border character must be exactly one character")
         self._border_char = border_char
+        self._changed()
     
     def __repr__(self) -> str:
         """
@@ -86,6 +86,7 @@ class StringDisplay(Display):
             string (str): The new string content
         """
         self._string = string
+        self._changed()
     
     def __eq__(self, other) -> bool:
         """
@@ -24,6 +24,7 @@ from random_number_generator import RandomNumberGenerator, SequentialNumberGener
 from digit_observer import DigitObserver, FormattedDigitObserver
 from graph_observer import GraphObserver, BarChartObserver, HistogramObserver
 from observer import Observer
+from observer_dispatcher import ObserverDispatcher, BackpressurePolicy
 import time
 
 
@@ -219,6 +220,8 @@ def performance_and_scalability_demo():
     num_observers = 20
     print(f"Creating {num_observers} observers...")
     
+    # The generator only holds weak references, so keep the observers alive here
+    observers = []
     for i in range(num_observers):
         if i % 3 == 0:
             obs = DigitObserver(f"Digit{i}")
@@ -227,6 +230,7 @@ def performance_and_scalability_demo():
         else:
             obs = FormattedDigitObserver(f"Format{i}", f"[{i}]:", "")
         
+        observers.append(obs)
         generator.add_observer(obs)
     
     print(f"Registered {generator.get_observer_count()} observers")
@@ -240,7 +244,7 @@ def performance_and_scalability_demo():
     
     # Demonstrate that removing observers works
     print(f"\nRemoving half the observers...")
-    observers_to_remove = list(generator._observers)[::2]  # Every other observer
+    observers_to_remove = generator.get_observers()[::2]  # Every other observer
     for obs in observers_to_remove:
         generator.delete_observer(obs)
     
@@ -252,9 +256,82 @@ def performance_and_scalability_demo():
     
     print(f"Execution with {generator.get_observer_count()} observers took {end_time - start_time:.3f} seconds")
     
+    # Same observers, delivered asynchronously on a thread pool
+    print(f"\nSwitching to asynchronous dispatch...")
+    dispatcher = ObserverDispatcher(max_workers=num_observers, max_queue_size=3,
+                                    policy=BackpressurePolicy.DROP_OLDEST)
+    generator.set_dispatcher(dispatcher)
+    
+    start_time = time.time()
+    generator.execute_count(5)
+    generated_time = time.time() - start_time
+    dispatcher.flush()
+    end_time = time.time()
+    
+    print(f"Generation with {generator.get_observer_count()} async observers took {generated_time:.3f} seconds")
+    print(f"All observers were up to date after {end_time - start_time:.3f} seconds")
+    print("\nPer-observer delivery counters:")
+    dispatcher.print_stats()
+    dispatcher.shutdown()
+    generator.set_dispatcher(None)
+    
+    # Registration cost with many subscribers
+    class CountingObserver(Observer):
+        def __init__(self):
+            self.count = 0
+        
+        def update(self, generator):
+            self.count += 1
+    
+    num_subscribers = 50000
+    subscribers = [CountingObserver() for _ in range(num_subscribers)]
+    manual = ManualNumberGenerator()
+    
+    start_time = time.time()
+    for obs in subscribers:
+        manual.add_observer(obs)
+    for obs in subscribers[::2]:
+        manual.delete_observer(obs)
+    end_time = time.time()
+    print(f"\nRegistered {num_subscribers} and removed {num_subscribers // 2} subscribers "
+          f"in {end_time - start_time:.3f} seconds")
+    
+    start_time = time.time()
+    manual.set_number(1)
+    end_time = time.time()
+    print(f"Notified {manual.get_observer_count()} subscribers in {end_time - start_time:.3f} seconds")
+    
+    # Dropped observers are pruned automatically (weak references)
+    del subscribers[1::2]
+    print(f"After dropping the remaining subscribers: {manual.get_observer_count()} registered")
+    
     print()
 
 
+def streaming_statistics_demo():
+    """Demonstrate chunked generation with vectorized statistics observers."""
+    print("=== Streaming Statistics Demo ===")
+    
+    # Imported here: these observers need NumPy, the other demos do not
+    from statistics_observer import StreamingStatisticsObserver, StreamingHistogramObserver
+    
+    generator = RandomNumberGenerator(seed=42)
+    statistics_obs = StreamingStatisticsObserver("Stream")
+    histogram_obs = StreamingHistogramObserver("StreamHistogram", 0, 49, 10)
+    generator.add_observer(statistics_obs)
+    generator.add_observer(histogram_obs)
+    
+    # Numbers are pushed to the observers in blocks of 65536
+    count = 1_000_000
+    start_time = time.time()
+    generator.execute_count(count, chunk_size=65536)
+    end_time = time.time()
+    
+    print(f"Processed {count} numbers in {end_time - start_time:.3f} seconds")
+    statistics_obs.print_statistics()
+    histogram_obs.display_histogram()
+
+
 def pattern_benefits_demo():
     """Demonstrate the benefits of the Observer pattern."""
     print("=== Observer Pattern Benefits ===")
@@ -349,7 +426,7 @@ def error_handling_demo():
             """Enhanced notification with error handling."""
             failed_observers = []
             
-            for observer in self._observers[:]:  # Copy list to avoid modification issues
+            for observer in self.get_observers():  # Copy to avoid modification issues
                 try:
                     observer.update(self)
                 except Exception as e:
@@ -398,6 +475,9 @@ def main():
     # Performance and scalability
     performance_and_scalability_demo()
     
+    # Streaming statistics over a high-rate stream
+    streaming_statistics_demo()
+    
     # Pattern benefits
     pattern_benefits_demo()
     
@@ -2,14 +2,15 @@
 NumberGenerator abstract class for Observer Pattern Example
 
 This abstract class represents the subject (observable) in the Observer pattern.
-It maintains a list of observers and notifies them when its state changes.
+It maintains a registry of observers and notifies them when its state changes.
 
 This is the "Subject/Observable" in the Observer pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Tuple
 from observer import Observer
+from observer_registry import ObserverRegistry
 
 
 class NumberGenerator(ABC):
@@ -17,17 +18,43 @@ class NumberGenerator(ABC):
     Abstract number generator that can be observed.
     
     This class implements the subject side of the Observer pattern.
-    It maintains a list of observers and provides methods to add,
+    It maintains a registry of observers and provides methods to add,
     remove, and notify observers when changes occur.
+    
+    Observers are held by weak reference: an observer that the rest of the
+    program no longer uses is removed automatically.
     """
     
     def __init__(self):
-        """Initialize the number generator with an empty observer list."""
-        self._observers: List[Observer] = []
+        """Initialize the number generator with an empty observer registry."""
+        self._observers = ObserverRegistry()
+        self._dispatcher = None
+    
+    def set_dispatcher(self, dispatcher) -> None:
+        """
+        Deliver notifications through a dispatcher instead of directly.
+        
+        With an ObserverDispatcher, notify_observers() only queues the
+        current number and returns; observers are updated on worker threads.
+        
+        Args:
+            dispatcher (ObserverDispatcher): The dispatcher to use, or None
+                                             for synchronous notification
+        """
+        self._dispatcher = dispatcher
+    
+    def get_dispatcher(self):
+        """
+        Get the dispatcher used for notifications.
+        
+        Returns:
+            ObserverDispatcher: The dispatcher, or None if synchronous
+        """
+        return self._dispatcher
     
     def add_observer(self, observer: Observer) -> None:
         """
-        Add an observer to the list of observers.
+        Add an observer to the registry of observers (O(1)).
         
         Args:
             observer (Observer): The observer to add
@@ -38,12 +65,11 @@ class NumberGenerator(ABC):
         if not isinstance(observer, Observer):
             raise TypeError("Observer must implement Observer interface")
         
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._observers.add(observer)
     
     def delete_observer(self, observer: Observer) -> bool:
         """
-        Remove an observer from the list of observers.
+        Remove an observer from the registry of observers (O(1)).
         
         Args:
             observer (Observer): The observer to remove
@@ -51,23 +77,44 @@ class NumberGenerator(ABC):
         Returns:
             bool: True if observer was found and removed, False otherwise
         """
-        try:
-            self._observers.remove(observer)
-            return True
-        except ValueError:
+        if not self._observers.remove(observer):
             return False
+        if self._dispatcher is not None:
+            self._dispatcher.discard(observer)
+        return True
     
     def notify_observers(self) -> None:
         """
         Notify all registered observers about a change.
         
         This method is called whenever the state of the number generator
-        changes. It iterates through all registered observers and calls
-        their update method.
+        changes. It iterates through a snapshot of the registered observers
+        and calls their update method, so observers may be added or removed
+        during the notification.
+        
+        If a dispatcher is set, the observers are only queued for
+        asynchronous delivery.
         """
+        if self._dispatcher is not None:
+            self._dispatcher.dispatch(self, self._observers)
+            return
         for observer in self._observers:
             observer.update(self)
     
+    def notify_observers_many(self, numbers) -> None:
+        """
+        Notify all registered observers about a chunk of new numbers.
+        
+        Each observer receives the whole chunk in one update_many() call.
+        Chunks are always delivered synchronously, also when a dispatcher
+        is set.
+        
+        Args:
+            numbers: The new numbers, oldest first (list or NumPy array)
+        """
+        for observer in self._observers:
+            observer.update_many(self, numbers)
+    
     def get_observer_count(self) -> int:
         """
         Get the number of registered observers.
@@ -77,6 +124,15 @@ class NumberGenerator(ABC):
         """
         return len(self._observers)
     
+    def get_observers(self) -> Tuple[Observer, ...]:
+        """
+        Get the registered observers.
+        
+        Returns:
+            tuple: The observers in registration order
+        """
+        return tuple(self._observers)
+    
     def clear_observers(self) -> None:
         """Remove all observers."""
         self._observers.clear()
@@ -8,7 +8,8 @@ This is the "Observer" interface in the Observer pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
+from observer_dispatcher import NumberSnapshot
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
@@ -37,3 +38,18 @@ class Observer(ABC):
             generator (NumberGenerator): The subject that changed
         """
         pass
+
+    def update_many(self, generator: 'NumberGenerator', numbers: List[int]) -> None:
+        """
+        Update method called with a batch of numbers at once.
+        
+        Used by ObserverDispatcher when it coalesces a burst of notifications.
+        The default implementation calls update() once per number; observers
+        that can process a whole batch faster should override it.
+        
+        Args:
+            generator (NumberGenerator): The subject that changed
+            numbers (List[int]): The numbers, oldest first
+        """
+        for number in numbers:
+            self.update(NumberSnapshot(generator, number))
@@ -0,0 +1,326 @@
+"""
+ObserverDispatcher class for Observer Pattern Example
+
+By default NumberGenerator.notify_observers() calls every observer's update()
+synchronously and in series, so one slow observer stalls the generator and
+every other observer. The dispatcher decouples them: each notification is put
+into a bounded queue per observer, and the queues are drained on a thread pool.
+
+Because the generator has moved on by the time a queued update is delivered,
+observers receive a NumberSnapshot that returns the number as it was when the
+notification happened.
+
+This is an optional "asynchronous delivery" extension of the Observer pattern.
+"""
+
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Dict, List
+
+
+class BackpressurePolicy(Enum):
+    """What to do when an observer's queue is full."""
+    DROP_OLDEST = "drop-oldest"          # discard the oldest pending value
+    BLOCK = "block"                      # make the generator wait for space
+    COALESCE_LATEST = "coalesce-latest"  # replace the newest pending value
+
+
+class NumberSnapshot:
+    """
+    Read-only view of a generator at the time of a notification.
+
+    get_number() returns the captured number; every other attribute is
+    looked up on the real generator.
+    """
+
+    __slots__ = ("_generator", "_number")
+
+    def __init__(self, generator, number: int):
+        self._generator = generator
+        self._number = number
+
+    def get_number(self) -> int:
+        """Return the number captured when the notification was made."""
+        return self._number
+
+    def __getattr__(self, name):
+        return getattr(self._generator, name)
+
+
+class ObserverQueue:
+    """
+    Bounded queue of pending notifications for one observer.
+
+    Also keeps the delivery counters reported by ObserverDispatcher.get_stats().
+    """
+
+    def __init__(self, observer, max_size: int, policy: BackpressurePolicy):
+        """
+        Initialize the queue.
+
+        The observer is held by weak reference, like in the generator's
+        registry, so a queue never keeps a dropped observer alive.
+
+        Args:
+            observer (Observer): The observer this queue delivers to
+            max_size (int): Maximum number of pending notifications
+            policy (BackpressurePolicy): What to do when the queue is full
+        """
+        self.observer_ref = weakref.ref(observer)
+        self.max_size = max_size
+        self.policy = policy
+        self.items = deque()  # (snapshot, enqueue time)
+        self.condition = threading.Condition()
+        self.scheduled = False  # a drain task is queued or running
+
+        # counters
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.batches = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def put(self, snapshot: NumberSnapshot) -> bool:
+        """
+        Add a notification, applying the backpressure policy.
+
+        Returns:
+            bool: True if the caller must schedule a drain task
+        """
+        with self.condition:
+            items = self.items
+            if len(items) >= self.max_size:
+                if self.policy is BackpressurePolicy.BLOCK:
+                    while len(items) >= self.max_size:
+                        self.condition.wait()
+                elif self.policy is BackpressurePolicy.DROP_OLDEST:
+                    items.popleft()
+                    self.dropped += 1
+                else:
+                    items.pop()
+                    self.coalesced += 1
+            items.append((snapshot, time.perf_counter()))
+            self.enqueued += 1
+            if len(items) > self.max_depth:
+                self.max_depth = len(items)
+            if self.scheduled:
+                return False
+            self.scheduled = True
+            return True
+
+    def take(self, batch_size: int) -> list:
+        """
+        Remove up to batch_size pending notifications.
+
+        Returns an empty list (and marks the queue as not scheduled)
+        when there is nothing left to deliver.
+        """
+        with self.condition:
+            items = self.items
+            if not items:
+                self.scheduled = False
+                self.condition.notify_all()
+                return []
+            count = min(batch_size, len(items))
+            batch = [items.popleft() for _ in range(count)]
+            # wake up a generator blocked on a full queue
+            self.condition.notify_all()
+            return batch
+
+    def record(self, batch: list, error: bool) -> None:
+        """Update the counters after a batch has been delivered."""
+        now = time.perf_counter()
+        with self.condition:
+            self.batches += 1
+            self.delivered += len(batch)
+            if error:
+                self.errors += 1
+            for _, enqueued_at in batch:
+                latency = now - enqueued_at
+                self.total_latency += latency
+                if latency > self.max_latency:
+                    self.max_latency = latency
+
+
+class ObserverDispatcher:
+    """
+    Delivers notifications to observers asynchronously on a thread pool.
+
+    Each observer gets its own bounded queue, drained by at most one worker
+    at a time, so every observer still sees values in order. With batch_size
+    greater than 1, pending values are delivered together through
+    Observer.update_many().
+
+    Usage:
+        dispatcher = ObserverDispatcher(max_workers=8)
+        generator.set_dispatcher(dispatcher)
+        generator.execute()
+        dispatcher.flush()
+    """
+
+    def __init__(self, max_workers: int = None,
+                 max_queue_size: int = 100,
+                 policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+                 batch_size: int = 1):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_workers (int, optional): Number of worker threads
+            max_queue_size (int): Maximum pending notifications per observer
+            policy (BackpressurePolicy): What to do when a queue is full
+            batch_size (int): Maximum values delivered in one update_many() call
+        """
+        if max_queue_size <= 0:
+            raise ValueError("Queue size must be positive")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="observer")
+        self._max_queue_size = max_queue_size
+        self._policy = policy
+        self._batch_size = batch_size
+        # keyed by observer, entries vanish when an observer is collected
+        self._queues: Dict[object, ObserverQueue] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _get_queue(self, observer) -> ObserverQueue:
+        queue = self._queues.get(observer)
+        if queue is None:
+            with self._lock:
+                queue = self._queues.get(observer)
+                if queue is None:
+                    queue = ObserverQueue(observer, self._max_queue_size, self._policy)
+                    self._queues[observer] = queue
+        return queue
+
+    def dispatch(self, generator, observers) -> None:
+        """
+        Queue the generator's current number for every observer.
+
+        Args:
+            generator (NumberGenerator): The subject that changed
+            observers: The observers to notify
+        """
+        snapshot = NumberSnapshot(generator, generator.get_number())
+        for observer in observers:
+            queue = self._get_queue(observer)
+            if queue.put(snapshot):
+                self._executor.submit(self._drain, queue)
+
+    def _drain(self, queue: ObserverQueue) -> None:
+        """Deliver pending notifications of one queue until it is empty."""
+        batch_size = self._batch_size
+        while True:
+            batch = queue.take(batch_size)
+            if not batch:
+                return
+            observer = queue.observer_ref()
+            if observer is None:
+                # the observer was garbage collected, nobody to deliver to
+                continue
+            error = False
+            try:
+                if batch_size > 1:
+                    generator = batch[-1][0]
+                    observer.update_many(generator, [snapshot.get_number()
+                                                     for snapshot, _ in batch])
+                else:
+                    observer.update(batch[0][0])
+            except Exception as e:
+                error = True
+                print(f"ERROR: Observer {observer} failed: {e}")
+            queue.record(batch, error)
+
+    def discard(self, observer) -> None:
+        """
+        Forget an observer's queue (pending notifications are still delivered).
+
+        Args:
+            observer (Observer): The observer to forget
+        """
+        with self._lock:
+            self._queues.pop(observer, None)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait until every queue has been drained.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            bool: True if all queues were drained in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            queues = list(self._queues.values())
+        for queue in queues:
+            with queue.condition:
+                while queue.scheduled:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    queue.condition.wait(remaining)
+        return True
+
+    def shutdown(self) -> None:
+        """Drain all queues and stop the worker threads."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> List[dict]:
+        """
+        Get delivery counters for every observer.
+
+        Returns:
+            list: One dict per observer with queue depth, drops and latency
+        """
+        stats = []
+        with self._lock:
+            queues = list(self._queues.values())
+        for queue in queues:
+            with queue.condition:
+                delivered = queue.delivered
+                stats.append({
+                    "observer": queue.observer_ref(),
+                    "enqueued": queue.enqueued,
+                    "delivered": delivered,
+                    "dropped": queue.dropped,
+                    "coalesced": queue.coalesced,
+                    "errors": queue.errors,
+                    "batches": queue.batches,
+                    "depth": len(queue.items),
+                    "max_depth": queue.max_depth,
+                    "avg_latency": queue.total_latency / delivered if delivered else 0.0,
+                    "max_latency": queue.max_latency,
+                })
+        return stats
+
+    def print_stats(self) -> None:
+        """Print the per-observer counters as a table."""
+        print(f"{'Observer':<30} {'sent':>5} {'done':>5} {'drop':>5} {'coal':>5} "
+              f"{'depth':>5} {'max':>4} {'avg ms':>8} {'max ms':>8}")
+        for s in self.get_stats():
+            observer = s["observer"]
+            if observer is None:
+                name = "(collected)"
+            else:
+                name = getattr(observer, "_name", type(observer).__name__)
+            print(f"{name[:30]:<30} {s['enqueued']:>5} {s['delivered']:>5} "
+                  f"{s['dropped']:>5} {s['coalesced']:>5} {s['depth']:>5} "
+                  f"{s['max_depth']:>4} {s['avg_latency'] * 1000:>8.1f} "
+                  f"{s['max_latency'] * 1000:>8.1f}")
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return (f"ObserverDispatcher(policy={self._policy.value}, "
+                f"max_queue_size={self._max_queue_size}, batch_size={self._batch_size})")
@@ -0,0 +1,134 @@
+"""
+ObserverRegistry class for Observer Pattern Example
+
+A plain list of observers makes add_observer() (duplicate check) and
+delete_observer() (list.remove) O(n), and its strong references keep
+observers alive after every other part of the program has dropped them.
+
+The registry keeps observers in insertion order in a dict keyed by id(),
+which gives O(1) add and remove, and holds only weak references: an observer
+that is garbage collected disappears from the registry on its own. Iteration
+runs over a cached snapshot that is rebuilt only after the registry changes,
+so notifying observers does not copy anything.
+
+This is the observer bookkeeping used by the "Subject" (NumberGenerator).
+"""
+
+import weakref
+from typing import Iterator, Tuple
+
+
+class ObserverRegistry:
+    """
+    Insertion-ordered set of observers held by weak reference.
+
+    Observers can be added or removed while the registry is being iterated;
+    the running iteration keeps using the snapshot it started with.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._refs = {}      # id(observer) -> KeyedRef, in insertion order
+        self._dead = []      # ids of collected observers, removed lazily
+        self._snapshot = ()  # cached tuple of the references in _refs
+        self._dirty = False
+
+        def _collected(ref, selfref=weakref.ref(self)):
+            # Called by the garbage collector, possibly in the middle of
+            # another operation, so only record the id here.
+            registry = selfref()
+            if registry is not None:
+                registry._dead.append(ref.key)
+                registry._dirty = True
+
+        self._collected = _collected
+
+    def _prune(self) -> None:
+        """Remove the entries of observers that have been garbage collected."""
+        while self._dead:
+            key = self._dead.pop()
+            ref = self._refs.get(key)
+            # the id may already belong to a newly added observer
+            if ref is not None and ref() is None:
+                del self._refs[key]
+
+    def add(self, observer) -> bool:
+        """
+        Add an observer if it is not registered yet.
+
+        Args:
+            observer (Observer): The observer to add
+
+        Returns:
+            bool: True if the observer was added, False if already present
+        """
+        self._prune()
+        key = id(observer)
+        ref = self._refs.get(key)
+        if ref is not None and ref() is observer:
+            return False
+        self._refs[key] = weakref.KeyedRef(observer, self._collected, key)
+        self._dirty = True
+        return True
+
+    def remove(self, observer) -> bool:
+        """
+        Remove an observer.
+
+        Args:
+            observer (Observer): The observer to remove
+
+        Returns:
+            bool: True if the observer was found and removed, False otherwise
+        """
+        self._prune()
+        key = id(observer)
+        ref = self._refs.get(key)
+        if ref is None or ref() is not observer:
+            return False
+        del self._refs[key]
+        self._dirty = True
+        return True
+
+    def clear(self) -> None:
+        """Remove all observers."""
+        self._refs.clear()
+        self._dead.clear()
+        self._dirty = True
+
+    def snapshot(self) -> Tuple[weakref.ref, ...]:
+        """
+        Get the registered observers as a tuple of weak references.
+
+        The tuple is cached and only rebuilt after add/remove/clear or
+        after an observer has been garbage collected.
+
+        Returns:
+            tuple: Weak references in insertion order (call one to get the observer)
+        """
+        if self._dirty:
+            self._dirty = False
+            self._prune()
+            self._snapshot = tuple(self._refs.values())
+        return self._snapshot
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the live observers of the current snapshot."""
+        for ref in self.snapshot():
+            observer = ref()
+            if observer is not None:
+                yield observer
+
+    def __contains__(self, observer) -> bool:
+        """Check whether an observer is registered."""
+        ref = self._refs.get(id(observer))
+        return ref is not None and ref() is observer
+
+    def __len__(self) -> int:
+        """Get the number of registered (live) observers."""
+        self._prune()
+        return len(self._refs)
+
+    def __repr__(self) -> str:
+        """Developer-friendly representation."""
+        return f"ObserverRegistry(observers={len(self)})"
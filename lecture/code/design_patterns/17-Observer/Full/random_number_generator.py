@@ -31,6 +31,8 @@ class RandomNumberGenerator(NumberGenerator):
         """
         super().__init__()
         self._random = random.Random(seed)
+        self._seed = seed
+        self._np_random = None  # numpy.random.Generator, created on first chunked run
         self._number = 0
     
     def get_number(self) -> int:
@@ -63,22 +65,47 @@ class RandomNumberGenerator(NumberGenerator):
         
         print("Random number generation completed.")
     
-    def execute_count(self, count: int) -> None:
+    def execute_count(self, count: int, chunk_size: int = None) -> None:
         """
         Execute random number generation for a specific count.
         
+        With chunk_size, numbers are drawn with numpy.random.Generator in
+        blocks of chunk_size and each block is pushed to the observers with
+        notify_observers_many(), without delay. This is meant for high-rate
+        streams (e.g. a million samples) and requires NumPy.
+        
         Args:
             count (int): Number of random numbers to generate
+            chunk_size (int, optional): Numbers per block in chunked mode
         """
         print(f"Starting random number generation ({count} numbers)...")
         
-        for i in range(count):
-            self._number = self._random.randint(0, 49)
-            self.notify_observers()
-            time.sleep(0.05)  # Shorter delay for custom count
+        if chunk_size is not None:
+            self._execute_chunked(count, chunk_size)
+        else:
+            for i in range(count):
+                self._number = self._random.randint(0, 49)
+                self.notify_observers()
+                time.sleep(0.05)  # Shorter delay for custom count
         
         print(f"Generation completed ({count} numbers).")
     
+    def _execute_chunked(self, count: int, chunk_size: int) -> None:
+        """Generate count numbers in NumPy blocks and push them to observers."""
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        if self._np_random is None:
+            import numpy as np
+            self._np_random = np.random.default_rng(self._seed)
+        
+        remaining = count
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            chunk = self._np_random.integers(0, 50, size=size)
+            self._number = int(chunk[-1])
+            self.notify_observers_many(chunk)
+            remaining -= size
+    
     def execute_range(self, count: int, min_val: int, max_val: int) -> None:
         """
         Execute random number generation with custom range.
@@ -105,6 +132,8 @@ class RandomNumberGenerator(NumberGenerator):
             seed (int): New seed value
         """
         self._random = random.Random(seed)
+        self._seed = seed
+        self._np_random = None
     
     def get_current_seed_info(self) -> str:
         """
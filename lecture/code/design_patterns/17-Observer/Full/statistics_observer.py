@@ -0,0 +1,254 @@
+"""
+Streaming statistics observers for Observer Pattern Example
+
+HistogramObserver and FormattedDigitObserver keep their state in Python dicts
+and update it one number at a time. These observers are meant for high-rate
+number streams: they keep running accumulators in NumPy arrays and accept a
+whole chunk of numbers at once through update_many().
+
+- StreamingStatisticsObserver: count, min, max, sum, mean and variance
+  (Welford's algorithm, with chunks merged by Chan's parallel update)
+- StreamingHistogramObserver: fixed-bin histogram updated with numpy.bincount
+
+These are "Concrete Observers" in the Observer pattern.
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+from observer import Observer
+from number_generator import NumberGenerator
+
+
+class StreamingStatisticsObserver(Observer):
+    """
+    Observer that keeps running statistics without storing the numbers.
+
+    The mean and variance are kept with Welford's online algorithm, which
+    stays numerically stable over millions of values.
+    """
+
+    def __init__(self, name: str = "Statistics"):
+        """
+        Initialize the statistics observer.
+
+        Args:
+            name (str): Name identifier for this observer
+        """
+        self._name = name
+        self.reset_statistics()
+
+    def update(self, generator: NumberGenerator) -> None:
+        """
+        Add the generator's current number to the statistics.
+
+        Args:
+            generator (NumberGenerator): The subject that changed
+        """
+        value = generator.get_number()
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def update_many(self, generator: NumberGenerator, numbers: Sequence[int]) -> None:
+        """
+        Add a whole chunk of numbers to the statistics.
+
+        The chunk's own mean and sum of squared deviations are computed with
+        NumPy and merged into the running totals (Chan et al.).
+
+        Args:
+            generator (NumberGenerator): The subject that changed
+            numbers (Sequence[int]): The new numbers (list or NumPy array)
+        """
+        values = np.asarray(numbers, dtype=np.int64)
+        n = values.size
+        if n == 0:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(np.square(values - chunk_mean).sum())
+        chunk_min = int(values.min())
+        chunk_max = int(values.max())
+
+        total = self._count + n
+        delta = chunk_mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += chunk_m2 + delta * delta * self._count * n / total
+        self._count = total
+        self._sum += int(values.sum())
+        if self._min is None or chunk_min < self._min:
+            self._min = chunk_min
+        if self._max is None or chunk_max > self._max:
+            self._max = chunk_max
+
+    def get_statistics(self) -> dict:
+        """
+        Get statistics about observed numbers.
+
+        Returns:
+            dict: count, min, max, sum, average, variance and std_dev
+        """
+        if self._count == 0:
+            return {"count": 0, "min": None, "max": None, "sum": 0,
+                    "average": None, "variance": None, "std_dev": None}
+        variance = self._m2 / self._count
+        return {
+            "count": self._count,
+            "min": self._min,
+            "max": self._max,
+            "sum": self._sum,
+            "average": self._mean,
+            "variance": variance,
+            "std_dev": math.sqrt(variance),
+        }
+
+    def print_statistics(self) -> None:
+        """Print statistics about observed numbers."""
+        stats = self.get_statistics()
+
+        if stats["count"] == 0:
+            print(f"{self._name} statistics: No updates received")
+            return
+
+        print(f"{self._name} statistics:")
+        print(f"  Count: {stats['count']}")
+        print(f"  Min: {stats['min']}")
+        print(f"  Max: {stats['max']}")
+        print(f"  Average: {stats['average']:.2f}")
+        print(f"  Std dev: {stats['std_dev']:.2f}")
+
+    def reset_statistics(self) -> None:
+        """Reset all statistics."""
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0
+        self._min = None
+        self._max = None
+
+    def get_name(self) -> str:
+        """Get the name of this observer."""
+        return self._name
+
+    def __str__(self) -> str:
+        """String representation with statistics."""
+        if self._count == 0:
+            return f"{self._name} (no updates)"
+        return f"{self._name} (updates: {self._count}, avg: {self._mean:.1f})"
+
+
+class StreamingHistogramObserver(Observer):
+    """
+    Observer that keeps a fixed-bin histogram in a NumPy array.
+
+    Values below min_value or above max_value are counted separately
+    as underflow and overflow.
+    """
+
+    def __init__(self, name: str = "StreamingHistogram",
+                 min_value: int = 0,
+                 max_value: int = 49,
+                 bin_size: int = 10):
+        """
+        Initialize the histogram observer.
+
+        Args:
+            name (str): Name identifier for this observer
+            min_value (int): Smallest value of the first bin
+            max_value (int): Largest value of the last bin
+            bin_size (int): Size of each histogram bin
+        """
+        if bin_size <= 0:
+            raise ValueError("Bin size must be positive")
+        if max_value < min_value:
+            raise ValueError("max_value must not be smaller than min_value")
+        self._name = name
+        self._min_value = min_value
+        self._max_value = max_value
+        self._bin_size = bin_size
+        self._num_bins = (max_value - min_value) // bin_size + 1
+        self.reset_histogram()
+
+    def update(self, generator: NumberGenerator) -> None:
+        """
+        Count the generator's current number.
+
+        Args:
+            generator (NumberGenerator): The subject that changed
+        """
+        value = generator.get_number()
+        if value < self._min_value:
+            self._underflow += 1
+        elif value > self._max_value:
+            self._overflow += 1
+        else:
+            self._counts[(value - self._min_value) // self._bin_size] += 1
+
+    def update_many(self, generator: NumberGenerator, numbers: Sequence[int]) -> None:
+        """
+        Count a whole chunk of numbers with one numpy.bincount call.
+
+        Args:
+            generator (NumberGenerator): The subject that changed
+            numbers (Sequence[int]): The new numbers (list or NumPy array)
+        """
+        values = np.asarray(numbers, dtype=np.int64)
+        below = values < self._min_value
+        above = values > self._max_value
+        self._underflow += int(below.sum())
+        self._overflow += int(above.sum())
+        inside = values[~(below | above)]
+        bins = (inside - self._min_value) // self._bin_size
+        self._counts += np.bincount(bins, minlength=self._num_bins)
+
+    def get_histogram(self) -> dict:
+        """
+        Get the histogram as a dict.
+
+        Returns:
+            dict: bin start -> count (only non-empty bins)
+        """
+        return {self._min_value + i * self._bin_size: int(count)
+                for i, count in enumerate(self._counts) if count}
+
+    def get_count(self) -> int:
+        """Get the number of values counted, including under/overflow."""
+        return int(self._counts.sum()) + self._underflow + self._overflow
+
+    def display_histogram(self) -> None:
+        """Display the histogram."""
+        print(f"\n{self._name} (after {self.get_count()} values):")
+        max_count = int(self._counts.max()) if self._num_bins else 0
+        if max_count == 0:
+            print("  No data")
+            return
+        for i, count in enumerate(self._counts):
+            bin_start = self._min_value + i * self._bin_size
+            bin_end = min(bin_start + self._bin_size - 1, self._max_value)
+            bar = "▪" * int((count / max_count) * 20)
+            print(f"  {bin_start:2d}-{bin_end:2d}: {bar} ({count})")
+        if self._underflow or self._overflow:
+            print(f"  underflow: {self._underflow}, overflow: {self._overflow}")
+        print()
+
+    def reset_histogram(self) -> None:
+        """Reset the histogram data."""
+        self._counts = np.zeros(self._num_bins, dtype=np.int64)
+        self._underflow = 0
+        self._overflow = 0
+
+    def get_name(self) -> str:
+        """Get the name of this observer."""
+        return self._name
+
+    def __str__(self) -> str:
+        """String representation of the observer."""
+        return f"{self._name} (bins={self._num_bins}, values={self.get_count()})"
@@ -0,0 +1,94 @@
+"""
+Benchmark for saving mementos to disk
+
+Takes a snapshot after every round of many short games, then saves and
+loads the snapshots with MementoLog and with pickle. MementoLog writes
+compact records plus an offset index, so a single snapshot can be loaded
+from the file directly; pickle has to load the whole list.
+
+Usage:
+    python3 benchmark.py [snapshots]
+"""
+
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from game.gamer import Gamer
+from game.memento_store import MementoLog
+
+
+def make_snapshots(count: int, rounds: int = 200) -> list:
+    """Play games of the given length, taking a snapshot after every round."""
+    snapshots = []
+    seed = 0
+    while len(snapshots) < count:
+        gamer = Gamer(100, seed=seed, verbose=False)
+        seed += 1
+        for _ in range(min(rounds, count - len(snapshots))):
+            gamer.bet()
+            snapshots.append(gamer.create_memento())
+    return snapshots
+
+
+def timed(function, *args):
+    """Call function; return its result and the seconds it took."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Creating {count:,} snapshots...")
+    snapshots = make_snapshots(count)
+    directory = tempfile.mkdtemp()
+    log_path = os.path.join(directory, "snapshots.mlog")
+    pickle_path = os.path.join(directory, "snapshots.pickle")
+
+    def save_pickle():
+        with open(pickle_path, "wb") as file:
+            pickle.dump(snapshots, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def load_pickle():
+        with open(pickle_path, "rb") as file:
+            return pickle.load(file)
+
+    def load_log():
+        with MementoLog(log_path) as log:
+            return list(log)
+
+    picks = random.Random(1).sample(range(count), min(count, 10_000))
+
+    def load_log_random():
+        with MementoLog(log_path) as log:
+            return [log.load(number) for number in picks]
+
+    _, log_save = timed(MementoLog.write, log_path, snapshots)
+    _, pickle_save = timed(save_pickle)
+    loaded, log_load = timed(load_log)
+    assert [m.get_fruits() for m in loaded[-100:]] == [m.get_fruits() for m in snapshots[-100:]]
+    _, pickle_load = timed(load_pickle)
+    _, log_random = timed(load_log_random)
+
+    log_size = os.path.getsize(log_path) + os.path.getsize(log_path + ".idx")
+    pickle_size = os.path.getsize(pickle_path)
+    print(f"  {'':26} {'MementoLog':>14} {'pickle':>14}")
+    print(f"  {'save (snapshots/sec)':26} {count / log_save:>14,.0f} {count / pickle_save:>14,.0f}")
+    print(f"  {'load all (snapshots/sec)':26} {count / log_load:>14,.0f} {count / pickle_load:>14,.0f}")
+    print(f"  {'load one snapshot (ms)':26} {log_random / len(picks) * 1000:>14.4f} "
+          f"{pickle_load * 1000:>14.1f}")
+    print(f"  {'file size (bytes)':26} {log_size:>14,} {pickle_size:>14,}")
+
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Memento Pattern - Caretaker Class
+This class keeps a numbered history of a Gamer's mementos, so the game can
+be rolled back to any earlier snapshot.
+
+Most snapshots are DeltaMementos that only store what changed since the
+previous snapshot; every checkpoint_every snapshots (and after every
+restore) a full Memento is stored as a checkpoint. The history is a list of
+segments, each a checkpoint followed by its deltas, so restoring replays at
+most checkpoint_every - 1 deltas.
+
+When the history uses more than max_bytes, the oldest segment first loses
+its deltas (its checkpoint can still be restored), and is dropped entirely
+if that is not enough.
+"""
+
+from bisect import bisect_right
+from typing import List, Optional
+from game.gamer import Gamer
+from game.memento import Memento
+
+
+class _Segment:
+    """A checkpoint and the deltas taken after it."""
+
+    __slots__ = ("start", "mementos", "nbytes")
+
+    def __init__(self, start: int, checkpoint: Memento):
+        self.start = start                 # number of the checkpoint snapshot
+        self.mementos = [checkpoint]
+        self.nbytes = checkpoint.nbytes()
+
+
+class MementoHistory:
+    """
+    Caretaker that keeps a bounded history of a gamer's snapshots.
+    Like any caretaker it only uses the narrow interface of the mementos.
+
+    Usage:
+        history = MementoHistory(gamer)
+        number = history.snapshot()
+        ...
+        history.restore(number)
+    """
+
+    def __init__(self, gamer: Gamer, checkpoint_every: int = 64,
+                 max_bytes: Optional[int] = None):
+        """
+        Initialize an empty history.
+
+        Args:
+            gamer (Gamer): The gamer to take snapshots of
+            checkpoint_every (int): Snapshots per segment (one full checkpoint, the rest deltas)
+            max_bytes (int, optional): Approximate memory bound of the history (None for no bound)
+        """
+        if checkpoint_every <= 0:
+            raise ValueError("checkpoint_every must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.gamer = gamer
+        self.checkpoint_every = checkpoint_every
+        self.max_bytes = max_bytes
+        self._segments: List[_Segment] = []
+        self._starts: List[int] = []       # segment start numbers, for bisect
+        self._next_number = 0
+        self._needs_checkpoint = True
+        self.nbytes = 0
+        self.evicted_deltas = 0
+        self.evicted_checkpoints = 0
+
+    def snapshot(self) -> int:
+        """
+        Save the gamer's current state.
+
+        Returns:
+            int: The number of the snapshot, to pass to restore()
+        """
+        segments = self._segments
+        if (self._needs_checkpoint
+                or len(segments[-1].mementos) >= self.checkpoint_every):
+            memento = self.gamer.create_memento()
+            number = self._next_number
+            segments.append(_Segment(number, memento))
+            self._starts.append(number)
+            self._needs_checkpoint = False
+            size = segments[-1].nbytes
+        else:
+            memento = self.gamer.create_delta_memento()
+            segment = segments[-1]
+            segment.mementos.append(memento)
+            size = memento.nbytes()
+            segment.nbytes += size
+        self.nbytes += size
+        self._next_number += 1
+        if self.max_bytes is not None and self.nbytes > self.max_bytes:
+            self._evict()
+        return self._next_number - 1
+
+    def get_memento(self, number: int) -> Memento:
+        """
+        Get the memento of a snapshot.
+
+        Args:
+            number (int): The snapshot number
+
+        Returns:
+            Memento: The stored memento
+
+        Raises:
+            KeyError: If there is no such snapshot or it has been evicted
+        """
+        index = bisect_right(self._starts, number) - 1
+        if index >= 0:
+            segment = self._segments[index]
+            offset = number - segment.start
+            if offset < len(segment.mementos):
+                return segment.mementos[offset]
+        raise KeyError(f"Snapshot {number} is not in the history")
+
+    def restore(self, number: int) -> None:
+        """
+        Restore the gamer to a snapshot.
+        The next snapshot is a full checkpoint, so later deltas never
+        depend on an older segment.
+
+        Args:
+            number (int): The snapshot number
+
+        Raises:
+            KeyError: If there is no such snapshot or it has been evicted
+        """
+        self.gamer.restore_memento(self.get_memento(number))
+        self._needs_checkpoint = True
+
+    def latest(self) -> Optional[int]:
+        """
+        Get the number of the newest snapshot.
+
+        Returns:
+            Optional[int]: The snapshot number, or None if the history is empty
+        """
+        return self._next_number - 1 if self._segments else None
+
+    def _evict(self) -> None:
+        """Drop the oldest deltas and checkpoints until within max_bytes."""
+        segments = self._segments
+        drop = 0
+        # Never drop anything from the newest segment: it is still growing
+        while self.nbytes > self.max_bytes and drop < len(segments) - 1:
+            segment = segments[drop]
+            if len(segment.mementos) > 1:
+                # Keep the checkpoint, drop the deltas
+                checkpoint = segment.mementos[0]
+                self.evicted_deltas += len(segment.mementos) - 1
+                self.nbytes -= segment.nbytes - checkpoint.nbytes()
+                segment.mementos = [checkpoint]
+                segment.nbytes = checkpoint.nbytes()
+            else:
+                self.nbytes -= segment.nbytes
+                drop += 1
+        if drop:
+            del segments[:drop]
+            del self._starts[:drop]
+            self.evicted_checkpoints += drop
+
+    def get_stats(self) -> dict:
+        """
+        Get the history counters.
+
+        Returns:
+            dict: snapshots, checkpoints, nbytes, evicted_deltas and evicted_checkpoints
+        """
+        return {"snapshots": len(self),
+                "checkpoints": len(self._segments),
+                "nbytes": self.nbytes,
+                "evicted_deltas": self.evicted_deltas,
+                "evicted_checkpoints": self.evicted_checkpoints}
+
+    def __len__(self) -> int:
+        """Number of snapshots that can still be restored."""
+        return sum(len(segment.mementos) for segment in self._segments)
+
+    def __contains__(self, number: int) -> bool:
+        """Check whether a snapshot can still be restored."""
+        try:
+            self.get_memento(number)
+        except KeyError:
+            return False
+        return True
+
+    def __str__(self) -> str:
+        """String representation of the history."""
+        return (f"MementoHistory(snapshots={len(self)}, "
+                f"checkpoints={len(self._segments)}, nbytes={self.nbytes})")
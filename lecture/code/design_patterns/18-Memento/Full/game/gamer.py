@@ -5,8 +5,8 @@ It maintains its state and can save/restore snapshots of that state.
 """
 
 import random
-from typing import List
-from game.memento import Memento
+from typing import List, Optional
+from game.memento import DeltaMemento, Memento
 
 
 class Gamer:
@@ -18,16 +18,23 @@ class Gamer:
     # Fruit names available in the game
     FRUIT_NAMES = ["apple", "grape", "banana", "orange"]
     
-    def __init__(self, money: int):
+    def __init__(self, money: int, seed: Optional[int] = None, verbose: bool = True):
         """
         Initialize the gamer with starting money.
         
         Args:
             money (int): Initial amount of money
+            seed (int, optional): Seed for the dice (random if None)
+            verbose (bool): Print what happens on every bet
         """
         self.money = money
         self.fruits: List[str] = []
-        self.random = random.Random()
+        self.random = random.Random(seed)
+        self.verbose = verbose
+        # The last memento created or restored, and how many of the current
+        # fruits it covers; create_delta_memento() only looks at the rest
+        self._last_memento: Optional[Memento] = None
+        self._memento_mark = 0
     
     def get_money(self) -> int:
         """
@@ -48,19 +55,23 @@ class Gamer:
         if dice == 1:
             # Roll 1: Money increases
             self.money += 100
-            print("Your money increased!")
+            if self.verbose:
+                print("Your money increased!")
         elif dice == 2:
             # Roll 2: Money is halved
             self.money //= 2
-            print("Your money was halved!")
+            if self.verbose:
+                print("Your money was halved!")
         elif dice == 6:
             # Roll 6: Get a fruit
             fruit = self._get_fruit()
-            print(f"You got a fruit: {fruit}")
+            if self.verbose:
+                print(f"You got a fruit: {fruit}")
             self.fruits.append(fruit)
         else:
             # Other rolls: Nothing happens
-            print("Nothing happened.")
+            if self.verbose:
+                print("Nothing happened.")
     
     def create_memento(self) -> Memento:
         """
@@ -73,10 +84,34 @@ class Gamer:
         memento = Memento(self.money)
         
         # Only save delicious fruits
-        for fruit in self.fruits:
-            if fruit.startswith("delicious "):
-                memento.add_fruit(fruit)
+        memento.add_fruits([fruit for fruit in self.fruits
+                            if fruit.startswith("delicious ")])
         
+        self._last_memento = memento
+        self._memento_mark = len(self.fruits)
+        return memento
+    
+    def create_delta_memento(self) -> Memento:
+        """
+        Create a memento that only stores the changes since the last memento
+        this gamer created or restored.
+        Only looks at the fruits gained since then, so it is O(1) when no
+        fruit was gained, however many fruits the gamer has.
+        
+        Returns:
+            Memento: A DeltaMemento, or a full Memento if there is no earlier one
+        """
+        if self._last_memento is None:
+            return self.create_memento()
+        
+        memento = DeltaMemento(self.money, self._last_memento)
+        
+        # Only save delicious fruits
+        memento.add_fruits([fruit for fruit in self.fruits[self._memento_mark:]
+                            if fruit.startswith("delicious ")])
+        
+        self._last_memento = memento
+        self._memento_mark = len(self.fruits)
         return memento
     
     def restore_memento(self, memento: Memento):
@@ -88,6 +123,8 @@ class Gamer:
         """
         self.money = memento.get_money()
         self.fruits = memento.get_fruits()
+        self._last_memento = memento
+        self._memento_mark = len(self.fruits)
     
     def _get_fruit(self) -> str:
         """
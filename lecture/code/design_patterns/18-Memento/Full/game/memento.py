@@ -4,7 +4,8 @@ This class stores the internal state of the Gamer object.
 It provides both narrow and wide interfaces for accessing the stored state.
 """
 
-from typing import List
+import sys
+from typing import List, Optional
 
 
 class Memento:
@@ -13,6 +14,9 @@ class Memento:
     Implements both narrow interface (for caretaker) and wide interface (for originator).
     """
     
+    # No per-instance __dict__: a caretaker may keep millions of mementos
+    __slots__ = ("_money", "_fruits")
+    
     def __init__(self, money: int):
         """
         Initialize memento with money amount.
@@ -44,6 +48,16 @@ class Memento:
         """
         self._fruits.append(fruit)
     
+    def _add_fruits(self, fruits: List[str]):
+        """
+        Add several fruits to the stored state.
+        This is part of the wide interface - only accessible to originator.
+        
+        Args:
+            fruits (List[str]): The fruits to add
+        """
+        self._fruits.extend(fruits)
+    
     def _get_fruits(self) -> List[str]:
         """
         Get a copy of the stored fruits.
@@ -60,6 +74,73 @@ class Memento:
         """Public method for Gamer to add fruits (simulates package access)."""
         self._add_fruit(fruit)
     
+    def add_fruits(self, fruits: List[str]):
+        """Public method for Gamer to add several fruits (simulates package access)."""
+        self._add_fruits(fruits)
+    
     def get_fruits(self) -> List[str]:
         """Public method for Gamer to get fruits (simulates package access)."""
         return self._get_fruits()
+    
+    def nbytes(self) -> int:
+        """
+        Get the approximate memory used by this memento.
+        This is part of the narrow interface - lets a caretaker bound its memory.
+        
+        Returns:
+            int: Size of the memento and its fruit list in bytes
+            (the fruit strings are shared with the gamer and not counted)
+        """
+        return sys.getsizeof(self) + sys.getsizeof(self._fruits)
+
+
+class DeltaMemento(Memento):
+    """
+    Memento that only stores what changed since an earlier memento.
+    
+    It keeps the money and the fruits gained since its parent memento, and
+    rebuilds the full fruit list by following the chain of parents back to
+    a full Memento. Creating one costs nothing for the fruits that did not
+    change.
+    """
+    
+    __slots__ = ("_parent",)
+    
+    def __init__(self, money: int, parent: Memento):
+        """
+        Initialize a delta memento.
+        This constructor has package-level access (wide interface).
+        
+        Args:
+            money (int): The amount of money to store
+            parent (Memento): The memento this one adds fruits to
+        """
+        super().__init__(money)
+        self._parent = parent
+    
+    def _get_fruits(self) -> List[str]:
+        """
+        Get the full list of stored fruits.
+        This is part of the wide interface - only accessible to originator.
+        
+        Returns:
+            List[str]: The parent chain's fruits followed by this memento's
+        """
+        deltas = []
+        memento: Optional[Memento] = self
+        while isinstance(memento, DeltaMemento):
+            deltas.append(memento._fruits)
+            memento = memento._parent
+        fruits = memento._fruits.copy()
+        for delta in reversed(deltas):
+            fruits.extend(delta)
+        return fruits
+    
+    def get_parent(self) -> Memento:
+        """
+        Get the memento this one is a delta of.
+        
+        Returns:
+            Memento: The parent memento
+        """
+        return self._parent
@@ -0,0 +1,367 @@
+"""
+Memento Pattern - Memento Store
+Saves mementos to disk, so a long-running game survives a crash.
+
+The store is two files: an append-only log of snapshot records and an
+index with the offset of every record. A record holds the money and one
+code per fruit; the codes refer to a table of fruit names that is stored
+in the first record that needs it (and again, extended, when a new name
+appears). A single snapshot is loaded by looking up its offset,
+memory-mapping the log and decoding that record and its name table.
+
+    log:    header "=4sHxxQ" (b"MLOG", version, log id)
+            records "=IqQ" (record size, money, offset of the record with
+            the name table, 0 for none); a record holding the table then
+            has the name count ("H") and the names ("H" length + UTF-8);
+            then one code per fruit ("B", or "H" with more than 256 names)
+    index:  header "=4sHxxQ" (b"MIDX", version, log id), then one "Q"
+            offset per record
+
+Records are written to the log before their offsets are added to the
+index. When the store is opened, index entries that point past the end of
+the log are dropped, complete records after the last index entry are
+indexed by walking them (all records, if the index does not have the
+log's id), and a torn record at the end of the log is cut off.
+MementoLog.write() creates a complete store atomically by writing
+temporary files with unique names and renaming them into place.
+"""
+
+import mmap
+import os
+import tempfile
+from array import array
+from struct import Struct
+from typing import Iterable, Iterator, List, Optional
+from game.memento import Memento
+
+
+_MAGIC = b"MLOG"
+_INDEX_MAGIC = b"MIDX"
+_VERSION = 1
+_HEADER = Struct("=4sHxxQ")    # magic, version, log id
+_RECORD = Struct("=IqQ")       # record size, money, name table offset
+_LENGTH = Struct("=H")         # name count, name length
+_OFFSET = array("Q").itemsize
+
+
+def _typecode(name_count: int) -> str:
+    """Array type code of the fruit codes for a name table of this size."""
+    return "B" if name_count <= 256 else "H"
+
+
+class MementoLog:
+    """
+    Append-only file of mementos, numbered in the order they were appended.
+
+    Usage:
+        with MementoLog("game.mlog") as log:
+            number = log.append(gamer.create_memento())
+        ...
+        with MementoLog("game.mlog") as log:
+            gamer.restore_memento(log.load(number))
+    """
+
+    def __init__(self, path: str, sync_every: int = 1024):
+        """
+        Open a store, creating it if it does not exist.
+
+        Args:
+            path (str): Path of the log file (the index is path + ".idx")
+            sync_every (int): Appended mementos buffered before they are written
+
+        Raises:
+            ValueError: If the file is not a memento log
+        """
+        if sync_every <= 0:
+            raise ValueError("sync_every must be positive")
+        self.path = path
+        self.index_path = path + ".idx"
+        self.sync_every = sync_every
+        self._buffer = bytearray()
+        self._buffered: List[int] = []     # offsets of the buffered records
+        self._map: Optional[mmap.mmap] = None
+        self._tables = {}                  # name table offset -> (names, type code, end)
+        self._open()
+
+    def _open(self) -> None:
+        """Open both files and recover from an interrupted write."""
+        exists = os.path.exists(self.path)
+        self._file = open(self.path, "r+b" if exists else "w+b")
+        header = self._file.read(_HEADER.size) if exists else b""
+        if header:
+            if len(header) < _HEADER.size:
+                raise ValueError(f"{self.path} is not a memento log")
+            magic, version, self._log_id = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{self.path} is not a memento log")
+        else:
+            # A new (or empty) file
+            self._log_id = int.from_bytes(os.urandom(8), "little")
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION, self._log_id))
+        size = self._file.seek(0, os.SEEK_END)
+
+        self._index = array("Q")
+        valid = self._read_index()
+        index = self._index
+        # Drop entries of records that are not complete in the log
+        while index and (index[-1] + _RECORD.size > size
+                         or index[-1] + self._record_size(index[-1]) > size):
+            index.pop()
+            valid = False
+        end = index[-1] + self._record_size(index[-1]) if index else _HEADER.size
+        # Index complete records written after the last index entry
+        while end + _RECORD.size <= size:
+            record_size = self._record_size(end)
+            if record_size < _RECORD.size or end + record_size > size:
+                break
+            index.append(end)
+            end += record_size
+            valid = False
+        if end < size:
+            # A torn record at the end of the log
+            self._file.truncate(end)
+        self._size = end
+        if not valid:
+            self._rewrite_index()
+        self._index_file = open(self.index_path, "ab")
+        # Continue with the name table of the last record
+        self._table_offset = 0
+        names: List[str] = []
+        if index:
+            self._table_offset = _RECORD.unpack_from(self._mapped(), index[-1])[2]
+            names = self._get_table(self._mapped(), self._table_offset)[0]
+        self._names = {name: code for code, name in enumerate(names)}
+
+    def _record_size(self, offset: int) -> int:
+        """Read the size of the record at offset."""
+        self._file.seek(offset)
+        return _RECORD.unpack(self._file.read(_RECORD.size))[0]
+
+    def _read_index(self) -> bool:
+        """Load the index file; return False if it must be rewritten."""
+        try:
+            with open(self.index_path, "rb") as index_file:
+                header = index_file.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return False
+                magic, version, log_id = _HEADER.unpack(header)
+                if magic != _INDEX_MAGIC or version != _VERSION or log_id != self._log_id:
+                    return False
+                data = index_file.read()
+        except FileNotFoundError:
+            return False
+        whole = len(data) - len(data) % _OFFSET
+        self._index.frombytes(data[:whole])
+        return whole == len(data)
+
+    def _rewrite_index(self) -> None:
+        """Write the whole index file."""
+        with open(self.index_path, "wb") as index_file:
+            index_file.write(_HEADER.pack(_INDEX_MAGIC, _VERSION, self._log_id))
+            self._index.tofile(index_file)
+            index_file.flush()
+            os.fsync(index_file.fileno())
+
+    def _append_index(self, start: int) -> None:
+        """Append the index entries from start on to the index file."""
+        self._index_file.write(self._index[start:].tobytes())
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+
+    def _get_table(self, data, table_offset: int):
+        """Get (names, type code, end of the table) of a record's name table."""
+        table = self._tables.get(table_offset)
+        if table is None:
+            names = []
+            position = table_offset + _RECORD.size
+            if table_offset:
+                count, = _LENGTH.unpack_from(data, position)
+                position += _LENGTH.size
+                for _ in range(count):
+                    length, = _LENGTH.unpack_from(data, position)
+                    position += _LENGTH.size
+                    names.append(bytes(data[position:position + length]).decode("utf-8"))
+                    position += length
+            table = self._tables[table_offset] = (names, _typecode(len(names)), position)
+        return table
+
+    def _decode(self, data, offset: int) -> Memento:
+        """Decode the record at offset."""
+        size, money, table_offset = _RECORD.unpack_from(data, offset)
+        names, typecode, end = self._get_table(data, table_offset)
+        codes = array(typecode)
+        codes.frombytes(data[end if table_offset == offset else offset + _RECORD.size:
+                             offset + size])
+        memento = Memento(money)
+        memento.add_fruits(list(map(names.__getitem__, codes)))
+        return memento
+
+    def _encode(self, memento: Memento, offset: int) -> bytes:
+        """Encode a memento as the record at offset."""
+        fruits = memento.get_fruits()
+        names = self._names
+        table = b""
+        try:
+            codes = array(_typecode(len(names)), map(names.__getitem__, fruits))
+        except KeyError:
+            # New fruit names: store an extended name table in this record
+            new_names = [fruit for fruit in dict.fromkeys(fruits) if fruit not in names]
+            if len(names) + len(new_names) > 0xFFFF:
+                raise ValueError("A memento log can hold at most 65535 fruit names")
+            for name in new_names:
+                names[name] = len(names)
+            encoded = [name.encode("utf-8") for name in names]
+            table = _LENGTH.pack(len(encoded)) + b"".join(
+                _LENGTH.pack(len(name)) + name for name in encoded)
+            self._table_offset = offset
+            codes = array(_typecode(len(names)), map(names.__getitem__, fruits))
+        size = _RECORD.size + len(table) + len(codes) * codes.itemsize
+        return (_RECORD.pack(size, memento.get_money(), self._table_offset)
+                + table + codes.tobytes())
+
+    def append(self, memento: Memento) -> int:
+        """
+        Append a memento to the log.
+        It is written when sync_every mementos are buffered, or on flush().
+
+        Args:
+            memento (Memento): The memento to save
+
+        Returns:
+            int: The snapshot number, to pass to load()
+
+        Raises:
+            ValueError: If the log would hold more than 65535 fruit names
+        """
+        offset = self._size + len(self._buffer)
+        self._buffer += self._encode(memento, offset)
+        self._buffered.append(offset)
+        if len(self._buffered) >= self.sync_every:
+            self.flush()
+        return len(self._index) + len(self._buffered) - 1
+
+    def extend(self, mementos: Iterable[Memento]) -> None:
+        """
+        Append several mementos to the log.
+
+        Args:
+            mementos (Iterable[Memento]): The mementos to save
+        """
+        for memento in mementos:
+            self.append(memento)
+
+    def flush(self) -> None:
+        """Write the buffered mementos to disk (log first, then index)."""
+        if not self._buffered:
+            return
+        self._file.seek(self._size)
+        self._file.write(self._buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        start = len(self._index)
+        self._index.extend(self._buffered)
+        self._size += len(self._buffer)
+        self._buffer.clear()
+        self._buffered.clear()
+        self._append_index(start)
+
+    def _mapped(self) -> mmap.mmap:
+        """Get a memory map of the log that covers every written record."""
+        if self._map is None or len(self._map) < self._size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def load(self, number: int) -> Memento:
+        """
+        Load one memento without reading the rest of the log.
+
+        Args:
+            number (int): The snapshot number
+
+        Returns:
+            Memento: The loaded memento
+
+        Raises:
+            IndexError: If there is no such snapshot
+        """
+        if number < 0:
+            number += len(self)
+        if number >= len(self._index):
+            self.flush()
+        if not 0 <= number < len(self._index):
+            raise IndexError(f"Snapshot {number} is not in the log")
+        return self._decode(self._mapped(), self._index[number])
+
+    def __iter__(self) -> Iterator[Memento]:
+        """Load every memento, oldest first."""
+        self.flush()
+        data = self._mapped()
+        for offset in self._index[:]:
+            yield self._decode(data, offset)
+
+    def __len__(self) -> int:
+        """Number of mementos in the log."""
+        return len(self._index) + len(self._buffered)
+
+    def close(self) -> None:
+        """Write the buffered mementos and close the files."""
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._index_file.close()
+            self._file.close()
+
+    @classmethod
+    def write(cls, path: str, mementos: Iterable[Memento]) -> None:
+        """
+        Replace the store at path with the given mementos, atomically.
+        The files are written under temporary names and renamed into place,
+        so a crash leaves either the old store or the new one. (Should the
+        crash fall between the two renames, the index is rebuilt on open.)
+
+        The temporary log gets a unique name from tempfile.mkstemp() (its
+        index is that name + ".idx"), so concurrent writes to the same store
+        never touch each other's files; the last rename wins.
+
+        Args:
+            path (str): Path of the log file
+            mementos (Iterable[Memento]): The mementos to save
+        """
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=name + ".", suffix=".tmp")
+        os.close(fd)
+        temp_paths = (temp_path, temp_path + ".idx")
+        try:
+            log = cls(temp_path, sync_every=65536)
+            try:
+                log.extend(mementos)
+            finally:
+                log.close()
+            for temp, target in zip(temp_paths, (path, path + ".idx")):
+                if os.path.exists(target):
+                    # mkstemp creates the file private; keep the store's permissions
+                    os.chmod(temp, os.stat(target).st_mode & 0o7777)
+            os.replace(temp_path, path)
+            os.replace(temp_path + ".idx", path + ".idx")
+        except BaseException:
+            for temp in temp_paths:
+                if os.path.exists(temp):
+                    os.remove(temp)
+            raise
+
+    def __enter__(self) -> "MementoLog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """String representation of the log."""
+        return f"MementoLog('{self.path}', snapshots={len(self)}, bytes={self._size})"
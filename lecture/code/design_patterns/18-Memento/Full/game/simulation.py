@@ -0,0 +1,284 @@
+"""
+Memento Pattern - Batch Simulation
+Plays a large number of games at once, to estimate what the game in
+main.py ends with, without printing anything.
+
+The games follow the same rules as Gamer.bet() and the same strategy as
+main.py: save a memento when the money increased past the saved amount,
+restore it when the money dropped below half of the saved amount (which
+keeps only the delicious fruits), and stop when the money reaches zero.
+
+Each game is one element of NumPy state arrays, and every round is a few
+array operations on all games of a chunk. The dice are drawn for 17 rounds
+at a time: one 64-bit random number per game holds 17 base-12 digits. Chunks get independent random
+streams (numpy.random.SeedSequence.spawn), so the result for a seed is the
+same however the chunks are spread over worker processes.
+
+All counts are kept as histograms. Money can never exceed the initial money
+plus 100 per round, so the histograms are small, merge exactly, and give
+exact means and percentiles for any number of games.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+STATISTICS = ("money", "fruits", "delicious", "saves", "restores")
+
+# A round needs one draw from 0..11 per game (die and delicious or not).
+# 12 ** 17 < 2 ** 64, so one 64-bit random number holds the draws of 17 rounds.
+_DRAWS_PER_WORD = 17
+_WORD_SPAN = 12 ** _DRAWS_PER_WORD
+
+
+class SimulationResult:
+    """
+    Histograms of how a batch of games ended.
+
+    For every statistic ("money", "fruits", "delicious", "saves",
+    "restores"), histogram[statistic][value] is the number of games that
+    ended with that value.
+    """
+
+    def __init__(self, games: int, rounds: int, histograms: Dict[str, np.ndarray],
+                 busted: int = 0):
+        """
+        Initialize a result.
+
+        Args:
+            games (int): Number of games played
+            rounds (int): Rounds per game
+            histograms (Dict[str, np.ndarray]): One histogram per statistic
+            busted (int): Number of games that stopped because the money reached zero
+        """
+        self.games = games
+        self.rounds = rounds
+        self.histograms = histograms
+        self.busted = busted
+
+    def merge(self, other: "SimulationResult") -> "SimulationResult":
+        """
+        Combine the results of two batches of games.
+
+        Args:
+            other (SimulationResult): Result of games with the same rules
+
+        Returns:
+            SimulationResult: The result of all games of both batches
+        """
+        histograms = {}
+        for statistic in STATISTICS:
+            a, b = self.histograms[statistic], other.histograms[statistic]
+            if len(a) < len(b):
+                a, b = b, a
+            merged = a.copy()
+            merged[:len(b)] += b
+            histograms[statistic] = merged
+        return SimulationResult(self.games + other.games, max(self.rounds, other.rounds),
+                                histograms, self.busted + other.busted)
+
+    def mean(self, statistic: str) -> float:
+        """
+        Get the average of a statistic over all games.
+
+        Args:
+            statistic (str): One of STATISTICS
+
+        Returns:
+            float: The mean value
+        """
+        histogram = self.histograms[statistic]
+        return float(np.dot(np.arange(len(histogram)), histogram) / self.games)
+
+    def std(self, statistic: str) -> float:
+        """
+        Get the standard deviation of a statistic over all games.
+
+        Args:
+            statistic (str): One of STATISTICS
+
+        Returns:
+            float: The standard deviation
+        """
+        histogram = self.histograms[statistic]
+        values = np.arange(len(histogram)) - self.mean(statistic)
+        return float(np.sqrt(np.dot(values * values, histogram) / self.games))
+
+    def percentile(self, statistic: str, q: float) -> int:
+        """
+        Get a percentile of a statistic over all games.
+
+        Args:
+            statistic (str): One of STATISTICS
+            q (float): Percentile between 0 and 100
+
+        Returns:
+            int: The smallest value that at least q percent of the games did not exceed
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        cumulative = np.cumsum(self.histograms[statistic])
+        return int(np.searchsorted(cumulative, max(1, q / 100 * self.games)))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the mean, standard deviation and quartiles of every statistic.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Statistic -> {mean, std, min, p25, median, p75, max}
+        """
+        summary = {}
+        for statistic in STATISTICS:
+            nonzero = np.flatnonzero(self.histograms[statistic])
+            summary[statistic] = {
+                "mean": self.mean(statistic),
+                "std": self.std(statistic),
+                "min": int(nonzero[0]),
+                "p25": self.percentile(statistic, 25),
+                "median": self.percentile(statistic, 50),
+                "p75": self.percentile(statistic, 75),
+                "max": int(nonzero[-1]),
+            }
+        return summary
+
+    def __str__(self) -> str:
+        """Table of the summary statistics."""
+        lines = [f"{self.games:,} games of {self.rounds} rounds "
+                 f"({self.busted:,} ended with no money)",
+                 f"  {'':10} {'mean':>9} {'std':>9} {'min':>6} {'p25':>6} "
+                 f"{'median':>6} {'p75':>6} {'max':>6}"]
+        for statistic, values in self.summary().items():
+            lines.append(f"  {statistic:10} {values['mean']:>9.2f} {values['std']:>9.2f} "
+                         f"{values['min']:>6} {values['p25']:>6} {values['median']:>6} "
+                         f"{values['p75']:>6} {values['max']:>6}")
+        return "\n".join(lines)
+
+
+def _blend(target: np.ndarray, source: np.ndarray, mask: np.ndarray,
+           scratch: np.ndarray) -> None:
+    """Copy source into target where mask is True (in place)."""
+    np.subtract(source, target, out=scratch)
+    scratch *= mask
+    target += scratch
+
+
+def _simulate_chunk(games: int, rounds: int, money: int,
+                    seed: np.random.SeedSequence) -> SimulationResult:
+    """Play one chunk of games with NumPy state arrays."""
+    rng = np.random.default_rng(seed)
+    # Money never exceeds money + 100 * rounds, so 32 bits are enough
+    # whenever the histogram of it fits in memory
+    dtype = np.int32 if money + 100 * rounds < 2 ** 31 else np.int64
+    current = np.full(games, money, dtype=dtype)
+    fruits = np.zeros(games, dtype=np.int32)       # all fruits the gamer holds
+    delicious = np.zeros(games, dtype=np.int32)    # the delicious ones among them
+    saved_money = current.copy()                   # the memento: money and
+    saved_delicious = np.zeros(games, dtype=np.int32)  # delicious fruits only
+    saves = np.zeros(games, dtype=np.int32)
+    restores = np.zeros(games, dtype=np.int32)
+    playing = None                                 # None while every game is playing
+    half = np.empty_like(current)
+    change = np.empty_like(current)
+    words = quotient = draw = np.empty(games, dtype=np.uint64)
+
+    for round_number in range(rounds):
+        # Gamer.bet(): 1 -> +100, 2 -> halved, 6 -> a fruit, delicious half the
+        # time. One draw per game: the die is draw // 2, delicious is draw % 2.
+        if round_number % _DRAWS_PER_WORD == 0:
+            words = rng.integers(0, _WORD_SPAN, size=games, dtype=np.uint64)
+            quotient = np.empty_like(words)
+            draw = np.empty_like(words)
+        np.floor_divide(words, 12, out=quotient)
+        np.multiply(quotient, 12, out=draw)
+        np.subtract(words, draw, out=draw)
+        words, quotient = quotient, words
+        dice = draw.astype(np.uint8)
+        one = dice < 2
+        two = (dice >> 1) == 1
+        fruit = dice >= 10
+        if playing is not None:
+            one &= playing
+            two &= playing
+            fruit &= playing
+        current += one * dtype(100)
+        np.right_shift(current, two, out=current)
+        fruits += fruit
+        delicious += fruit & (dice == 11)
+
+        # main.py: save when richer than the memento, restore when below half
+        # of it. Masked copies are written as x += (y - x) * mask, which is
+        # much faster than masked writes for random masks.
+        save = current > saved_money
+        np.maximum(saved_money, current, out=saved_money)
+        _blend(saved_delicious, delicious, save, change)
+        saves += save
+        np.right_shift(saved_money, 1, out=half)
+        restore = current < half
+        if restore.any():
+            _blend(current, saved_money, restore, change)
+            _blend(fruits, saved_delicious, restore, change)
+            _blend(delicious, saved_delicious, restore, change)
+            restores += restore
+
+        if playing is None:
+            if current.min() <= 0:
+                playing = current > 0
+        else:
+            playing &= current > 0
+            if not playing.any():
+                break
+
+    histograms = {
+        "money": np.bincount(current, minlength=money + 100 * rounds + 1),
+        "fruits": np.bincount(fruits, minlength=rounds + 1),
+        "delicious": np.bincount(delicious, minlength=rounds + 1),
+        "saves": np.bincount(saves, minlength=rounds + 1),
+        "restores": np.bincount(restores, minlength=rounds + 1),
+    }
+    busted = 0 if playing is None else int(games - playing.sum())
+    return SimulationResult(games, rounds, histograms, busted)
+
+
+def simulate_games(games: int, rounds: int = 100, money: int = 100,
+                   seed: Optional[int] = None, chunk_size: int = 1 << 16,
+                   processes: int = 1) -> SimulationResult:
+    """
+    Play many games with the rules and strategy of main.py.
+
+    Args:
+        games (int): Number of games
+        rounds (int): Rounds per game (main.py plays 100)
+        money (int): Initial money of every gamer
+        seed (int, optional): Seed for reproducible results (random if None)
+        chunk_size (int): Games played together in one set of arrays
+        processes (int): Worker processes to spread the chunks over
+
+    Returns:
+        SimulationResult: Histograms of how the games ended
+
+    Raises:
+        ValueError: If a count is not positive or money is negative
+    """
+    if games <= 0 or rounds <= 0 or chunk_size <= 0 or processes <= 0:
+        raise ValueError("games, rounds, chunk_size and processes must be positive")
+    if money < 0:
+        raise ValueError("money must not be negative")
+    sizes = [chunk_size] * (games // chunk_size)
+    if games % chunk_size:
+        sizes.append(games % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = (sizes, [rounds] * len(sizes),
+                 [money] * len(sizes), seeds)
+
+    if processes == 1 or len(sizes) == 1:
+        results: List[SimulationResult] = list(map(_simulate_chunk, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=min(processes, len(sizes))) as executor:
+            results = list(executor.map(_simulate_chunk, *arguments))
+
+    result = results[0]
+    for other in results[1:]:
+        result = result.merge(other)
+    return result
@@ -10,9 +10,13 @@ Key concepts demonstrated:
 4. Originator creates and restores from mementos
 """
 
+import os
+import tempfile
 import time
+from game.caretaker import MementoHistory
 from game.gamer import Gamer
 from game.memento import Memento
+from game.memento_store import MementoLog
 
 
 def main():
@@ -90,6 +94,95 @@ def main():
     print("- Wide interface allows originator full access to memento state")
     print("- Useful for undo/redo functionality, checkpoints, and state management")
 
+    
+    demonstrate_history()
+    demonstrate_persistence()
+    demonstrate_batch_simulation()
+
+
+def demonstrate_history():
+    """
+    Demonstrate a caretaker that keeps a long, bounded history of snapshots.
+    Most snapshots only store what changed since the previous one.
+    """
+    print(f"\n{'='*60}")
+    print("Snapshot History (checkpoints + deltas):")
+    print(f"{'='*60}")
+    
+    gamer = Gamer(100, seed=2024, verbose=False)
+    history = MementoHistory(gamer, checkpoint_every=64, max_bytes=1_000_000)
+    
+    start = time.perf_counter()
+    numbers = []
+    for _ in range(20_000):
+        gamer.bet()
+        numbers.append(history.snapshot())
+    elapsed = time.perf_counter() - start
+    print(f"20,000 rounds with a snapshot after each: {elapsed:.2f}s")
+    print(f"History: {history}")
+    stats = history.get_stats()
+    print(f"Evicted to stay under {history.max_bytes:,} bytes: "
+          f"{stats['evicted_deltas']:,} deltas, {stats['evicted_checkpoints']:,} checkpoints")
+    
+    # Roll back to any snapshot still in the history
+    target = numbers[-100]
+    memento = history.get_memento(target)
+    history.restore(target)
+    print(f"Restored snapshot #{target}: money = {gamer.get_money()}, "
+          f"{len(gamer.fruits)} delicious fruits")
+    print(f"Restored money matches the snapshot: {gamer.get_money() == memento.get_money()}")
+    print(f"Oldest snapshot #{numbers[0]} still restorable: {numbers[0] in history}")
+
+
+
+def demonstrate_persistence():
+    """
+    Demonstrate saving mementos to disk and loading one of them back,
+    as after a crash of a long-running game.
+    """
+    print(f"\n{'='*60}")
+    print("Saving Snapshots to Disk:")
+    print(f"{'='*60}")
+    
+    path = os.path.join(tempfile.mkdtemp(), "game.mlog")
+    gamer = Gamer(100, seed=7, verbose=False)
+    with MementoLog(path) as log:
+        for _ in range(2_000):
+            gamer.bet()
+            log.append(gamer.create_memento())
+        print(f"Saved: {log}")
+    
+    # A new process only needs the file to continue from any snapshot
+    with MementoLog(path) as log:
+        memento = log.load(1_000)
+        restored = Gamer(0, verbose=False)
+        restored.restore_memento(memento)
+        print(f"Loaded snapshot #1000: money = {restored.get_money()}, "
+              f"{len(restored.fruits)} delicious fruits")
+    
+    for name in (path, path + ".idx"):
+        os.remove(name)
+    os.rmdir(os.path.dirname(path))
+
+
+
+def demonstrate_batch_simulation():
+    """
+    Demonstrate estimating how the game ends by playing many games at once
+    (with the same rules and save/restore strategy as above).
+    """
+    from game.simulation import simulate_games
+    
+    print(f"\n{'='*60}")
+    print("Batch Simulation (many games at once, no printing):")
+    print(f"{'='*60}")
+    
+    start = time.perf_counter()
+    result = simulate_games(200_000, rounds=100, seed=2024)
+    elapsed = time.perf_counter() - start
+    print(result)
+    print(f"Played in {elapsed:.2f}s")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,52 @@
+"""
+Monte-Carlo study of the Memento game
+
+Plays many games with the rules and save/restore strategy of main.py using
+the batch simulation in game/simulation.py, and prints how the games ended.
+For comparison it also times playing games one by one with Gamer.
+
+Usage:
+    python3 monte_carlo.py [games] [processes] [seed]
+"""
+
+import os
+import sys
+import time
+
+from game.gamer import Gamer
+from game.simulation import simulate_games
+
+
+def play_one_by_one(games: int, rounds: int = 100) -> float:
+    """Play games with Gamer objects, as main.py does; return games per second."""
+    start = time.perf_counter()
+    for seed in range(games):
+        gamer = Gamer(100, seed=seed, verbose=False)
+        memento = gamer.create_memento()
+        for _ in range(rounds):
+            gamer.bet()
+            if gamer.get_money() > memento.get_money():
+                memento = gamer.create_memento()
+            elif gamer.get_money() < memento.get_money() // 2:
+                gamer.restore_memento(memento)
+            if gamer.get_money() <= 0:
+                break
+    return games / (time.perf_counter() - start)
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 2024
+
+    print(f"Playing {games:,} games in {processes} process(es)...")
+    start = time.perf_counter()
+    result = simulate_games(games, seed=seed, processes=processes)
+    elapsed = time.perf_counter() - start
+    print(result)
+    print(f"\nBatch simulation: {elapsed:.2f}s ({games / elapsed:,.0f} games/sec)")
+    print(f"One Gamer at a time: {play_one_by_one(2_000):,.0f} games/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark for BigCharFactory.get_big_char under many threads
+
+Measures lookups per second for:
+- a factory that takes a lock on every lookup (the previous design,
+  without its prints) vs. the lock-free hit path, on the demo digits
+- a bounded pool over a large packed font (a Unicode banner font of
+  synthetic glyphs), with the hit rate of the CLOCK eviction
+
+Usage:
+    python3 benchmark.py [lookups per thread] [threads]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from big_char import BigChar
+from big_char_factory import BigCharFactory
+from glyph_store import GlyphStore
+
+
+class LockedFactory:
+    """Lookup with a lock on every call, as BigCharFactory used to do."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = {}
+
+    def get_big_char(self, charname: str) -> BigChar:
+        with self._lock:
+            if charname not in self._pool:
+                self._pool[charname] = BigChar(charname)
+            return self._pool[charname]
+
+
+def run_threads(factory, texts) -> float:
+    """Look up every character of texts[i] in thread i; return lookups/s."""
+    barrier = threading.Barrier(len(texts) + 1)
+
+    def worker(text):
+        get_big_char = factory.get_big_char
+        barrier.wait()
+        for char in text:
+            get_big_char(char)
+
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(map(len, texts)) / elapsed
+
+
+def main():
+    lookups = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    rng = random.Random(0)
+    factory = BigCharFactory.get_instance()
+
+    print(f"Demo digits, {lookups:,} lookups per thread (lookups/s):")
+    print(f"  {'threads':>7} {'locked':>12} {'lock-free':>12}")
+    threads = 1
+    while threads <= max_threads:
+        texts = ["".join(rng.choices("0123456789-", k=lookups)) for _ in range(threads)]
+        locked = run_threads(LockedFactory(), texts)
+        lock_free = run_threads(factory, texts)
+        print(f"  {threads:>7} {locked:>12,.0f} {lock_free:>12,.0f}")
+        threads *= 2
+    print(f"  {factory.get_stats()}")
+
+    glyph_count, pool_size = 20_000, 2_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "banner.font")
+        chars = [chr(0x4E00 + i) for i in range(glyph_count)]
+        GlyphStore.pack({char: f"{char}{ord(char):06X}\n" * 8 for char in chars}, path)
+        factory.use_font(path)
+        factory.clear_pool()
+        factory.set_max_size(pool_size)
+        # a skewed workload: a few characters are used far more than the rest
+        weights = [1 / (rank + 1) for rank in range(glyph_count)]
+        texts = ["".join(rng.choices(chars, weights, k=lookups)) for _ in range(max_threads)]
+        print(f"\n{glyph_count:,}-glyph font, pool bounded to {pool_size:,}, "
+              f"{max_threads} threads:")
+        rate = run_threads(factory, texts)
+        stats = factory.get_stats()
+        print(f"  {rate:,.0f} lookups/s, hit rate "
+              f"{stats['hits'] / (stats['hits'] + stats['misses']):.1%}, {stats}")
+        factory.set_max_size(None)
+        factory.use_font(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,33 +5,54 @@ The font data is intrinsic state (shared), while position is extrinsic state.
 """
 
 import os
+from typing import Optional, Tuple
+
+
+FONT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 
 
 class BigChar:
     """
     Concrete flyweight that represents a big ASCII art character.
     Stores the intrinsic state (font data) that can be shared across instances.
+    
+    The font data is also kept split into rows, all padded to the width of
+    the widest one, so strings of big characters can be laid out without
+    parsing the font data again.
     """
     
-    def __init__(self, charname: str):
+    def __init__(self, charname: str, fontdata: Optional[str] = None):
         """
         Initialize a big character by loading its font data from file.
         
         Args:
             charname (str): The character to load (e.g., '0', '1', '-')
+            fontdata (str, optional): Font data already loaded (e.g. from a
+                                      GlyphStore); the file is not read then
         """
         self.charname = charname
+        if fontdata is not None:
+            self.fontdata = fontdata
+        else:
+            self.fontdata = self._load(charname)
         
+        text = self.fontdata[:-1] if self.fontdata.endswith('\n') else self.fontdata
+        rows = text.split('\n')
+        self.width = max(len(row) for row in rows)
+        self.rows: Tuple[str, ...] = tuple(row.ljust(self.width) for row in rows)
+    
+    @staticmethod
+    def _load(charname: str) -> str:
+        """Read the font data of a character from its big{c}.txt file."""
         try:
-            filename = f"big{charname}.txt"
+            filename = os.path.join(FONT_DIRECTORY, f"big{charname}.txt")
             if os.path.exists(filename):
                 with open(filename, 'r', encoding='utf-8') as f:
-                    self.fontdata = f.read()
-            else:
-                # Fallback if file doesn't exist
-                self.fontdata = f"{charname}?\n"
+                    return f.read()
+            # Fallback if file doesn't exist
+            return f"{charname}?\n"
         except IOError:
-            self.fontdata = f"{charname}?\n"
+            return f"{charname}?\n"
     
     def print(self):
         """
@@ -49,6 +70,15 @@ class BigChar:
         """
         return self.fontdata
     
+    def get_height(self) -> int:
+        """
+        Get the number of rows of this character.
+        
+        Returns:
+            int: Number of rows in the font data
+        """
+        return len(self.rows)
+    
     def __str__(self) -> str:
         """String representation of the big character."""
         return f"BigChar('{self.charname}')"
@@ -2,84 +2,191 @@
 Flyweight Pattern - BigCharFactory (Flyweight Factory)
 This class manages and provides shared BigChar flyweight instances.
 Ensures that flyweights are shared properly to save memory.
+
+Font data comes from the packed font big.font (see glyph_store.py) when it
+exists, and from the big{c}.txt files otherwise (also for characters that
+are not in big.font).
 """
 
+import os
 import threading
-from typing import Dict
-from big_char import BigChar
+from typing import Dict, Optional
+from big_char import BigChar, FONT_DIRECTORY
+from glyph_store import GlyphStore
+
+
+DEFAULT_FONT = os.path.join(FONT_DIRECTORY, "big.font")
 
 
 class BigCharFactory:
     """
     Flyweight factory that manages the creation and sharing of BigChar instances.
     Implements the Singleton pattern to ensure only one factory exists.
+
+    Looking up a character that is already in the pool does not take the
+    lock; only creating a BigChar does. The pool can be bounded for large
+    glyph sets (max_size); it then evicts characters that have not been
+    used recently, using the CLOCK (second chance) approximation of LRU so
+    that lookups never have to reorder the pool.
     """
-    
+
     _instance = None
     _lock = threading.Lock()
-    
+
     def __new__(cls):
         """Implement thread-safe singleton pattern."""
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._pool: Dict[str, BigChar] = {}
+                    instance = super().__new__(cls)
+                    instance._pool: Dict[str, BigChar] = {}
+                    instance._referenced = set()  # used since the clock last passed
+                    instance._max_size = None
+                    instance._store = GlyphStore(DEFAULT_FONT) if os.path.exists(DEFAULT_FONT) else None
+                    instance._local = threading.local()
+                    instance._hit_counters = []  # one [hits] list per thread
+                    instance.misses = 0
+                    instance.evictions = 0
+                    cls._instance = instance
         return cls._instance
-    
+
     @classmethod
     def get_instance(cls) -> 'BigCharFactory':
         """
         Get the singleton instance of the factory.
-        
+
         Returns:
             BigCharFactory: The singleton factory instance
         """
         if cls._instance is None:
             cls._instance = cls()
         return cls._instance
-    
+
+    def use_font(self, path: Optional[str]):
+        """
+        Load font data from another packed font and empty the pool.
+
+        Args:
+            path (str, optional): The font file, or None to read the
+                                  big{c}.txt files
+        """
+        with self._lock:
+            self._store = GlyphStore(path) if path is not None else None
+            self._pool.clear()
+            self._referenced.clear()
+
+    def set_max_size(self, max_size: Optional[int]):
+        """
+        Bound the number of BigChar instances kept in the pool.
+
+        Args:
+            max_size (int, optional): Maximum pool size, or None for no limit
+        """
+        if max_size is not None and max_size <= 0:
+            raise ValueError("Pool size must be positive")
+        with self._lock:
+            self._max_size = max_size
+            while max_size is not None and len(self._pool) > max_size:
+                self._evict()
+
     def get_big_char(self, charname: str) -> BigChar:
         """
         Get a BigChar flyweight instance for the specified character.
         Creates new instances only if they don't already exist in the pool.
-        
+
         Args:
             charname (str): The character to get (e.g., '0', '1', '-')
-            
+
         Returns:
             BigChar: A shared BigChar instance
         """
+        big_char = self._pool.get(charname)
+        if big_char is not None:
+            try:
+                self._local.hits[0] += 1
+            except AttributeError:
+                self._add_hit_counter()
+            if self._max_size is not None:
+                self._referenced.add(charname)
+            return big_char
+
         with self._lock:
-            if charname not in self._pool:
-                # Create new BigChar only if it doesn't exist
-                print(f"Creating new BigChar for '{charname}'")
-                self._pool[charname] = BigChar(charname)
+            big_char = self._pool.get(charname)
+            if big_char is None:
+                # Create new BigChar only if it doesn't exist; characters
+                # missing from the packed font are read from big{c}.txt
+                fontdata = self._store.get(charname) if self._store is not None else None
+                big_char = BigChar(charname, fontdata)
+                if self._max_size is not None and len(self._pool) >= self._max_size:
+                    self._evict()
+                self._pool[charname] = big_char
+                self.misses += 1
+            return big_char
+
+    def _add_hit_counter(self):
+        """Create the hit counter of the current thread, counting one hit."""
+        self._local.hits = [1]
+        with self._lock:
+            self._hit_counters.append(self._local.hits)
+
+    def _evict(self):
+        """Remove one BigChar from the pool (called with the lock held)."""
+        pool = self._pool
+        referenced = self._referenced
+        # after one full turn of the clock, evict even a referenced character
+        chances = len(pool)
+        while True:
+            charname = next(iter(pool))
+            if charname in referenced and chances > 0:
+                chances -= 1
+                # second chance: move it to the back of the clock
+                referenced.discard(charname)
+                pool[charname] = pool.pop(charname)
             else:
-                print(f"Reusing existing BigChar for '{charname}'")
-            
-            return self._pool[charname]
-    
+                del pool[charname]
+                self.evictions += 1
+                return
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from the pool."""
+        return sum(counter[0] for counter in self._hit_counters)
+
+    def get_stats(self) -> dict:
+        """
+        Get the lookup counters.
+
+        Returns:
+            dict: hits, misses, evictions and pool size
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "size": len(self._pool)}
+
     def get_pool_size(self) -> int:
         """
         Get the number of flyweight instances in the pool.
-        
+
         Returns:
             int: Number of cached BigChar instances
         """
         return len(self._pool)
-    
+
     def get_cached_characters(self) -> list:
         """
         Get list of characters that are cached in the pool.
-        
+
         Returns:
             list: List of cached character names
         """
         return list(self._pool.keys())
-    
+
     def clear_pool(self):
-        """Clear the flyweight pool (for testing purposes)."""
+        """Clear the flyweight pool and its counters (for testing purposes)."""
         with self._lock:
             self._pool.clear()
+            self._referenced.clear()
+            for counter in self._hit_counters:
+                counter[0] = 0
+            self.misses = 0
+            self.evictions = 0
             print("Flyweight pool cleared")
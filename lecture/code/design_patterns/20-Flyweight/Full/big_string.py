@@ -4,7 +4,7 @@ This class uses BigChar flyweights to represent a string of big characters.
 It demonstrates how flyweights can be used in different contexts.
 """
 
-from typing import List
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 from big_char import BigChar
 from big_char_factory import BigCharFactory
 
@@ -38,8 +38,7 @@ class BigString:
         while intrinsic state (font data) is shared.
         """
         # For ASCII art, we need to print line by line
-        lines = self._get_lines()
-        for line in lines:
+        for line in self.iter_lines():
             print(line)
     
     def _get_lines(self) -> List[str]:
@@ -49,32 +48,85 @@ class BigString:
         Returns:
             List[str]: List of lines that make up the complete big string
         """
-        if not self.bigchars:
-            return []
+        return list(self.iter_lines())
+    
+    @staticmethod
+    def _columns(bigchars: List[BigChar]) -> List[Tuple[str, ...]]:
+        """
+        Get the rows of each character, padded to the same height.
         
-        # Split each character's font data into lines
-        char_lines = []
-        for big_char in self.bigchars:
-            fontdata = big_char.get_fontdata()
-            lines = fontdata.split('\n')
-            char_lines.append(lines)
+        Args:
+            bigchars (List[BigChar]): The characters to lay out
+            
+        Returns:
+            List[Tuple[str, ...]]: The rows of each character, in order
+        """
+        unique = set(bigchars)
+        height = max(big_char.get_height() for big_char in unique)
+        padded: Dict[BigChar, Tuple[str, ...]] = {}
+        for big_char in unique:
+            # Pad with blank rows if character has fewer lines
+            blank = (" " * big_char.width,) * (height - big_char.get_height())
+            padded[big_char] = big_char.rows + blank
+        return [padded[big_char] for big_char in bigchars]
+    
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Generate the lines of the big string one at a time.
         
-        # Find the maximum number of lines
-        max_lines = max(len(lines) for lines in char_lines) if char_lines else 0
+        Yields:
+            str: Each line of the big string, without trailing whitespace
+        """
+        if not self.bigchars:
+            return
+        for row in zip(*self._columns(self.bigchars)):
+            yield ''.join(row).rstrip()
+    
+    def render(self) -> str:
+        """
+        Get the whole big string as text.
         
-        # Combine lines horizontally
-        result_lines = []
-        for line_num in range(max_lines):
-            combined_line = ""
-            for char_line_list in char_lines:
-                if line_num < len(char_line_list):
-                    combined_line += char_line_list[line_num]
-                else:
-                    # Pad with spaces if character has fewer lines
-                    combined_line += " " * 16  # Assuming each char is 16 wide
-            result_lines.append(combined_line.rstrip())
+        Returns:
+            str: The lines of the big string, separated by newlines
+        """
+        return '\n'.join(self.iter_lines())
+    
+    def write_to(self, file: TextIO, chars_per_line: Optional[int] = None,
+                 chunk_size: int = 4096):
+        """
+        Write the big string to a file without building it in memory.
+        
+        Each line is written in pieces of chunk_size characters, so memory
+        use does not grow with the length of the string (e.g. a long log
+        ticker). With chars_per_line, the string is broken into several
+        banners of that many characters, written one below the other.
         
-        return result_lines
+        Args:
+            file (TextIO): The file to write to
+            chars_per_line (int, optional): Characters per banner
+            chunk_size (int): Characters joined per write
+        """
+        if chars_per_line is not None and chars_per_line <= 0:
+            raise ValueError("chars_per_line must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        step = chars_per_line or max(len(self.bigchars), 1)
+        for start in range(0, len(self.bigchars), step):
+            columns = self._columns(self.bigchars[start:start + step])
+            for row in range(len(columns[0])):
+                # Trailing whitespace is held back until we know it is not
+                # at the end of the line
+                pending = ''
+                for chunk in range(0, len(columns), chunk_size):
+                    text = ''.join([rows[row] for rows in columns[chunk:chunk + chunk_size]])
+                    stripped = text.rstrip()
+                    if stripped:
+                        file.write(pending)
+                        file.write(stripped)
+                        pending = text[len(stripped):]
+                    else:
+                        pending += text
+                file.write('\n')
     
     def get_string(self) -> str:
         """
@@ -0,0 +1,163 @@
+"""
+Flyweight Pattern - Glyph Store
+A packed font file holding the ASCII art of many characters, so the
+factory does not have to open one big{c}.txt file per character.
+
+The file is mapped into memory once; a glyph is only decoded when its
+BigChar is created. Lookups use a binary search over a sorted index of
+code points, so a store can hold anything from the 11 demo digits to a
+full Unicode banner font.
+
+File layout (native byte order, 4-byte unsigned integers):
+    header:  magic, version, glyph count
+    index:   code points (sorted), then data offsets, then data lengths
+    data:    UTF-8 glyph texts
+
+Usage:
+    GlyphStore.pack_directory(".", "big.font")   # or: python3 glyph_store.py
+    store = GlyphStore("big.font")
+    fontdata = store.get("7")
+"""
+
+import glob
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from typing import Dict, Optional
+
+
+FONT_MAGIC = b"BIGF"
+FONT_VERSION = 1
+
+_HEADER = struct.Struct("=4sII")
+
+
+class GlyphStore:
+    """
+    Read-only, memory-mapped glyph font.
+    Safe to share between threads: lookups never modify the store.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a packed font file.
+
+        Args:
+            path (str): The font file
+
+        Raises:
+            ValueError: If the file is not a packed font
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._data) < _HEADER.size:
+            raise ValueError(f"{path} is not a packed font")
+        magic, version, count = _HEADER.unpack_from(self._data)
+        if magic != FONT_MAGIC or version != FONT_VERSION:
+            raise ValueError(f"{path} is not a packed font")
+        index = memoryview(self._data)[_HEADER.size:_HEADER.size + 12 * count].cast("I")
+        self._codepoints = index[:count]
+        self._offsets = index[count:2 * count]
+        self._lengths = index[2 * count:]
+        self._count = count
+
+    def get(self, charname: str) -> Optional[str]:
+        """
+        Get the font data of a character.
+
+        Args:
+            charname (str): The character
+
+        Returns:
+            str: The ASCII art of the character, or None if it is not in the font
+        """
+        if len(charname) != 1:
+            return None
+        codepoint = ord(charname)
+        i = bisect_left(self._codepoints, codepoint)
+        if i == self._count or self._codepoints[i] != codepoint:
+            return None
+        offset = self._offsets[i]
+        return self._data[offset:offset + self._lengths[i]].decode("utf-8")
+
+    def __contains__(self, charname: str) -> bool:
+        """Check whether a character is in the font."""
+        return self.get(charname) is not None
+
+    def __len__(self) -> int:
+        """Number of glyphs in the font."""
+        return self._count
+
+    def __str__(self) -> str:
+        """String representation of the store."""
+        return f"GlyphStore('{self.path}', glyphs={self._count})"
+
+    @staticmethod
+    def pack(glyphs: Dict[str, str], path: str):
+        """
+        Write a packed font file.
+
+        The file is written to a new temporary file next to path, synced
+        and renamed, so an open store never sees a partial file and two
+        writers never share a temporary file.
+
+        Args:
+            glyphs (Dict[str, str]): Font data by character
+            path (str): The font file to write
+        """
+        chars = sorted(glyphs, key=ord)
+        encoded = [glyphs[char].encode("utf-8") for char in chars]
+        count = len(chars)
+        offset = _HEADER.size + 12 * count
+        offsets = []
+        for data in encoded:
+            offsets.append(offset)
+            offset += len(data)
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if os.path.exists(path):
+                    # mkstemp creates the file private; keep the font's permissions
+                    os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+                f.write(_HEADER.pack(FONT_MAGIC, FONT_VERSION, count))
+                f.write(struct.pack(f"={count}I", *map(ord, chars)))
+                f.write(struct.pack(f"={count}I", *offsets))
+                f.write(struct.pack(f"={count}I", *map(len, encoded)))
+                f.write(b"".join(encoded))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def pack_directory(cls, directory: str, path: str) -> int:
+        """
+        Pack the big{c}.txt files of a directory into a font file.
+
+        Args:
+            directory (str): Directory with the big{c}.txt files
+            path (str): The font file to write
+
+        Returns:
+            int: Number of glyphs packed
+        """
+        glyphs = {}
+        for filename in glob.glob(os.path.join(directory, "big?.txt")):
+            char = os.path.basename(filename)[3]
+            with open(filename, "r", encoding="utf-8") as f:
+                glyphs[char] = f.read()
+        cls.pack(glyphs, path)
+        return len(glyphs)
+
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    count = GlyphStore.pack_directory(here, os.path.join(here, "big.font"))
+    print(f"Packed {count} glyphs into big.font")
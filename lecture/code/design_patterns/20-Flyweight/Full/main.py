@@ -11,6 +11,7 @@ Key concepts demonstrated:
 """
 
 import sys
+import tempfile
 from big_string import BigString
 from big_char_factory import BigCharFactory
 
@@ -29,8 +30,8 @@ def demonstrate_memory_efficiency():
     
     print("Creating multiple BigString objects...")
     for string in strings:
-        print(f"\nCreating BigString for '{string}':")
         big_string = BigString(string)
+        print(f"- BigString for '{string}': {factory.get_pool_size()} BigChar instances in the pool")
         big_strings.append(big_string)
     
     print(f"\nFlyweight Pool Statistics:")
@@ -38,10 +39,28 @@ def demonstrate_memory_efficiency():
     print(f"- Cached characters: {factory.get_cached_characters()}")
     print(f"- Total character usages across all strings: {sum(len(s.get_string()) for s in big_strings)}")
     print(f"- Memory savings: {sum(len(s.get_string()) for s in big_strings) - factory.get_pool_size()} instances reused")
+    stats = factory.get_stats()
+    print(f"- Lookups: {stats['hits']} hits, {stats['misses']} misses")
     
     return big_strings
 
 
+def demonstrate_streaming():
+    """
+    Demonstrate writing a big string to a file a row at a time.
+    """
+    print("=== Streaming Output ===")
+    
+    print("\nA ticker broken into banners of 6 characters:")
+    BigString("0123456789-9876").write_to(sys.stdout, chars_per_line=6)
+    
+    ticker = BigString("0123456789-" * 20000)
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as f:
+        ticker.write_to(f)
+        print(f"\nStreamed a {ticker.get_char_count():,}-character ticker: "
+              f"{f.tell() / 1e6:.1f} MB written")
+
+
 def main():
     """
     Main function that demonstrates the Flyweight pattern.
@@ -76,6 +95,8 @@ def main():
     # Demonstrate memory efficiency with multiple strings
     print("\n")
     demonstrate_memory_efficiency()
+    print("\n")
+    demonstrate_streaming()
     
     print(f"\n{'='*60}")
     print("Flyweight Pattern Benefits Demonstrated:")
@@ -0,0 +1,243 @@
+"""
+Proxy Pattern - Batching Proxy
+A proxy in front of a slow (e.g. remote) printer that collects print()
+calls and sends them to the real printer in batches.
+
+print() only adds the string to a buffer and returns. A background writer
+thread sends the buffer to the real printer with one print_batch() call
+when it holds batch_size strings, or flush_interval seconds after the
+first string was added, whichever comes first. Strings are printed in the
+order print() was called.
+
+The proxy also caches the results of render(), which are the same every
+time for the same string and printer name.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+from printable import Printable
+
+
+class BatchingPrinterProxy(Printable):
+    """
+    Proxy that batches print() calls to the real printer.
+
+    Usage:
+        with BatchingPrinterProxy(remote_printer) as printer:
+            for line in lines:
+                printer.print(line)
+        # everything has been printed here
+    """
+
+    def __init__(self, real: Printable, batch_size: int = 1000,
+                 flush_interval: float = 0.05, cache_size: int = 1024):
+        """
+        Initialize the proxy and start its writer thread.
+
+        Args:
+            real (Printable): The printer to send the batches to
+            batch_size (int): Strings sent per batch
+            flush_interval (float): Longest time (seconds) a string waits in the buffer
+            cache_size (int): Number of render() results kept
+        """
+        if batch_size <= 0 or cache_size <= 0:
+            raise ValueError("batch_size and cache_size must be positive")
+        self.real = real
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = batch_size * 8  # print() waits when the writer falls behind
+        self._buffer: List[str] = []
+        self._first_time = 0.0             # when the oldest buffered string was added
+        self._cond = threading.Condition()
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self.batches = 0
+        self.prints = 0
+        # render cache
+        self._cache_size = cache_size
+        self._render_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._writer = threading.Thread(target=self._write_batches, daemon=True,
+                                        name="printer-batch-writer")
+        self._writer.start()
+
+    def set_printer_name(self, name: str):
+        """
+        Set the printer name.
+        Strings printed before are printed with the old name first.
+
+        Args:
+            name (str): The printer name to set
+        """
+        self.flush()
+        self.real.set_printer_name(name)
+        with self._cache_lock:
+            self._render_cache.clear()
+
+    def get_printer_name(self) -> str:
+        """
+        Get the printer name.
+
+        Returns:
+            str: The current printer name
+        """
+        return self.real.get_printer_name()
+
+    def print(self, string: str):
+        """
+        Add a string to the next batch.
+
+        Args:
+            string (str): The string to print
+
+        Raises:
+            RuntimeError: If the proxy is closed or a batch failed
+        """
+        with self._cond:
+            self._check()
+            while len(self._buffer) >= self.max_pending:
+                self._cond.wait()
+                self._check()
+            buffer = self._buffer
+            buffer.append(string)
+            if len(buffer) == 1:
+                self._first_time = time.monotonic()
+                self._cond.notify_all()
+            elif len(buffer) == self.batch_size:
+                self._cond.notify_all()
+
+    def print_batch(self, strings: List[str]):
+        """
+        Add several strings to the next batches.
+
+        Args:
+            strings (List[str]): The strings to print
+        """
+        for string in strings:
+            self.print(string)
+
+    def render(self, string: str) -> str:
+        """
+        Get the text the real printer prints for a string (cached).
+
+        Args:
+            string (str): The string to print
+
+        Returns:
+            str: The rendered text
+        """
+        cache = self._render_cache
+        with self._cache_lock:
+            text = cache.get(string)
+            if text is not None:
+                cache.move_to_end(string)
+                self.cache_hits += 1
+                return text
+        text = self.real.render(string)
+        with self._cache_lock:
+            self.cache_misses += 1
+            cache[string] = text
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return text
+
+    def flush(self):
+        """
+        Wait until every string printed so far has been sent to the real printer.
+
+        Raises:
+            RuntimeError: If a batch failed
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while (self._buffer or self._writing) and self._error is None:
+                self._cond.wait()
+            self._flush_requested = False
+            if self._error is not None:
+                raise RuntimeError("Printing a batch failed") from self._error
+
+    def close(self):
+        """Print the remaining strings and stop the writer thread."""
+        with self._cond:
+            if self._closed:
+                return
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            self._writer.join()
+
+    def _check(self):
+        """Raise if the proxy cannot print (called with the condition held)."""
+        if self._closed:
+            raise RuntimeError("BatchingPrinterProxy is closed")
+        if self._error is not None:
+            raise RuntimeError("Printing a batch failed") from self._error
+
+    def _write_batches(self):
+        """Writer thread: send the buffered strings to the real printer."""
+        cond = self._cond
+        while True:
+            with cond:
+                while not self._buffer and not self._closed:
+                    cond.wait()
+                if not self._buffer:
+                    return
+                # Wait for a full batch, but not longer than flush_interval
+                deadline = self._first_time + self.flush_interval
+                while (len(self._buffer) < self.batch_size and not self._flush_requested
+                       and not self._closed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                if self._buffer:
+                    self._first_time = time.monotonic()
+                self._writing = True
+                cond.notify_all()  # wake print() calls waiting for room
+            try:
+                self.real.print_batch(batch)
+            except BaseException as e:
+                with cond:
+                    self._error = e
+                    self._writing = False
+                    self._buffer.clear()
+                    cond.notify_all()
+                return
+            with cond:
+                self._writing = False
+                self.batches += 1
+                self.prints += len(batch)
+                cond.notify_all()
+
+    def get_stats(self) -> dict:
+        """
+        Get the proxy counters.
+
+        Returns:
+            dict: prints, batches, cache_hits and cache_misses
+        """
+        return {"prints": self.prints, "batches": self.batches,
+                "cache_hits": self.cache_hits, "cache_misses": self.cache_misses}
+
+    def __enter__(self) -> "BatchingPrinterProxy":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self) -> str:
+        """String representation of the proxy."""
+        return (f"BatchingPrinterProxy(name='{self.get_printer_name()}', "
+                f"pending={len(self._buffer)}, batches={self.batches})")
@@ -0,0 +1,94 @@
+"""
+Benchmark for printing many small strings through proxies
+
+A local stand-in for a slow remote printer charges a fixed latency per
+call (a network round trip), whether the call prints one string or a whole
+batch. The benchmark prints the same strings through:
+- the PrinterProxy, one call to the printer per string
+- the BatchingPrinterProxy, which sends batches from a writer thread
+and checks that both print exactly the same text.
+
+Usage:
+    python3 benchmark.py [prints] [latency in microseconds]
+"""
+
+import sys
+import time
+
+from batching_printer_proxy import BatchingPrinterProxy
+from printable import Printable
+from printer_proxy import PrinterProxy
+
+
+class RemotePrinter(Printable):
+    """Printer that waits `latency` seconds per call and keeps what it printed."""
+
+    def __init__(self, name: str = "Remote", latency: float = 20e-6):
+        self.name = name
+        self.latency = latency
+        self.calls = 0
+        self.output = []
+
+    def set_printer_name(self, name: str):
+        self.name = name
+
+    def get_printer_name(self) -> str:
+        return self.name
+
+    def _round_trip(self):
+        # busy wait: time.sleep() cannot wait for only a few microseconds
+        end = time.perf_counter() + self.latency
+        self.calls += 1
+        while time.perf_counter() < end:
+            pass
+
+    def print(self, string: str):
+        self._round_trip()
+        self.output.append(self.render(string))
+
+    def print_batch(self, strings):
+        self._round_trip()
+        self.output.append(''.join(map(self.render, strings)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) * 1e-6
+    strings = [f"line {i % 1000}" for i in range(count)]
+    print(f"{count:,} prints, {latency * 1e6:.0f} us per call to the printer")
+
+    remote = RemotePrinter(latency=latency)
+    proxy = PrinterProxy("Remote")
+    proxy.real = remote  # use the remote stand-in as the real printer
+    start = time.perf_counter()
+    for string in strings:
+        proxy.print(string)
+    direct_time = time.perf_counter() - start
+    print(f"  PrinterProxy:         {direct_time:7.2f} s, {count / direct_time:12,.0f} prints/s, "
+          f"{remote.calls:,} calls")
+    expected = ''.join(remote.output)
+
+    for batch_size in (100, 1000, 10000):
+        remote = RemotePrinter(latency=latency)
+        start = time.perf_counter()
+        with BatchingPrinterProxy(remote, batch_size=batch_size) as batching:
+            for string in strings:
+                batching.print(string)
+        batched_time = time.perf_counter() - start
+        assert ''.join(remote.output) == expected
+        print(f"  Batching, {batch_size:>5}/batch: {batched_time:7.2f} s, "
+              f"{count / batched_time:12,.0f} prints/s, {remote.calls:,} calls")
+
+    remote = RemotePrinter(latency=latency)
+    with BatchingPrinterProxy(remote) as batching:
+        start = time.perf_counter()
+        for string in strings:
+            batching.render(string)
+        render_time = time.perf_counter() - start
+        stats = batching.get_stats()
+    print(f"  Cached render():      {render_time:7.2f} s, "
+          f"{stats['cache_hits']:,} hits, {stats['cache_misses']:,} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,11 @@ Key concepts demonstrated:
 4. Performance optimization - avoid expensive operations until necessary
 """
 
+import asyncio
 import time
-from printer_proxy import PrinterProxy
+from printer_proxy import PrinterProxy, WARM_UP_ON_CREATE
+from printer_pool import PrinterPool
+from batching_printer_proxy import BatchingPrinterProxy
 from printer import Printer
 
 
@@ -75,6 +78,69 @@ def compare_direct_vs_proxy():
     proxy_printer.print("Message from proxy printer")
 
 
+def demonstrate_warm_up_and_pool():
+    """
+    Demonstrate background warm-up, a shared printer pool and async printing.
+    """
+    print("\n=== Background Warm-up and Printer Pool ===")
+    
+    pool = PrinterPool(max_size=3, max_workers=3)
+    
+    print("\n1. Creating a warming-up proxy, then doing other work for 1 second...")
+    proxy = PrinterProxy("WarmPrinter", pool=pool, warm_up=WARM_UP_ON_CREATE)
+    print(f"   Proxy status: {proxy}")
+    time.sleep(1.0)
+    start_time = time.time()
+    proxy.print("Printed without waiting for the whole creation")
+    print(f"   First print() took {time.time() - start_time:.3f} seconds")
+    
+    print("\n2. A second proxy with the same name reuses the pooled printer...")
+    start_time = time.time()
+    other = PrinterProxy("WarmPrinter", pool=pool)
+    other.print("Printed by the shared printer")
+    print(f"   First print() took {time.time() - start_time:.3f} seconds")
+    print(f"   {pool}")
+    
+    print("\n3. Printing from asyncio code to three new printers at once...")
+    
+    async def print_all(proxies):
+        await asyncio.gather(*(p.print_async(f"Hello from {p.get_printer_name()}")
+                               for p in proxies))
+    
+    proxies = [PrinterProxy(f"AsyncPrinter{i}", pool=pool) for i in range(3)]
+    start_time = time.time()
+    asyncio.run(print_all(proxies))
+    print(f"   All three printed in {time.time() - start_time:.3f} seconds")
+    print(f"   {pool}")
+    
+    print("\n4. Timing metrics (seconds):")
+    for p in [proxy, other] + proxies:
+        metrics = p.get_metrics()
+        print(f"   {p.get_printer_name():<14} waited {metrics['realize_wait']:.3f}, "
+              f"printing {metrics['print_time']:.6f} ({metrics['prints']} prints)")
+    pool.shutdown()
+
+
+def demonstrate_batching():
+    """
+    Demonstrate a batching proxy in front of another (lazy) proxy.
+    """
+    print("\n=== Batching Proxy ===")
+    
+    print("\n1. Printing 5 strings through a batching proxy...")
+    start_time = time.time()
+    batching = BatchingPrinterProxy(PrinterProxy("BatchPrinter"), batch_size=100)
+    for i in range(5):
+        batching.print(f"Batched line {i + 1}")
+    print(f"   print() calls returned after {time.time() - start_time:.3f} seconds")
+    print("   (the writer thread creates the real printer and prints them)")
+    
+    print("\n2. Waiting for the batch to be printed...")
+    batching.close()
+    print(f"   Printed after {time.time() - start_time:.3f} seconds")
+    print(f"   Stats: {batching.get_stats()}")
+
+
 def main():
     """
     Main function that demonstrates the Proxy pattern.
@@ -113,6 +179,12 @@ def main():
     print("\n" + "="*60)
     compare_direct_vs_proxy()
     
+    print("\n" + "="*60)
+    demonstrate_warm_up_and_pool()
+    
+    print("\n" + "="*60)
+    demonstrate_batching()
+    
     print(f"\n{'='*60}")
     print("Proxy Pattern Benefits Demonstrated:")
     print(f"{'='*60}")
@@ -127,6 +199,7 @@ def main():
     print("- Protection Proxy: Access control and security")
     print("- Remote Proxy: Represent objects in different address spaces")
     print("- Cache Proxy: Add caching functionality")
+    print("- Batching Proxy: Group many small calls to a slow (remote) object")
     print("- Smart Reference: Additional functionality like reference counting")
     
     print("\nKey Points:")
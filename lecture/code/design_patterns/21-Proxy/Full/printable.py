@@ -4,6 +4,7 @@ This interface defines the common interface for both the real subject and proxy.
 """
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class Printable(ABC):
@@ -41,3 +42,26 @@ class Printable(ABC):
             string (str): The string to print
         """
         pass
+    
+    def print_batch(self, strings: List[str]):
+        """
+        Print several strings, in order.
+        Subclasses can override this to print a whole batch in one call.
+        
+        Args:
+            strings (List[str]): The strings to print
+        """
+        for string in strings:
+            self.print(string)
+    
+    def render(self, string: str) -> str:
+        """
+        Get the text that print() writes for a string.
+        
+        Args:
+            string (str): The string to print
+            
+        Returns:
+            str: The string with the printer's name header
+        """
+        return f"=== {self.get_printer_name()} ===\n{string}\n"
@@ -4,7 +4,9 @@ This class represents the real object that does the actual work.
 It has expensive initialization that we want to defer.
 """
 
+import sys
 import time
+from typing import List
 from printable import Printable
 
 
@@ -49,8 +51,16 @@ class Printer(Printable):
         Args:
             string (str): The string to print
         """
-        print(f"=== {self.name} ===")
-        print(string)
+        sys.stdout.write(self.render(string))
+    
+    def print_batch(self, strings: List[str]):
+        """
+        Print several strings with a single write.
+        
+        Args:
+            strings (List[str]): The strings to print
+        """
+        sys.stdout.write(''.join(map(self.render, strings)))
     
     def _heavy_job(self, msg: str):
         """
@@ -0,0 +1,96 @@
+"""
+Proxy Pattern - Printer Pool
+A bounded pool of real Printer objects, keyed by printer name, that
+proxies share so that each expensive Printer is created only once.
+
+Printers are created on a background executor. The pool hands out
+futures, so several proxies asking for the same name while it is still
+being created all wait for the same Printer. When the pool is full, the
+least recently used printer is dropped from it (proxies already using it
+keep it).
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from printer import Printer
+
+
+class PrinterPool:
+    """
+    Shared, bounded pool of real printers.
+    Pooled printers are shared and must not be renamed.
+    """
+
+    def __init__(self, max_size: int = 4, max_workers: int = 2):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size (int): Maximum number of printers kept in the pool
+            max_workers (int): Number of printers created at the same time
+        """
+        if max_size <= 0:
+            raise ValueError("Pool size must be positive")
+        self.max_size = max_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="printer-pool")
+        self._printers: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, name: str) -> Future:
+        """
+        Get the printer for a name, starting to create it if needed.
+
+        Args:
+            name (str): The printer name
+
+        Returns:
+            Future: Resolves to the Printer
+        """
+        with self._lock:
+            future = self._printers.get(name)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._printers.move_to_end(name)
+                self.hits += 1
+                return future
+            # Create the printer in the background (again, if it failed before)
+            future = self._executor.submit(Printer, name)
+            self._printers[name] = future
+            self._printers.move_to_end(name)
+            self.misses += 1
+            if len(self._printers) > self.max_size:
+                self._printers.popitem(last=False)
+                self.evictions += 1
+            return future
+
+    def get_stats(self) -> dict:
+        """
+        Get the pool counters.
+
+        Returns:
+            dict: hits, misses, evictions and size
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "size": len(self._printers)}
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the background executor.
+
+        Args:
+            wait (bool): Wait for printers still being created
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __len__(self) -> int:
+        """Number of printers in the pool."""
+        return len(self._printers)
+
+    def __str__(self) -> str:
+        """String representation of the pool."""
+        return (f"PrinterPool(size={len(self._printers)}/{self.max_size}, "
+                f"hits={self.hits}, misses={self.misses})")
@@ -2,12 +2,39 @@
 Proxy Pattern - Proxy Class
 This class acts as a proxy for the real Printer object.
 It delays the creation of the expensive real object until actually needed.
+
+The proxy can also start creating the real printer in the background
+before it is needed (warm-up), share real printers through a PrinterPool,
+and print from asyncio code without blocking the event loop.
 """
 
+import asyncio
 import threading
-from typing import Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
 from printable import Printable
 from printer import Printer
+from printer_pool import PrinterPool
+
+
+# warm-up modes
+WARM_UP_ON_CREATE = "create"    # start creating the printer with the proxy
+WARM_UP_ON_RENAME = "rename"    # start once the name has been changed
+
+# creates the printers of warming-up proxies that do not use a pool
+_warm_up_executor: Optional[ThreadPoolExecutor] = None
+_warm_up_lock = threading.Lock()
+
+
+def _submit_printer(name: str) -> Future:
+    """Start creating a Printer on the shared warm-up executor."""
+    global _warm_up_executor
+    with _warm_up_lock:
+        if _warm_up_executor is None:
+            _warm_up_executor = ThreadPoolExecutor(max_workers=4,
+                                                   thread_name_prefix="printer-warm-up")
+    return _warm_up_executor.submit(Printer, name)
 
 
 class PrinterProxy(Printable):
@@ -15,72 +42,185 @@ class PrinterProxy(Printable):
     Proxy class that controls access to the real Printer object.
     Provides lazy initialization - the real printer is only created when needed.
     """
-    
-    def __init__(self, name: str = "No Name"):
+
+    def __init__(self, name: str = "No Name", pool: Optional[PrinterPool] = None,
+                 warm_up: Optional[str] = None):
         """
         Initialize the proxy with just a name (no expensive operations).
-        
+
         Args:
             name (str): The initial name for the printer
+            pool (PrinterPool, optional): Pool to share real printers through
+            warm_up (str, optional): WARM_UP_ON_CREATE or WARM_UP_ON_RENAME to
+                                     create the real printer in the background;
+                                     None to create it on the first print()
         """
+        if warm_up not in (None, WARM_UP_ON_CREATE, WARM_UP_ON_RENAME):
+            raise ValueError(f"Unknown warm-up mode: {warm_up}")
         self.name = name
         self.real: Optional[Printer] = None
         self._lock = threading.Lock()
-    
+        self._pool = pool
+        self._warm_up = warm_up
+        self._pending: Optional[Future] = None
+        # timing metrics
+        self._metrics_lock = threading.Lock()
+        self.realize_wait = 0.0  # seconds callers waited for the real printer
+        self.print_time = 0.0    # seconds spent in the real printer's print()
+        self.prints = 0
+        if warm_up == WARM_UP_ON_CREATE:
+            self._start_warm_up()
+
+    def _start_warm_up(self):
+        """Start getting the real printer for the current name in the background."""
+        if self._pool is not None:
+            self._pending = self._pool.get(self.name)
+        else:
+            self._pending = _submit_printer(self.name)
+
     def set_printer_name(self, name: str):
         """
         Set the printer name. If the real printer exists, update it too.
-        
+
+        A proxy using a pool switches to the pooled printer for the new name
+        instead, since pooled printers are shared.
+
         Args:
             name (str): The printer name to set
         """
         with self._lock:
+            if self._pool is not None:
+                self.name = name
+                if (self.real is not None or self._pending is not None
+                        or self._warm_up == WARM_UP_ON_RENAME):
+                    self.real = None
+                    self._start_warm_up()
+                return
             if self.real is not None:
                 # If real printer exists, update it too
                 self.real.set_printer_name(name)
             self.name = name
-    
+            if (self.real is None and self._pending is None
+                    and self._warm_up == WARM_UP_ON_RENAME):
+                self._start_warm_up()
+
     def get_printer_name(self) -> str:
         """
         Get the printer name. This can be done without creating the real printer.
-        
+
         Returns:
             str: The current printer name
         """
         return self.name
-    
+
     def print(self, string: str):
         """
         Print a string. This requires the real printer, so create it if needed.
-        
+
+        Args:
+            string (str): The string to print
+        """
+        real = self._realize()
+        start = time.perf_counter()
+        real.print(string)
+        elapsed = time.perf_counter() - start
+        with self._metrics_lock:
+            self.print_time += elapsed
+            self.prints += 1
+
+    def print_batch(self, strings: List[str]):
+        """
+        Print several strings through the real printer in one call.
+
+        Args:
+            strings (List[str]): The strings to print
+        """
+        real = self._realize()
+        start = time.perf_counter()
+        real.print_batch(strings)
+        elapsed = time.perf_counter() - start
+        with self._metrics_lock:
+            self.print_time += elapsed
+            self.prints += len(strings)
+
+    async def print_async(self, string: str):
+        """
+        Print a string from asyncio code.
+
+        Waiting for the real printer happens on a worker thread, so the event
+        loop keeps running while the printer is being created.
+
         Args:
             string (str): The string to print
         """
-        self._realize()
-        self.real.print(string)
-    
-    def _realize(self):
+        if self.real is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._realize)
+        self.print(string)
+
+    def _realize(self) -> Printer:
         """
         Create the real printer instance if it doesn't exist yet.
         This method implements lazy initialization with thread safety.
+
+        Returns:
+            Printer: The real printer
         """
-        if self.real is None:
-            with self._lock:
-                # Double-check locking pattern
-                if self.real is None:
-                    print(f"Creating real Printer instance for '{self.name}'...")
-                    self.real = Printer(self.name)
-    
+        real = self.real
+        if real is not None:
+            return real
+        start = time.perf_counter()
+        with self._lock:
+            # Double-check locking pattern
+            if self.real is None:
+                if self._pending is None:
+                    if self._pool is None:
+                        print(f"Creating real Printer instance for '{self.name}'...")
+                        self.real = Printer(self.name)
+                    else:
+                        self._pending = self._pool.get(self.name)
+                if self._pending is not None:
+                    # Wait for the printer being created in the background;
+                    # a failed creation is forgotten, so the next call retries
+                    try:
+                        real = self._pending.result()
+                    finally:
+                        self._pending = None
+                    if self._pool is None and real.get_printer_name() != self.name:
+                        # Renamed while it was being created
+                        real.set_printer_name(self.name)
+                    self.real = real
+            real = self.real
+        elapsed = time.perf_counter() - start
+        with self._metrics_lock:
+            self.realize_wait += elapsed
+        return real
+
     def is_realized(self) -> bool:
         """
         Check if the real printer has been created.
-        
+
         Returns:
             bool: True if the real printer exists, False otherwise
         """
         return self.real is not None
-    
+
+    def get_metrics(self) -> dict:
+        """
+        Get the timing metrics of this proxy.
+
+        Returns:
+            dict: realize_wait and print_time (seconds) and number of prints
+        """
+        with self._metrics_lock:
+            return {"realize_wait": self.realize_wait, "print_time": self.print_time,
+                    "prints": self.prints}
+
     def __str__(self) -> str:
         """String representation of the proxy."""
-        status = "realized" if self.is_realized() else "not realized"
+        if self.is_realized():
+            status = "realized"
+        elif self._pending is not None:
+            status = "warming up"
+        else:
+            status = "not realized"
         return f"PrinterProxy(name='{self.name}', {status})"
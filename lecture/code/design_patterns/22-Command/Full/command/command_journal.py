@@ -0,0 +1,325 @@
+"""
+Command Pattern - Command Journal
+An append-only binary log of the changes made to a MacroCommand of
+DrawCommands, so that a drawing session can be saved and reopened.
+
+Every change (draw, undo, redo, clear) is written as a fixed-width record.
+Records are buffered and written with one fsync per batch; a crash loses at
+most the last unsynced batch. The start of the file is a compacted section
+that holds only the live commands as plain draw records. A loader maps the
+file into memory and uses that section directly, without creating a
+command object per record, so only the short tail of changes written after
+the last compaction has to be replayed. Compaction runs every
+compact_every records to keep that tail short: when the tail only holds
+draw records it already has the layout of the compacted section, and only
+the header is updated; otherwise the file is rewritten.
+
+File layout (native byte order):
+    header:  magic, version, number of records in the compacted section
+    records: op (1 byte + 3 padding), x (int32), y (int32)
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from collections import deque
+from typing import List, Optional, Tuple
+
+from drawer.draw_command import DrawCommand
+
+
+JOURNAL_MAGIC = b"CJNL"
+JOURNAL_VERSION = 1
+
+_HEADER = struct.Struct("=4sHxxQ")
+_RECORD = struct.Struct("=Bxxxii")
+
+# record operations
+DRAW = 1
+UNDO = 2
+REDO = 3
+CLEAR = 4
+
+
+class JournalCommands:
+    """
+    Command container backed by a memory-mapped journal.
+
+    The first commands are read on demand from the compacted section of the
+    journal; commands appended later are kept in a deque. It supports the
+    operations MacroCommand uses (append, pop, clear, len, iteration) and
+    replays itself in bulk with execute().
+    """
+
+    def __init__(self, drawable, records: Optional[memoryview], count: int):
+        """
+        Initialize the container.
+
+        Args:
+            drawable: The receiver of the commands
+            records (memoryview, optional): The compacted section as int32
+                                            values (3 per record)
+            count (int): Number of records in the compacted section
+        """
+        self.drawable = drawable
+        self._records = records
+        self._count = count        # live commands still in the compacted section
+        self._tail = deque()       # commands added after loading
+
+    def _command(self, index: int) -> DrawCommand:
+        """Build the command for a record of the compacted section."""
+        offset = index * 3
+        return DrawCommand(self.drawable, self._records[offset + 1], self._records[offset + 2])
+
+    def append(self, cmd):
+        """Add a command at the end."""
+        self._tail.append(cmd)
+
+    def pop(self):
+        """
+        Remove and return the last command.
+
+        Raises:
+            IndexError: If there are no commands
+        """
+        if self._tail:
+            return self._tail.pop()
+        if self._count == 0:
+            raise IndexError("pop from an empty command journal")
+        self._count -= 1
+        return self._command(self._count)
+
+    def clear(self):
+        """Remove all commands."""
+        self._count = 0
+        self._tail.clear()
+
+    def execute(self):
+        """Replay all commands, reading coordinates straight from the journal."""
+        if self._count:
+            records = self._records[:self._count * 3]
+            draw = self.drawable.draw
+            for x, y in zip(records[1::3], records[2::3]):
+                draw(x, y)
+        for cmd in self._tail:
+            cmd.execute()
+
+    def record_bytes(self) -> bytes:
+        """Get all commands as journal draw records."""
+        head = self._records[:self._count * 3].tobytes() if self._count else b""
+        pack = _RECORD.pack
+        return head + b"".join(pack(DRAW, cmd.x, cmd.y) for cmd in self._tail)
+
+    def __len__(self) -> int:
+        """Number of commands."""
+        return self._count + len(self._tail)
+
+    def __iter__(self):
+        """Iterate over the commands (built on demand)."""
+        for index in range(self._count):
+            yield self._command(index)
+        yield from self._tail
+
+
+class CommandJournal:
+    """
+    Append-only journal of MacroCommand changes.
+
+    Usage:
+        journal = CommandJournal("drawing.journal")
+        history = MacroCommand()
+        history.attach_journal(journal, canvas)   # loads what was saved
+        ...
+        history.close()
+    """
+
+    def __init__(self, path: str, sync_every: int = 256, compact_every: int = 20000):
+        """
+        Open (or create) a journal file.
+
+        Args:
+            path (str): The journal file
+            sync_every (int): Records written and fsynced together
+            compact_every (int): Records after the compacted section that
+                                 trigger a compaction
+        """
+        if sync_every <= 0 or compact_every <= 0:
+            raise ValueError("sync_every and compact_every must be positive")
+        self.path = path
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.drawable = None
+        self._buffer = bytearray()
+        self._pending = 0
+        self._appends_only = False  # the tail holds only draw records (known after load)
+        # tail records a compaction keeps: one undo record per redo command
+        self.tail_baseline = 0
+        if not os.path.exists(path):
+            self._write_file(path, 0, b"")
+        self._open()
+
+    @staticmethod
+    def _write_file(path: str, count: int, records: bytes):
+        """Write a complete journal to a new temporary file and rename it."""
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if os.path.exists(path):
+                    # mkstemp creates the file private; keep the journal's permissions
+                    os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+                f.write(_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, count))
+                f.write(records)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _open(self):
+        """Open the file for appending and read its header."""
+        self._fd = os.open(self.path, os.O_RDWR)
+        header = os.read(self._fd, _HEADER.size)
+        if len(header) < _HEADER.size:
+            os.close(self._fd)
+            raise ValueError(f"{self.path} is not a command journal")
+        magic, version, self.base_count = _HEADER.unpack(header)
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+            os.close(self._fd)
+            raise ValueError(f"{self.path} is not a command journal")
+        size = os.fstat(self._fd).st_size
+        records = (size - _HEADER.size) // _RECORD.size
+        if _HEADER.size + records * _RECORD.size != size:
+            # drop a record that was only partly written
+            os.ftruncate(self._fd, _HEADER.size + records * _RECORD.size)
+        self.tail_count = records - self.base_count
+        os.lseek(self._fd, 0, os.SEEK_END)
+
+    def load(self, drawable) -> Tuple[JournalCommands, List[DrawCommand]]:
+        """
+        Load the saved commands.
+
+        Args:
+            drawable: The receiver for the loaded commands
+
+        Returns:
+            tuple: (commands, redo stack)
+        """
+        self.flush()
+        self.drawable = drawable
+        size = os.fstat(self._fd).st_size
+        if size == _HEADER.size:
+            self._appends_only = True
+            self.tail_baseline = 0
+            return JournalCommands(drawable, None, 0), []
+        data = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ)
+        view = memoryview(data)
+        base_end = _HEADER.size + self.base_count * _RECORD.size
+        commands = JournalCommands(drawable, view[_HEADER.size:base_end].cast("i"),
+                                   self.base_count)
+        redo = []
+        self._appends_only = True
+        for op, x, y in _RECORD.iter_unpack(view[base_end:]):
+            self._appends_only = self._appends_only and op == DRAW
+            if op == DRAW:
+                commands.append(DrawCommand(drawable, x, y))
+                redo.clear()
+            elif op == UNDO:
+                redo.append(commands.pop())
+            elif op == REDO:
+                commands.append(redo.pop())
+            elif op == CLEAR:
+                commands.clear()
+                redo.clear()
+        self.tail_baseline = len(redo)
+        return commands, redo
+
+    def record(self, op: int, x: int = 0, y: int = 0):
+        """
+        Add a record (written at the next batch).
+
+        Args:
+            op (int): DRAW, UNDO, REDO or CLEAR
+            x (int): X coordinate of a drawn command
+            y (int): Y coordinate of a drawn command
+        """
+        self._buffer += _RECORD.pack(op, x, y)
+        self._appends_only = self._appends_only and op == DRAW
+        self._pending += 1
+        self.tail_count += 1
+        if self._pending >= self.sync_every:
+            self.flush()
+
+    def record_draw(self, cmd: DrawCommand):
+        """Add a record for an appended DrawCommand."""
+        if not isinstance(cmd, DrawCommand):
+            raise TypeError(f"Only DrawCommands can be journaled, got {type(cmd).__name__}")
+        self.record(DRAW, cmd.x, cmd.y)
+
+    def flush(self):
+        """Write the buffered records and fsync the file."""
+        if not self._buffer:
+            return
+        while self._buffer:
+            written = os.write(self._fd, self._buffer)
+            del self._buffer[:written]
+        os.fsync(self._fd)
+        self._pending = 0
+
+    def should_compact(self) -> bool:
+        """
+        Check whether enough records have piled up to compact.
+
+        The undo records that the last compaction (or load) had to keep for
+        the redo stack do not count, so a compacted journal with a long redo
+        stack is not compacted again on the next change.
+        """
+        return self.tail_count - self.tail_baseline >= self.compact_every
+
+    def compact(self, commands, redo: List[DrawCommand]) -> Tuple[JournalCommands, List[DrawCommand]]:
+        """
+        Rewrite the journal with only the live commands and the redo stack.
+
+        If only draw records were added since the last compaction, they are
+        added to the compacted section in place. Otherwise the redo commands
+        are written after the live ones, followed by one undo record each,
+        so loading rebuilds the same redo stack.
+
+        Args:
+            commands (JournalCommands): The current commands
+            redo (list): The current redo stack
+
+        Returns:
+            tuple: (commands, redo stack) loaded from the compacted journal
+        """
+        self.flush()
+        if self._appends_only:
+            # the file already holds exactly the live commands
+            self.base_count += self.tail_count
+            self.tail_count = 0
+            os.pwrite(self._fd, _HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, self.base_count), 0)
+            os.fsync(self._fd)
+            return self.load(self.drawable)
+        pack = _RECORD.pack
+        records = (commands.record_bytes()
+                   + b"".join(pack(DRAW, cmd.x, cmd.y) for cmd in reversed(redo))
+                   + pack(UNDO, 0, 0) * len(redo))
+        os.close(self._fd)
+        self._write_file(self.path, len(commands) + len(redo), records)
+        self._open()
+        return self.load(self.drawable)
+
+    def close(self):
+        """Write any buffered records and close the file."""
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+            self._fd = None
+
+    def __str__(self) -> str:
+        """String representation of the journal."""
+        return (f"CommandJournal({self.path}, compacted={self.base_count}, "
+                f"tail={self.tail_count})")
@@ -5,27 +5,63 @@ It demonstrates how commands can be combined and executed as a group.
 """
 
 from collections import deque
-from typing import Deque
+from typing import Deque, List
 from command.command import Command
+from command.command_journal import UNDO, REDO, CLEAR
 
 
 class MacroCommand(Command):
     """
     Composite command that contains and executes multiple commands.
     This implements the Composite pattern within the Command pattern.
+
+    Undone commands are kept on a redo stack until a new command is added.
+    With a CommandJournal attached, every change is also written to the
+    journal, so the history survives a restart.
     """
     
     def __init__(self):
         """Initialize an empty macro command."""
         self.commands: Deque[Command] = deque()
+        self.redo_stack: List[Command] = []
+        self.journal = None
     
     def execute(self):
         """
         Execute all commands in the macro in order.
         """
+        if hasattr(self.commands, "execute"):
+            # journal-backed commands replay themselves in bulk
+            self.commands.execute()
+            return
         for cmd in self.commands:
             cmd.execute()
     
+    def attach_journal(self, journal, drawable):
+        """
+        Load the commands saved in a journal and record later changes to it.
+        
+        The loaded commands replace the current ones.
+        
+        Args:
+            journal (CommandJournal): The journal to load and write to
+            drawable: The receiver for the loaded commands
+        """
+        self.commands, self.redo_stack = journal.load(drawable)
+        self.journal = journal
+    
+    def _journaled(self, op):
+        """Record a change in the journal, if there is one."""
+        if self.journal is None:
+            return
+        self.journal.record(op)
+        self._compact_if_needed()
+    
+    def _compact_if_needed(self):
+        """Compact the journal once enough changes have piled up."""
+        if self.journal is not None and self.journal.should_compact():
+            self.compact()
+    
     def append(self, cmd: Command):
         """
         Add a command to the macro.
@@ -35,22 +71,52 @@ class MacroCommand(Command):
             
         Raises:
             ValueError: If trying to add the macro to itself (infinite loop)
+            TypeError: If a journal is attached and cmd is not a DrawCommand
         """
         if cmd is self:
             raise ValueError("Cannot append macro command to itself - would cause infinite loop")
         
+        # Record first: a command the journal rejects leaves the history unchanged
+        if self.journal is not None:
+            self.journal.record_draw(cmd)
         self.commands.append(cmd)
+        self.redo_stack.clear()
+        self._compact_if_needed()
     
     def undo(self):
         """
         Remove the last command from the macro.
         This provides a simple undo functionality.
+        
+        Returns:
+            Command: The removed command, or None if there was none
         """
         if self.commands:
             removed = self.commands.pop()
+            self.redo_stack.append(removed)
+            self._journaled(UNDO)
             print(f"Undid command: {type(removed).__name__}")
-        else:
-            print("No commands to undo")
+            return removed
+        print("No commands to undo")
+        return None
+    
+    def redo(self):
+        """
+        Add the last undone command back to the macro.
+        
+        The command is not executed; repaint to draw it.
+        
+        Returns:
+            Command: The restored command, or None if there was none
+        """
+        if self.redo_stack:
+            restored = self.redo_stack.pop()
+            self.commands.append(restored)
+            self._journaled(REDO)
+            print(f"Redid command: {type(restored).__name__}")
+            return restored
+        print("No commands to redo")
+        return None
     
     def clear(self):
         """
@@ -58,8 +124,25 @@ class MacroCommand(Command):
         """
         count = len(self.commands)
         self.commands.clear()
+        self.redo_stack.clear()
+        self._journaled(CLEAR)
         print(f"Cleared {count} commands from history")
     
+    def compact(self):
+        """
+        Rewrite the attached journal with only the current commands.
+        """
+        if self.journal is not None:
+            self.commands, self.redo_stack = self.journal.compact(self.commands, self.redo_stack)
+    
+    def close(self):
+        """
+        Write any pending changes to the attached journal and close it.
+        """
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+    
     def size(self) -> int:
         """
         Get the number of commands in the macro.
@@ -69,6 +152,15 @@ class MacroCommand(Command):
         """
         return len(self.commands)
     
+    def can_redo(self) -> bool:
+        """
+        Check if there is an undone command to redo.
+        
+        Returns:
+            bool: True if redo() would restore a command
+        """
+        return len(self.redo_stack) > 0
+    
     def is_empty(self) -> bool:
         """
         Check if the macro is empty.
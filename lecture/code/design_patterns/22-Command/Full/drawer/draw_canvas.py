@@ -2,13 +2,28 @@
 Command Pattern - Draw Canvas (Receiver)
 This class implements the Drawable interface and provides a canvas for drawing.
 It also demonstrates how the Command pattern can be used with GUI applications.
+
+Circles are drawn into an off-screen raster (a PhotoImage shown as a single
+canvas item) instead of being kept as one canvas item each. Tk only redraws
+the part of the image that changed, and undo restores the raster from a
+recent checkpoint instead of replaying the whole history.
 """
 
+import math
 import tkinter as tk
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Tuple
 from drawer.drawable import Drawable
 from command.macro_command import MacroCommand
 
 
+# A copy of the raster is kept every CHECKPOINT_INTERVAL strokes, so undo
+# only has to draw the strokes since the closest checkpoint again
+CHECKPOINT_INTERVAL = 500
+MAX_CHECKPOINTS = 10
+
+
 class DrawCanvas(tk.Canvas, Drawable):
     """
     Concrete receiver that implements the drawing functionality.
@@ -32,6 +47,14 @@ class DrawCanvas(tk.Canvas, Drawable):
         self.color = 'red'
         self.radius = 6
         
+        # Off-screen raster, the strokes drawn into it (x, y, color, radius)
+        # and recent (stroke count, raster copy) checkpoints
+        self.raster = tk.PhotoImage(master=self, width=width, height=height)
+        self.create_image(0, 0, image=self.raster, anchor=tk.NW)
+        self._strokes: List[Tuple[int, int, str, int]] = []
+        self._checkpoints = deque(maxlen=MAX_CHECKPOINTS)
+        self._spans: Dict[int, List[Tuple[int, int]]] = {}
+        
         # Bind mouse events for drawing
         self.bind('<B1-Motion>', self._on_mouse_drag)
         self.bind('<Button-1>', self._on_mouse_click)
@@ -47,13 +70,35 @@ class DrawCanvas(tk.Canvas, Drawable):
             x (int): X coordinate
             y (int): Y coordinate
         """
-        # Draw a filled circle (oval)
-        x1 = x - self.radius
-        y1 = y - self.radius
-        x2 = x + self.radius
-        y2 = y + self.radius
+        # Draw a filled circle into the raster
+        self._paint_circle(x, y, self.color, self.radius)
+        self._strokes.append((x, y, self.color, self.radius))
+        if len(self._strokes) % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append((len(self._strokes), self.raster.copy()))
+    
+    def _paint_circle(self, x: int, y: int, color: str, radius: int):
+        """
+        Fill a circle in the raster, one horizontal span per row.
         
-        self.create_oval(x1, y1, x2, y2, fill=self.color, outline=self.color)
+        Args:
+            x (int): X coordinate of the center
+            y (int): Y coordinate of the center
+            color (str): Fill color
+            radius (int): Circle radius in pixels
+        """
+        spans = self._spans.get(radius)
+        if spans is None:
+            spans = [(dy, int(math.sqrt(radius * radius - dy * dy)))
+                     for dy in range(-radius, radius + 1)]
+            self._spans[radius] = spans
+        put = self.raster.put
+        for dy, half in spans:
+            row = y + dy
+            left = max(x - half, 0)
+            right = min(x + half + 1, self.width)
+            # clip to the raster (writing outside would grow the image)
+            if 0 <= row < self.height and left < right:
+                put(color, to=(left, row, right, row + 1))
     
     def _on_mouse_click(self, event):
         """Handle single mouse click."""
@@ -73,13 +118,48 @@ class DrawCanvas(tk.Canvas, Drawable):
         self.history.append(cmd)
         cmd.execute()
     
-    def repaint(self):
+    def repaint(self, full: bool = False):
         """
-        Repaint the canvas by clearing it and executing all commands in history.
-        This demonstrates how commands can be replayed.
+        Repaint the canvas so that it shows exactly the commands in history.
+        
+        After an undo the history is shorter than what has been drawn: the
+        raster is restored from the closest checkpoint and only the strokes
+        after it are drawn again. Commands that have not been drawn yet are
+        executed. Either way the cost does not grow with the history.
+        
+        Args:
+            full (bool): Clear the canvas and replay every command instead.
+                         This demonstrates how commands can be replayed.
         """
-        self.delete("all")  # Clear canvas
-        self.history.execute()  # Replay all commands
+        if full:
+            self.clear_canvas()
+            self.history.execute()
+            return
+        count = self.history.size()
+        if count < len(self._strokes):
+            self._rewind(count)
+        for cmd in islice(self.history.commands, len(self._strokes), None):
+            cmd.execute()
+    
+    def _rewind(self, count: int):
+        """Go back to the first count strokes (checkpoint plus replay tail)."""
+        del self._strokes[count:]
+        while self._checkpoints and self._checkpoints[-1][0] > count:
+            self._checkpoints.pop()
+        self.raster.blank()
+        if self._checkpoints:
+            start, checkpoint = self._checkpoints[-1]
+            self.raster.tk.call(self.raster, 'copy', checkpoint)
+        else:
+            start = 0
+        for x, y, color, radius in self._strokes[start:count]:
+            self._paint_circle(x, y, color, radius)
+    
+    def clear_canvas(self):
+        """Erase everything that has been drawn."""
+        self.raster.blank()
+        self._strokes.clear()
+        self._checkpoints.clear()
     
     def set_color(self, color: str):
         """
@@ -109,5 +189,6 @@ class DrawCanvas(tk.Canvas, Drawable):
         return {
             'color': self.color,
             'radius': self.radius,
-            'commands': self.history.size()
+            'commands': self.history.size(),
+            'strokes': len(self._strokes)
         }
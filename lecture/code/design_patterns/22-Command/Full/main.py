@@ -10,8 +10,13 @@ Key concepts demonstrated:
 4. Logging and replaying operations
 """
 
+import os
+import sys
+import tempfile
+import time
 import tkinter as tk
 from tkinter import ttk
+from command.command_journal import CommandJournal
 from command.macro_command import MacroCommand
 from drawer.draw_canvas import DrawCanvas
 
@@ -22,8 +27,14 @@ class DrawingApp:
     Provides a GUI for drawing with command-based operations.
     """
     
-    def __init__(self):
-        """Initialize the drawing application."""
+    def __init__(self, journal_path=None):
+        """
+        Initialize the drawing application.
+        
+        Args:
+            journal_path (str, optional): Journal file to reopen the drawing
+                                          from and save every change to
+        """
         self.root = tk.Tk()
         self.root.title("Command Pattern Demo - Drawing App")
         self.root.resizable(False, False)
@@ -35,6 +46,12 @@ class DrawingApp:
         self._create_widgets()
         self._setup_layout()
         
+        # Reopen the saved drawing
+        if journal_path is not None:
+            self.history.attach_journal(CommandJournal(journal_path), self.canvas)
+            self.canvas.repaint()
+            self.root.protocol("WM_DELETE_WINDOW", self._close)
+        
         # Center the window
         self._center_window()
     
@@ -63,6 +80,9 @@ class DrawingApp:
         self.undo_button = ttk.Button(
             self.button_frame, text="Undo Last", command=self._undo_last
         )
+        self.redo_button = ttk.Button(
+            self.button_frame, text="Redo", command=self._redo_last
+        )
         self.repaint_button = ttk.Button(
             self.button_frame, text="Repaint", command=self._repaint_canvas
         )
@@ -101,6 +121,7 @@ class DrawingApp:
         self.button_frame.pack(pady=(0, 10))
         self.clear_button.pack(side=tk.LEFT, padx=(0, 5))
         self.undo_button.pack(side=tk.LEFT, padx=(0, 5))
+        self.redo_button.pack(side=tk.LEFT, padx=(0, 5))
         self.repaint_button.pack(side=tk.LEFT)
         
         self.status_label.pack()
@@ -117,7 +138,7 @@ class DrawingApp:
     def _clear_canvas(self):
         """Clear the canvas and command history."""
         self.history.clear()
-        self.canvas.delete("all")
+        self.canvas.clear_canvas()
         print("Canvas cleared - all commands removed from history")
     
     def _undo_last(self):
@@ -129,10 +150,19 @@ class DrawingApp:
         else:
             print("No commands to undo")
     
+    def _redo_last(self):
+        """Redo the last undone command and draw it."""
+        if self.history.can_redo():
+            self.history.redo()
+            self.canvas.repaint()
+            print("Last undone command redone")
+        else:
+            print("No commands to redo")
+    
     def _repaint_canvas(self):
         """Repaint the canvas by replaying all commands."""
         print(f"Repainting canvas with {self.history.size()} commands...")
-        self.canvas.repaint()
+        self.canvas.repaint(full=True)
         print("Repaint completed")
     
     def _on_color_change(self, event=None):
@@ -149,11 +179,17 @@ class DrawingApp:
         # Update button states
         has_commands = not self.history.is_empty()
         self.undo_button.config(state=tk.NORMAL if has_commands else tk.DISABLED)
+        self.redo_button.config(state=tk.NORMAL if self.history.can_redo() else tk.DISABLED)
         self.repaint_button.config(state=tk.NORMAL if has_commands else tk.DISABLED)
         
         # Schedule next update
         self.root.after(100, self._update_status)
     
+    def _close(self):
+        """Save pending changes to the journal and close the window."""
+        self.history.close()
+        self.root.destroy()
+    
     def run(self):
         """Start the application."""
         self.root.mainloop()
@@ -220,6 +256,74 @@ def demonstrate_command_pattern():
     print(f"Final points: {drawable.get_points()}")
 
 
+def demonstrate_command_journal(count=20_000):
+    """
+    Demonstrate saving and reopening a large command history with a journal.
+    
+    main() runs it with a small count; for the timings of a large history run
+    python main.py --journal-benchmark [count] (2,000,000 by default).
+    
+    Args:
+        count (int): Number of draw commands to save
+    """
+    print("\n=== Command Journal ===")
+    
+    from drawer.draw_command import DrawCommand
+    
+    class CountingDrawable:
+        def __init__(self):
+            self.count = 0
+        
+        def draw(self, x, y):
+            self.count += 1
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "drawing.journal")
+        drawable = CountingDrawable()
+        
+        print(f"\n1. Recording {count:,} draw commands...")
+        start = time.perf_counter()
+        history = MacroCommand()
+        history.attach_journal(CommandJournal(path, sync_every=4096), drawable)
+        for i in range(count):
+            history.append(DrawCommand(drawable, i % 500, i % 400))
+        history.close()
+        print(f"Recorded in {time.perf_counter() - start:.2f} s, "
+              f"journal is {os.path.getsize(path) / 1e6:.1f} MB")
+        
+        print("\n2. Reopening the journal...")
+        start = time.perf_counter()
+        history = MacroCommand()
+        history.attach_journal(CommandJournal(path), drawable)
+        print(f"Reopened {history.size():,} commands in "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        
+        start = time.perf_counter()
+        history.execute()
+        print(f"Replayed {drawable.count:,} commands in {time.perf_counter() - start:.2f} s")
+        
+        print("\n3. Undo, redo and draw, then reopen again...")
+        history.undo()
+        history.undo()
+        history.redo()
+        history.append(DrawCommand(drawable, 1, 2))
+        history.undo()
+        print(f"Commands: {history.size():,}, can redo: {history.can_redo()}")
+        history.close()
+        history = MacroCommand()
+        journal = CommandJournal(path)
+        history.attach_journal(journal, drawable)
+        print(f"After reopening: {history.size():,} commands, "
+              f"can redo: {history.can_redo()}")
+        print(journal)
+        
+        print("\n4. Compacting the journal...")
+        start = time.perf_counter()
+        history.compact()
+        print(f"Compacted in {(time.perf_counter() - start) * 1000:.1f} ms: {journal}")
+        history.close()
+
+
 def main():
     """
     Main function that demonstrates the Command pattern.
@@ -232,6 +336,7 @@ def main():
     
     # Demonstrate concepts
     demonstrate_command_pattern()
+    demonstrate_command_journal()
     
     print(f"\n{'='*60}")
     print("Starting GUI Demo...")
@@ -239,13 +344,14 @@ def main():
     print("- Click and drag on the canvas to draw")
     print("- Each drawing operation creates a command")
     print("- Use 'Undo Last' to remove the most recent command")
+    print("- Use 'Redo' to restore the most recently undone command")
     print("- Use 'Repaint' to clear and replay all commands")
     print("- Use 'Clear All' to remove all commands")
     print("- Change colors to see different drawing effects")
     print(f"{'='*60}")
     
     try:
-        app = DrawingApp()
+        app = DrawingApp(sys.argv[1] if len(sys.argv) > 1 else None)
         app.run()
     except KeyboardInterrupt:
         print("\nDemo interrupted by user")
@@ -271,4 +377,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["--journal-benchmark"]:
+        demonstrate_command_journal(int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000)
+    else:
+        main()
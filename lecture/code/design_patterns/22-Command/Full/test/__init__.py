@@ -0,0 +1 @@
+# Test package initialization for the Command pattern example
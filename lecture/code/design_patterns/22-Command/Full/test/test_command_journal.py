@@ -0,0 +1,124 @@
+"""
+Unit tests for CommandJournal and MacroCommand with a journal attached
+Tests reopening, compaction and rejected commands
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from command.command import Command
+from command.command_journal import CommandJournal
+from command.macro_command import MacroCommand
+from drawer.draw_command import DrawCommand
+
+
+class CountingDrawable:
+    """Receiver that only counts draw calls"""
+
+    def __init__(self):
+        self.count = 0
+
+    def draw(self, x, y):
+        self.count += 1
+
+
+class NoteCommand(Command):
+    """A command that is not a DrawCommand"""
+
+    def execute(self):
+        pass
+
+
+class TestCommandJournal(unittest.TestCase):
+    """Test cases for journal-backed MacroCommands"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "drawing.journal")
+        self.drawable = CountingDrawable()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def open_history(self, **journal_args):
+        history = MacroCommand()
+        history.attach_journal(CommandJournal(self.path, **journal_args), self.drawable)
+        return history
+
+    def test_reopen_restores_commands_and_redo_stack(self):
+        """Test that a reopened journal has the same commands and redo stack"""
+        history = self.open_history(compact_every=50)
+        for i in range(200):
+            history.append(DrawCommand(self.drawable, i, i))
+        for _ in range(30):
+            history.undo()
+        history.close()
+
+        history = self.open_history(compact_every=50)
+        self.assertEqual(history.size(), 170)
+        self.assertEqual(len(history.redo_stack), 30)
+        self.assertEqual(history.redo().get_position(), (170, 170))
+        history.close()
+
+    def test_compaction_with_long_redo_stack_is_not_repeated(self):
+        """Test that the undo records kept for the redo stack do not trigger compaction"""
+        history = self.open_history(compact_every=50)
+        for i in range(200):
+            history.append(DrawCommand(self.drawable, i, i))
+        for _ in range(120):
+            history.undo()
+        history.compact()
+        journal = history.journal
+        self.assertEqual(journal.tail_count, 120)
+        self.assertFalse(journal.should_compact())
+
+        # The next changes are appended, not rewritten into a new file
+        inode = os.stat(self.path).st_ino
+        history.undo()
+        history.redo()
+        self.assertEqual(journal.tail_count, 122)
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+
+        # Reopening keeps the same baseline
+        history.close()
+        history = self.open_history(compact_every=50)
+        self.assertFalse(history.journal.should_compact())
+        history.close()
+
+    def test_rejected_command_leaves_history_unchanged(self):
+        """Test that a command the journal cannot store changes nothing"""
+        history = self.open_history()
+        for i in range(3):
+            history.append(DrawCommand(self.drawable, i, i))
+        history.undo()
+
+        with self.assertRaises(TypeError):
+            history.append(NoteCommand())
+        self.assertEqual(len(history.commands), 2)
+        self.assertEqual(len(history.redo_stack), 1)
+        history.close()
+
+        history = self.open_history()
+        self.assertEqual(len(history.commands), 2)
+        self.assertEqual(len(history.redo_stack), 1)
+        history.close()
+
+    def test_rewrite_leaves_no_temporary_files(self):
+        """Test that compacting replaces the journal without leftovers or a mode change"""
+        history = self.open_history(compact_every=10)
+        os.chmod(self.path, 0o644)
+        for i in range(25):
+            history.append(DrawCommand(self.drawable, i, i))
+            history.undo()
+            history.redo()
+        history.close()
+        self.assertEqual(os.listdir(self.directory.name), ["drawing.journal"])
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Interpreter Pattern - Batch Runner
+Parses and executes many independent turtle programs across a process pool.
+
+Programs are sent to the workers in chunks to keep the inter-process
+overhead low. Each worker process keeps its own ParseCache, so a program
+that appears many times in a batch is only parsed once per worker, and runs
+the compiled program on the TurtleVM.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from context import Context
+from parse_cache import ParseCache
+from parse_exception import ParseException
+from program_node import ProgramNode
+from turtle_compiler import TurtleCompiler, TurtleVM
+
+
+class RunResult(NamedTuple):
+    """
+    Outcome of one program.
+
+    path is None unless paths were requested; error holds the parse error
+    message of a program that did not parse (and x, y, direction are 0).
+    """
+    x: int
+    y: int
+    direction: int
+    path: Optional[List[Tuple[int, int]]]
+    error: Optional[str]
+
+
+# one cache per worker process
+_cache = None
+
+
+def run_program(text: str, record_path: bool = False,
+                cache: Optional[ParseCache] = None) -> RunResult:
+    """
+    Parse, compile and run one program.
+
+    Args:
+        text (str): The program text
+        record_path (bool): Also return every position visited
+        cache (ParseCache, optional): Cache to parse through
+
+    Returns:
+        RunResult: Final position and direction (and path)
+    """
+    try:
+        if cache is not None:
+            program_node = cache.parse(text)
+        else:
+            program_node = ProgramNode()
+            program_node.parse(Context(text))
+    except ParseException as e:
+        return RunResult(0, 0, 0, None, str(e))
+    program = TurtleCompiler(fold=not record_path).compile(program_node)
+    vm = TurtleVM(record_path=record_path)
+    x, y, direction = vm.run(program)
+    return RunResult(x, y, direction, vm.path if record_path else None, None)
+
+
+def _run_chunk(texts: List[str], record_path: bool, cache_size: int) -> List[RunResult]:
+    """Run a chunk of programs in a worker process."""
+    global _cache
+    if _cache is None:
+        _cache = ParseCache(max_size=cache_size)
+    return [run_program(text, record_path, _cache) for text in texts]
+
+
+def run_programs(texts: Iterable[str], record_path: bool = False,
+                 max_workers: int = None,
+                 chunk_size: int = 1000,
+                 cache_size: int = 4096) -> List[RunResult]:
+    """
+    Parse and execute many programs in parallel.
+
+    Args:
+        texts (Iterable[str]): The program texts
+        record_path (bool): Also return every position visited
+        max_workers (int, optional): Number of worker processes
+        chunk_size (int): Programs sent to a worker at a time
+        cache_size (int): Size of each worker's parse cache
+
+    Returns:
+        List[RunResult]: One result per program, in input order
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    texts = list(texts)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for chunk_results in pool.map(_run_chunk, chunks,
+                                      [record_path] * len(chunks),
+                                      [cache_size] * len(chunks)):
+            results.extend(chunk_results)
+    return results
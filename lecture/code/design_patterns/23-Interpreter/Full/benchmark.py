@@ -0,0 +1,116 @@
+"""
+Benchmark for parsing and running turtle programs
+
+Generates a batch of programs (default: 100k, drawn from 2000 distinct
+programs, as in a workload that keeps re-running the same scripts) and
+measures:
+- parsing every program vs. parsing through the LRU ParseCache
+- a second run that loads the parsed trees from the on-disk store
+- executing with the tree-walking TurtleInterpreter vs. the compiled VM
+- parsing and executing the batch across a process pool
+
+Usage:
+    python3 benchmark.py [programs] [distinct]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from batch_runner import run_program, run_programs
+from context import Context
+from main import TurtleInterpreter
+from parse_cache import ParseCache
+from program_node import ProgramNode
+
+
+def generate_program(rng: random.Random, depth: int = 0) -> str:
+    """Generate a random program text, or a command list body when depth > 0."""
+    commands = []
+    for _ in range(rng.randint(1, 6)):
+        if depth < 3 and rng.random() < 0.3:
+            commands.append(f"repeat {rng.randint(1, 5)} {generate_program(rng, depth + 1)}")
+        else:
+            commands.append(rng.choice(("go", "right", "left")))
+    body = " ".join(commands) + " end"
+    return body if depth else "program " + body
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed * 1000:10.1f} ms")
+    return result
+
+
+def parse(text: str) -> ProgramNode:
+    program_node = ProgramNode()
+    program_node.parse(Context(text))
+    return program_node
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    rng = random.Random(0)
+    pool = set()
+    while len(pool) < distinct:
+        pool.add(generate_program(rng))
+    pool = sorted(pool)
+    texts = [rng.choice(pool) for _ in range(count)]
+    print(f"{count} programs ({distinct} distinct)")
+
+    print("\nParsing:")
+    timed("parse every program", lambda: [parse(text) for text in texts])
+    cache = ParseCache(max_size=distinct)
+    timed("ParseCache (cold)", lambda: [cache.parse(text) for text in texts])
+    print(f"  {cache}")
+    timed("ParseCache (warm)", lambda: [cache.parse(text) for text in texts])
+
+    with tempfile.TemporaryDirectory() as directory:
+        store_path = os.path.join(directory, "programs.cache")
+        with ParseCache(max_size=distinct, store_path=store_path) as stored:
+            for text in pool:
+                stored.parse(text)
+        print(f"  store file: {os.path.getsize(store_path) / 1024:.0f} KB")
+        reloaded = timed("next run, from the on-disk store",
+                         lambda: ParseCache(max_size=distinct, store_path=store_path))
+        with reloaded:
+            timed("  ... then every program", lambda: [reloaded.parse(text) for text in texts])
+            print(f"  {reloaded}")
+
+    print("\nExecution (final positions):")
+    trees = [cache.parse(text) for text in texts]
+
+    def walk_all():
+        interpreter = TurtleInterpreter(trace=False)
+        positions = []
+        for program_node in trees:
+            interpreter.reset()
+            interpreter.execute_program(program_node)
+            positions.append((interpreter.x, interpreter.y, interpreter.direction))
+        return positions
+
+    walked = timed("tree-walking interpreter", walk_all)
+    compiled = timed("parse cache + folded VM",
+                     lambda: [run_program(text, cache=cache)[:3] for text in texts])
+    assert walked == compiled
+
+    print("\nBatch (parse + execute):")
+    sequential = timed("sequential, with paths",
+                       lambda: [run_program(text, record_path=True, cache=cache)
+                                for text in texts])
+    parallel = timed(f"run_programs, {os.cpu_count()} processes, with paths",
+                     lambda: run_programs(texts, record_path=True))
+    assert parallel == sequential
+    parallel = timed(f"run_programs, {os.cpu_count()} processes",
+                     lambda: run_programs(texts))
+    assert [result[:3] for result in parallel] == walked
+
+
+if __name__ == "__main__":
+    main()
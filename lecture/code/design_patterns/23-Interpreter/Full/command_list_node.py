@@ -6,7 +6,6 @@ Grammar: <command list> ::= <command>* end
 
 from typing import List, TYPE_CHECKING
 from node import Node
-from parse_exception import ParseException
 
 if TYPE_CHECKING:
     from context import Context
@@ -35,7 +34,7 @@ class CommandListNode(Node):
             current_token = context.current_token()
             
             if current_token is None:
-                raise ParseException("Error: Missing 'end'")
+                raise context.error("Error: Missing 'end'")
             elif current_token == "end":
                 context.skip_token("end")
                 break
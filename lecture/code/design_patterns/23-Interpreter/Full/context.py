@@ -2,10 +2,14 @@
 Interpreter Pattern - Context Class
 This class manages the tokenization and current state of parsing.
 It provides methods for navigating through tokens and extracting values.
+
+Tokens are pulled one at a time from a Tokenizer, so the source can also be
+a file object or mmap that is never loaded as a whole.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from parse_exception import ParseException
+from tokenizer import Tokenizer
 
 
 class Context:
@@ -14,16 +18,21 @@ class Context:
     Provides methods for token navigation and validation during parsing.
     """
     
-    def __init__(self, text: str):
+    def __init__(self, text, line: int = 1):
         """
         Initialize the context with input text.
         
         Args:
-            text (str): The input text to be parsed
+            text: The input text to be parsed, or a file object or mmap
+                  to read it from
+            line (int): Line number of the first line of the text
         """
-        self.tokens: List[str] = text.split()
+        self._tokenizer = Tokenizer(text, line)
+        self._tokens = iter(self._tokenizer)
         self.index = 0
         self.last_token: Optional[str] = None
+        self.line = 0
+        self.column = 0
         self.next_token()
     
     def next_token(self) -> Optional[str]:
@@ -33,11 +42,13 @@ class Context:
         Returns:
             Optional[str]: The next token, or None if no more tokens
         """
-        if self.index < len(self.tokens):
-            self.last_token = self.tokens[self.index]
+        token = next(self._tokens, None)
+        if token is not None:
+            self.last_token, self.line, self.column = token
             self.index += 1
         else:
             self.last_token = None
+            self.line, self.column = self._tokenizer.get_end_location()
         
         return self.last_token
     
@@ -50,6 +61,27 @@ class Context:
         """
         return self.last_token
     
+    def get_location(self) -> Tuple[int, int]:
+        """
+        Get the position of the current token (or of the end of the input).
+        
+        Returns:
+            Tuple[int, int]: (line, column), both starting at 1
+        """
+        return self.line, self.column
+    
+    def error(self, message: str) -> ParseException:
+        """
+        Create a ParseException located at the current token.
+        
+        Args:
+            message (str): Error message describing the parsing problem
+            
+        Returns:
+            ParseException: The exception, for the caller to raise
+        """
+        return ParseException(message, self.line, self.column)
+    
     def skip_token(self, expected_token: str):
         """
         Skip the current token if it matches the expected token.
@@ -63,9 +95,9 @@ class Context:
         current = self.current_token()
         
         if current is None:
-            raise ParseException(f"Error: '{expected_token}' is expected, but no more tokens found.")
+            raise self.error(f"Error: '{expected_token}' is expected, but no more tokens found.")
         elif current != expected_token:
-            raise ParseException(f"Error: '{expected_token}' is expected, but '{current}' is found.")
+            raise self.error(f"Error: '{expected_token}' is expected, but '{current}' is found.")
         
         self.next_token()
     
@@ -82,12 +114,12 @@ class Context:
         current = self.current_token()
         
         if current is None:
-            raise ParseException("Error: No more tokens.")
+            raise self.error("Error: No more tokens.")
         
         try:
             return int(current)
         except ValueError as e:
-            raise ParseException(f"Error: Cannot convert '{current}' to number: {e}")
+            raise self.error(f"Error: Cannot convert '{current}' to number: {e}")
     
     def has_more_tokens(self) -> bool:
         """
@@ -102,14 +134,19 @@ class Context:
         """
         Get all remaining tokens from current position.
         
+        This reads the rest of the input (the context itself stays at the
+        current token), so it is meant for debugging small programs.
+        
         Returns:
             List[str]: List of remaining tokens
         """
-        if self.index <= len(self.tokens):
-            return self.tokens[self.index-1:]
-        return []
+        if self.last_token is None:
+            return []
+        rest = list(self._tokens)
+        self._tokens = iter(rest)
+        return [self.last_token] + [token.text for token in rest]
     
     def __str__(self) -> str:
         """String representation of the context."""
-        remaining = len(self.tokens) - self.index + 1
-        return f"Context(current='{self.current_token()}', remaining={remaining})"
+        return (f"Context(current='{self.current_token()}', "
+                f"line={self.line}, column={self.column})")
@@ -8,12 +8,27 @@ Key concepts demonstrated:
 2. Recursive descent parsing
 3. Abstract syntax tree construction
 4. Language interpretation and execution
+5. Compiling the AST to bytecode for a fast virtual machine
 """
 
+import mmap
 import os
+import tempfile
+import time
+import tracemalloc
 from context import Context
 from program_node import ProgramNode
+from primitive_command_node import PrimitiveCommandNode
+from repeat_command_node import RepeatCommandNode
+from batch_runner import run_programs
+from parse_cache import ParseCache
 from parse_exception import ParseException
+from tokenizer import Tokenizer
+from turtle_compiler import TurtleCompiler, TurtleVM
+
+
+# Parsed programs, shared by the demonstrations
+PARSE_CACHE = ParseCache()
 
 
 class TurtleInterpreter:
@@ -22,8 +37,14 @@ class TurtleInterpreter:
     This demonstrates how the parsed AST can be interpreted/executed.
     """
     
-    def __init__(self):
-        """Initialize the turtle interpreter."""
+    def __init__(self, trace: bool = True):
+        """
+        Initialize the turtle interpreter.
+
+        Args:
+            trace (bool): Print every executed command
+        """
+        self.trace = trace
         self.x = 0
         self.y = 0
         self.direction = 0  # 0=North, 1=East, 2=South, 3=West
@@ -36,9 +57,11 @@ class TurtleInterpreter:
         Args:
             program_node: The root program node to execute
         """
-        print(f"Starting execution at position ({self.x}, {self.y})")
+        if self.trace:
+            print(f"Starting execution at position ({self.x}, {self.y})")
         self._execute_command_list(program_node.command_list_node)
-        print(f"Execution completed at position ({self.x}, {self.y})")
+        if self.trace:
+            print(f"Execution completed at position ({self.x}, {self.y})")
         
     def _execute_command_list(self, command_list_node):
         """Execute a list of commands."""
@@ -47,9 +70,6 @@ class TurtleInterpreter:
     
     def _execute_command(self, command_node):
         """Execute a single command (primitive or repeat)."""
-        from primitive_command_node import PrimitiveCommandNode
-        from repeat_command_node import RepeatCommandNode
-        
         if isinstance(command_node, PrimitiveCommandNode):
             self._execute_primitive(command_node)
         elif isinstance(command_node, RepeatCommandNode):
@@ -71,27 +91,32 @@ class TurtleInterpreter:
                 self.x -= 1
             
             self.path.append((self.x, self.y))
-            print(f"  go -> moved to ({self.x}, {self.y})")
+            if self.trace:
+                print(f"  go -> moved to ({self.x}, {self.y})")
             
         elif command == "right":
             # Turn right (clockwise)
             self.direction = (self.direction + 1) % 4
-            directions = ["North", "East", "South", "West"]
-            print(f"  right -> now facing {directions[self.direction]}")
+            if self.trace:
+                directions = ["North", "East", "South", "West"]
+                print(f"  right -> now facing {directions[self.direction]}")
             
         elif command == "left":
             # Turn left (counter-clockwise)
             self.direction = (self.direction - 1) % 4
-            directions = ["North", "East", "South", "West"]
-            print(f"  left -> now facing {directions[self.direction]}")
+            if self.trace:
+                directions = ["North", "East", "South", "West"]
+                print(f"  left -> now facing {directions[self.direction]}")
     
     def _execute_repeat(self, repeat_node):
         """Execute a repeat command."""
         count = repeat_node.get_number()
-        print(f"  repeat {count} times:")
+        if self.trace:
+            print(f"  repeat {count} times:")
         
         for i in range(count):
-            print(f"    iteration {i + 1}:")
+            if self.trace:
+                print(f"    iteration {i + 1}:")
             self._execute_command_list(repeat_node.get_command_list())
     
     def get_path(self):
@@ -152,9 +177,7 @@ def demonstrate_execution():
         print(f"Program: {program_text}")
         
         try:
-            context = Context(program_text)
-            program_node = ProgramNode()
-            program_node.parse(context)
+            program_node = PARSE_CACHE.parse(program_text)
             print(f"Parsed AST: {program_node}")
             
             interpreter.reset()
@@ -168,31 +191,94 @@ def demonstrate_execution():
             print(f"❌ Error: {e}")
 
 
+def demonstrate_compilation():
+    """
+    Demonstrate compiling the AST to bytecode and running it on the VM.
+    """
+    print("\n=== Compilation Demonstration ===")
+    
+    program_text = "program repeat 4 go right end end"
+    program_node = ProgramNode()
+    program_node.parse(Context(program_text))
+    print(f"Program: {program_text}")
+    
+    program = TurtleCompiler(fold=False).compile(program_node)
+    print(f"\nBytecode ({len(program)} words):")
+    for line in program.disassemble():
+        print(line)
+    vm = TurtleVM(record_path=True)
+    vm.run(program)
+    print(f"Final path: {vm.get_path()}")
+    
+    folded = TurtleCompiler().compile(program_node)
+    print(f"\nFolded bytecode ({len(folded)} words):")
+    for line in folded.disassemble():
+        print(line)
+    
+    # Nested repeats: the tree walker and the unfolded VM execute every
+    # command, the folded program computes the result in closed form.
+    program_text = "program repeat 200 repeat 500 go go right go left end right go left end end"
+    program_node = ProgramNode()
+    program_node.parse(Context(program_text))
+    print(f"\nProgram: {program_text}")
+    
+    interpreter = TurtleInterpreter(trace=False)
+    start = time.perf_counter()
+    interpreter.execute_program(program_node)
+    walk_time = time.perf_counter() - start
+    
+    vm = TurtleVM()
+    program = TurtleCompiler(fold=False).compile(program_node)
+    start = time.perf_counter()
+    vm.run(program)
+    vm_time = time.perf_counter() - start
+    
+    folded_vm = TurtleVM()
+    start = time.perf_counter()
+    folded = TurtleCompiler().compile(program_node)
+    folded_vm.run(folded)
+    folded_time = time.perf_counter() - start
+    
+    print(f"  Tree walk:      ({interpreter.x}, {interpreter.y}) in {walk_time * 1000:8.2f} ms")
+    print(f"  VM:             ({vm.x}, {vm.y}) in {vm_time * 1000:8.2f} ms")
+    print(f"  Folded VM:      ({folded_vm.x}, {folded_vm.y}) in {folded_time * 1000:8.2f} ms"
+          " (including compilation)")
+    
+    program_text = "program repeat 1000000 repeat 1000000 go right go left end go end end"
+    program_node = ProgramNode()
+    program_node.parse(Context(program_text))
+    folded_vm.reset()
+    start = time.perf_counter()
+    folded_vm.run(TurtleCompiler().compile(program_node))
+    folded_time = time.perf_counter() - start
+    print(f"\nProgram: {program_text}")
+    print(f"  Folded VM:      ({folded_vm.x}, {folded_vm.y}) in {folded_time * 1000:8.2f} ms")
+
+
 def parse_file_programs():
     """
     Parse programs from the program.txt file (matching Java version).
+    
+    The file is read one line at a time; errors report the line and column
+    in the file.
     """
     print("\n=== File-based Program Parsing ===")
     
     try:
         if os.path.exists("program.txt"):
             with open("program.txt", "r") as f:
-                lines = f.readlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                program_text = line.strip()
-                if not program_text:
-                    continue
+                for line_num, line in enumerate(f, 1):
+                    program_text = line.strip()
+                    if not program_text:
+                        continue
+                        
+                    print(f"\nLine {line_num}: \"{program_text}\"")
                     
-                print(f"\nLine {line_num}: \"{program_text}\"")
-                
-                try:
-                    context = Context(program_text)
-                    program_node = ProgramNode()
-                    program_node.parse(context)
-                    print(f"Parsed: {program_node}")
-                except ParseException as e:
-                    print(f"❌ Parse error: {e}")
+                    try:
+                        program_node = PARSE_CACHE.parse(line, line_num)
+                        print(f"Parsed: {program_node}")
+                    except ParseException as e:
+                        print(f"❌ Parse error: {e}")
         else:
             print("program.txt file not found. Creating it...")
             # The file should already exist from our creation above
@@ -201,6 +287,81 @@ def parse_file_programs():
         print(f"Error reading file: {e}")
 
 
+def demonstrate_streaming_parse():
+    """
+    Demonstrate parsing a large generated program straight from an mmap.
+    """
+    print("\n=== Streaming Parse Demonstration ===")
+    
+    body = "repeat 3 go right go left end go\n"
+    repeats = 60000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "generated.txt")
+        with open(path, "w") as f:
+            f.write("program\n")
+            for _ in range(repeats):
+                f.write(body)
+            f.write("end\n")
+        size = os.path.getsize(path)
+        print(f"Generated program: {size / 1e6:.1f} MB, {repeats + 1} lines")
+        
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = time.perf_counter()
+            count = sum(1 for _ in Tokenizer(data))
+            elapsed = time.perf_counter() - start
+            # second pass only to measure memory (tracing slows it down)
+            data.seek(0)
+            tracemalloc.start()
+            for _ in Tokenizer(data):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"Tokenized {count} tokens in {elapsed * 1000:.0f} ms, "
+                  f"peak memory {peak / 1024:.0f} KB")
+            
+            data.seek(0)
+            start = time.perf_counter()
+            program_node = ProgramNode()
+            program_node.parse(Context(data))
+            elapsed = time.perf_counter() - start
+            vm = TurtleVM()
+            vm.run(TurtleCompiler().compile(program_node))
+            print(f"Parsed in {elapsed * 1000:.0f} ms, final position ({vm.x}, {vm.y})")
+        
+        # A typo deep inside the file is reported with its exact location
+        with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as data:
+            typo = data.find(b"right", len(data) * 3 // 4)
+            data[typo:typo + 5] = b"rihgt"
+        with open(path, "rb") as f:
+            try:
+                program_node = ProgramNode()
+                program_node.parse(Context(f))
+            except ParseException as e:
+                print(f"Expected error caught: {e}")
+
+
+def demonstrate_batch_execution():
+    """
+    Demonstrate parsing and executing many programs on a process pool.
+    """
+    print("\n=== Batch Execution Demonstration ===")
+    
+    texts = [
+        "program go go right go end",
+        "program repeat 4 go right end end",
+        "program repeat 3 go right go right go left end end",
+        "program repeat 4 go right end end",
+        "program jump end",
+    ]
+    results = run_programs(texts, record_path=True, max_workers=2, chunk_size=2)
+    for text, result in zip(texts, results):
+        print(f"\n{text}")
+        if result.error:
+            print(f"  ❌ {result.error}")
+        else:
+            print(f"  final position ({result.x}, {result.y}), path {result.path}")
+
+
 def demonstrate_error_handling():
     """
     Demonstrate error handling for invalid programs.
@@ -248,7 +409,10 @@ def main():
     # Demonstrate different aspects of the pattern
     demonstrate_parsing()
     demonstrate_execution()
+    demonstrate_compilation()
     parse_file_programs()
+    demonstrate_streaming_parse()
+    demonstrate_batch_execution()
     demonstrate_error_handling()
     
     print(f"\n{'='*60}")
@@ -260,6 +424,7 @@ def main():
     print("✅ Recursive Structure: Complex expressions built from simple ones")
     print("✅ Error Handling: Clear error messages for invalid syntax")
     print("✅ AST Construction: Builds abstract syntax tree for later processing")
+    print("✅ Compilation: The same AST can be compiled for a faster VM")
     
     print("\nInterpreter Pattern Use Cases:")
     print("- Domain-specific languages (DSLs)")
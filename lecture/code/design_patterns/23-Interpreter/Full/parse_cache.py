@@ -0,0 +1,211 @@
+"""
+Interpreter Pattern - Parse Cache
+Parsing the same program text always builds the same syntax tree, so the
+tree can be kept and reused instead of tokenizing and parsing again.
+
+ParseCache keys trees by a hash of the program text and keeps the most
+recently used ones (LRU). It can also keep every tree it has built in a
+store file, so a later run of the same programs skips parsing entirely.
+
+The store is append-only: a header "=4sH" (b"PCST", version), then one
+record per tree, "=16sI" (key, size) followed by the pickled tree. Only
+the key -> offset index lives in memory (built by walking the record
+headers on open); a tree is read from disk when it is not in the LRU, so
+memory stays bounded by max_size however many trees the store holds.
+
+Cached trees are shared between callers and must not be modified.
+Programs that fail to parse are not cached; they raise ParseException
+every time.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from struct import Struct
+from typing import Dict, Optional
+
+from context import Context
+from program_node import ProgramNode
+
+
+_MAGIC = b"PCST"
+_VERSION = 1
+_HEADER = Struct("=4sH")     # magic, version
+_RECORD = Struct("=16sI")    # key, size of the pickled tree
+
+
+class ParseCache:
+    """
+    LRU cache of parsed programs, with an optional on-disk store.
+
+    Usage:
+        cache = ParseCache(max_size=1000, store_path="programs.cache")
+        program_node = cache.parse("program repeat 4 go right end end")
+        cache.close()
+    """
+
+    def __init__(self, max_size: int = 1024, store_path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of trees kept in memory
+            store_path (str, optional): Store file of parsed trees; opened
+                                        (or created) now, appended to on every miss
+
+        Raises:
+            ValueError: If store_path is not a parse cache store
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be positive")
+        self._max_size = max_size
+        self._entries: "OrderedDict[bytes, ProgramNode]" = OrderedDict()
+        self._store_path = store_path
+        self._store: Dict[bytes, int] = {}  # key -> offset of the record
+        self._store_file = None
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        if store_path is not None:
+            self._open_store()
+
+    def _open_store(self) -> None:
+        """Open the store file and index its records."""
+        exists = os.path.exists(self._store_path)
+        f = self._store_file = open(self._store_path, "r+b" if exists else "w+b")
+        if not exists:
+            f.write(_HEADER.pack(_MAGIC, _VERSION))
+            return
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or _HEADER.unpack(header) != (_MAGIC, _VERSION):
+            f.close()
+            raise ValueError(f"{self._store_path} is not a parse cache store")
+        size = f.seek(0, os.SEEK_END)
+        end = _HEADER.size
+        while end + _RECORD.size <= size:
+            f.seek(end)
+            key, length = _RECORD.unpack(f.read(_RECORD.size))
+            if end + _RECORD.size + length > size:
+                break
+            self._store[key] = end
+            end += _RECORD.size + length
+        if end < size:
+            # A torn record from an interrupted write
+            f.truncate(end)
+        f.seek(end)
+
+    def _load(self, offset: int) -> ProgramNode:
+        """Read the tree of the record at offset."""
+        f = self._store_file
+        end = f.tell()
+        f.seek(offset)
+        length = _RECORD.unpack(f.read(_RECORD.size))[1]
+        program_node = pickle.loads(f.read(length))
+        f.seek(end)
+        return program_node
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """
+        Get the cache key of a program text.
+
+        Returns:
+            bytes: A 16-byte BLAKE2 digest of the text
+        """
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def parse(self, text: str, line: int = 1) -> ProgramNode:
+        """
+        Get the parsed tree of a program, parsing it only if needed.
+
+        Args:
+            text (str): The program text
+            line (int): Line number of the text, used in error messages
+
+        Returns:
+            ProgramNode: The (shared) parsed tree
+
+        Raises:
+            ParseException: If the program does not parse
+        """
+        key = self.key(text)
+        entries = self._entries
+        program_node = entries.get(key)
+        if program_node is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return program_node
+
+        offset = self._store.get(key)
+        if offset is not None:
+            program_node = self._load(offset)
+            self.store_hits += 1
+        else:
+            program_node = ProgramNode()
+            program_node.parse(Context(text, line))
+            self.misses += 1
+            if self._store_file is not None:
+                data = pickle.dumps(program_node, pickle.HIGHEST_PROTOCOL)
+                self._store[key] = self._store_file.tell()
+                self._store_file.write(_RECORD.pack(key, len(data)) + data)
+
+        entries[key] = program_node
+        if len(entries) > self._max_size:
+            entries.popitem(last=False)
+        return program_node
+
+    def save(self) -> None:
+        """
+        Make the trees parsed so far durable in the store file.
+
+        New trees are appended to the store as they are parsed; this
+        flushes and fsyncs them. A crash before save() loses at most the
+        unsaved trees: a torn last record is cut off on the next open.
+        Does nothing without a store_path.
+        """
+        if self._store_file is None:
+            return
+        self._store_file.flush()
+        os.fsync(self._store_file.fileno())
+
+    def close(self) -> None:
+        """Save and close the store file (the LRU trees in memory are kept)."""
+        if self._store_file is None:
+            return
+        try:
+            self.save()
+        finally:
+            self._store_file.close()
+            self._store_file = None
+            self._store.clear()
+
+    def clear(self) -> None:
+        """Forget the trees held in memory (the store is kept)."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: hits, store_hits, misses, size and stored
+        """
+        return {"hits": self.hits, "store_hits": self.store_hits,
+                "misses": self.misses, "size": len(self._entries),
+                "stored": len(self._store)}
+
+    def __enter__(self) -> "ParseCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of trees held in memory."""
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        """String representation of the cache."""
+        return (f"ParseCache(size={len(self._entries)}/{self._max_size}, "
+                f"hits={self.hits}, store_hits={self.store_hits}, misses={self.misses})")
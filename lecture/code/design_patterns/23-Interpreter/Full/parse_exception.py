@@ -3,6 +3,8 @@ Interpreter Pattern - Parse Exception
 Custom exception for parsing errors in the mini language.
 """
 
+from typing import Optional
+
 
 class ParseException(Exception):
     """
@@ -10,16 +12,23 @@ class ParseException(Exception):
     Provides specific error messages for debugging the mini language.
     """
     
-    def __init__(self, message: str):
+    def __init__(self, message: str, line: Optional[int] = None,
+                 column: Optional[int] = None):
         """
         Initialize the parse exception.
         
         Args:
             message (str): Error message describing the parsing problem
+            line (int, optional): Line where the problem was found
+            column (int, optional): Column where the problem was found
         """
         super().__init__(message)
         self.message = message
+        self.line = line
+        self.column = column
     
     def __str__(self) -> str:
         """String representation of the exception."""
-        return f"ParseException: {self.message}"
+        if self.line is None:
+            return f"ParseException: {self.message}"
+        return f"ParseException: {self.message} (line {self.line}, column {self.column})"
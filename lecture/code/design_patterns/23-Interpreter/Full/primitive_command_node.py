@@ -6,7 +6,6 @@ Grammar: <primitive command> ::= go | right | left
 
 from typing import TYPE_CHECKING
 from node import Node
-from parse_exception import ParseException
 
 if TYPE_CHECKING:
     from context import Context
@@ -35,9 +34,9 @@ class PrimitiveCommandNode(Node):
         current_token = context.current_token()
         
         if current_token is None:
-            raise ParseException("Error: Missing <primitive command>")
+            raise context.error("Error: Missing <primitive command>")
         elif current_token not in self.VALID_COMMANDS:
-            raise ParseException(f"Error: Unknown <primitive command>: '{current_token}'")
+            raise context.error(f"Error: Unknown <primitive command>: '{current_token}'")
         
         self.name = current_token
         context.skip_token(current_token)
@@ -0,0 +1,116 @@
+"""
+Interpreter Pattern - Tokenizer
+Splits program text into whitespace-separated tokens lazily, remembering the
+line and column where each token starts.
+
+The source can be a string, a text or binary file object, or an mmap. File
+objects and mmaps are read in fixed-size chunks, so even a multi-megabyte
+generated program is tokenized without holding the source or the token list
+in memory.
+"""
+
+import codecs
+import re
+from typing import Iterator, NamedTuple, Tuple, Union
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WORD = re.compile(r"\S+")
+
+
+class Token(NamedTuple):
+    """A token and the position (1-based line and column) where it starts."""
+    text: str
+    line: int
+    column: int
+
+
+class Tokenizer:
+    """
+    Iterable of the tokens of a program source.
+
+    After the last token has been produced, get_end_location() tells where
+    the input ended, which is where errors like a missing 'end' are reported.
+    """
+
+    def __init__(self, source: Union[str, object],
+                 line: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the tokenizer.
+
+        Args:
+            source: Program text, or anything with a read(size) method
+                    returning str or bytes (file object, mmap)
+            line (int): Line number of the first line of the source
+            chunk_size (int): Characters or bytes read at a time
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self._source = source
+        self._chunk_size = chunk_size
+        self._line = line
+        self._column = 1
+
+    def _chunks(self) -> Iterator[str]:
+        """Read the source as text chunks (bytes are decoded as UTF-8)."""
+        if isinstance(self._source, str):
+            yield self._source
+            return
+        read = self._source.read
+        decoder = None
+        while True:
+            data = read(self._chunk_size)
+            if not data:
+                break
+            if isinstance(data, str):
+                yield data
+            else:
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                yield decoder.decode(data)
+        if decoder is not None:
+            yield decoder.decode(b"", final=True)
+
+    def __iter__(self) -> Iterator[Token]:
+        """Yield the tokens in order."""
+        finditer = _WORD.finditer
+        new_token = Token._make
+        line = self._line
+        column = 1     # column of the first character of text
+        pending = ""   # the start of a line (or token) that continues in the next chunk
+        for chunk in self._chunks():
+            text = pending + chunk
+            last_newline = text.rfind("\n")
+            if last_newline >= 0:
+                # complete lines: the column of a token is its index + 1
+                for text_line in text[:last_newline].split("\n"):
+                    for match in finditer(text_line):
+                        yield new_token((match.group(), line, column + match.start()))
+                    line += 1
+                    column = 1
+                text = text[last_newline + 1:]
+            # the unfinished last line: keep only a token that may continue
+            rest = len(text)
+            for match in finditer(text):
+                start, end = match.span()
+                if end == rest:
+                    rest = start
+                    break
+                yield new_token((match.group(), line, column + start))
+            pending = text[rest:]
+            column += rest
+            self._line, self._column = line, column
+        if pending:
+            yield new_token((pending, line, column))
+            self._column = column + len(pending)
+
+    def get_end_location(self) -> Tuple[int, int]:
+        """
+        Get the position just after the input read so far.
+
+        Returns:
+            tuple: (line, column)
+        """
+        return self._line, self._column
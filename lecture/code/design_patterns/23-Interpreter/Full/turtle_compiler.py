@@ -0,0 +1,342 @@
+"""
+Interpreter Pattern - Turtle Compiler and VM
+TurtleInterpreter walks the node objects every time a program runs, so a
+program with nested repeats costs one Python call per executed command.
+This module compiles a parsed ProgramNode once into a flat list of integer
+instructions and runs it with a small loop-based virtual machine.
+
+With folding enabled, the compiler also computes what a straight-line run of
+go/right/left does as a whole (a displacement plus a turn), and does the
+same for repeat blocks, so 'repeat 1000000 ...' costs O(body) instead of
+O(iterations). Folded programs only report the final position; compile with
+fold=False when every point of the path is needed.
+"""
+
+from typing import List, Tuple
+
+from program_node import ProgramNode
+from command_list_node import CommandListNode
+from primitive_command_node import PrimitiveCommandNode
+from repeat_command_node import RepeatCommandNode
+
+
+# Opcodes. LOOP takes one operand, REPEAT two, MOVE an index into the move
+# table.
+OP_GO = 0
+OP_RIGHT = 1
+OP_LEFT = 2
+OP_REPEAT = 3  # REPEAT <count> <exit>: start a loop; jump to exit if count is 0
+OP_LOOP = 4    # LOOP <target>: decrement the counter and jump back if not done
+OP_MOVE = 5    # MOVE <index>: apply a folded move
+OP_HALT = 6
+
+OPCODE_NAMES = ("GO", "RIGHT", "LEFT", "REPEAT", "LOOP", "MOVE", "HALT")
+DIRECTION_NAMES = ("North", "East", "South", "West")
+
+# (dx, dy) of one 'go' for each direction: 0=North, 1=East, 2=South, 3=West
+STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# A move is (dx, dy, turn): the displacement for a turtle facing North and
+# the number of quarter turns clockwise it ends up with.
+Move = Tuple[int, int, int]
+IDENTITY: Move = (0, 0, 0)
+PRIMITIVE_MOVES = {"go": (0, 1, 0), "right": (0, 0, 1), "left": (0, 0, 3)}
+
+
+def rotate(dx: int, dy: int, direction: int) -> Tuple[int, int]:
+    """Rotate a North-relative displacement to the given direction."""
+    if direction == 0:
+        return dx, dy
+    if direction == 1:
+        return dy, -dx
+    if direction == 2:
+        return -dx, -dy
+    return -dy, dx
+
+
+def compose(first: Move, second: Move) -> Move:
+    """Get the move that does first and then second."""
+    rx, ry = rotate(second[0], second[1], first[2])
+    return first[0] + rx, first[1] + ry, (first[2] + second[2]) % 4
+
+
+def power(move: Move, count: int) -> Move:
+    """
+    Get the move that repeats a move count times, in O(1).
+
+    Four repetitions always turn the turtle back to where it started, so
+    they add up to a plain translation that can be multiplied.
+    """
+    if count <= 0:
+        return IDENTITY
+    four = IDENTITY
+    for _ in range(4):
+        four = compose(four, move)
+    cycles, rest = divmod(count, 4)
+    result = (four[0] * cycles, four[1] * cycles, 0)
+    for _ in range(rest):
+        result = compose(result, move)
+    return result
+
+
+class CompiledProgram:
+    """
+    A program compiled to a flat instruction list.
+
+    code holds opcodes followed by their operands; moves is the table of
+    folded moves referenced by MOVE instructions.
+    """
+
+    def __init__(self, code: List[int], moves: List[Move], folded: bool):
+        self.code = code
+        self.moves = moves
+        self.folded = folded
+
+    def disassemble(self) -> List[str]:
+        """
+        Get a readable listing of the instructions.
+
+        Returns:
+            List[str]: One line per instruction
+        """
+        lines = []
+        pc = 0
+        code = self.code
+        while pc < len(code):
+            op = code[pc]
+            name = OPCODE_NAMES[op]
+            if op == OP_REPEAT:
+                lines.append(f"{pc:4d}  {name} {code[pc + 1]} (exit {code[pc + 2]})")
+                pc += 3
+            elif op == OP_LOOP:
+                lines.append(f"{pc:4d}  {name} {code[pc + 1]}")
+                pc += 2
+            elif op == OP_MOVE:
+                dx, dy, turn = self.moves[code[pc + 1]]
+                lines.append(f"{pc:4d}  {name} dx={dx} dy={dy} turn={turn}")
+                pc += 2
+            else:
+                lines.append(f"{pc:4d}  {name}")
+                pc += 1
+        return lines
+
+    def __len__(self) -> int:
+        """Number of code words (opcodes and operands)."""
+        return len(self.code)
+
+    def __str__(self) -> str:
+        """String representation of the compiled program."""
+        return f"CompiledProgram(words={len(self.code)}, folded={self.folded})"
+
+
+class TurtleCompiler:
+    """
+    Compiles a parsed ProgramNode into a CompiledProgram.
+    """
+
+    def __init__(self, fold: bool = True):
+        """
+        Initialize the compiler.
+
+        Args:
+            fold (bool): Fold straight-line runs and repeat blocks into
+                         closed-form moves (the path is then not available)
+        """
+        self.fold = fold
+
+    def compile(self, program_node: ProgramNode) -> CompiledProgram:
+        """
+        Compile a parsed program.
+
+        Args:
+            program_node (ProgramNode): The root of the parsed program
+
+        Returns:
+            CompiledProgram: The instructions
+        """
+        code: List[int] = []
+        moves: List[Move] = []
+        if self.fold:
+            move = self._fold_list(program_node.command_list_node)
+            if move != IDENTITY:
+                moves.append(move)
+                code += (OP_MOVE, 0)
+        else:
+            self._emit_list(program_node.command_list_node, code)
+        code.append(OP_HALT)
+        return CompiledProgram(code, moves, self.fold)
+
+    def _fold_list(self, command_list_node: CommandListNode) -> Move:
+        """Compute the combined move of a command list."""
+        result = IDENTITY
+        for command in command_list_node.command_nodes:
+            node = command.get_node()
+            if isinstance(node, PrimitiveCommandNode):
+                result = compose(result, PRIMITIVE_MOVES[node.get_name()])
+            else:
+                body = self._fold_list(node.get_command_list())
+                result = compose(result, power(body, node.get_number()))
+        return result
+
+    def _emit_list(self, command_list_node: CommandListNode, code: List[int]) -> None:
+        """Emit one instruction per command, with REPEAT/LOOP around repeat bodies."""
+        for command in command_list_node.command_nodes:
+            node = command.get_node()
+            if isinstance(node, PrimitiveCommandNode):
+                name = node.get_name()
+                code.append(OP_GO if name == "go" else OP_RIGHT if name == "right" else OP_LEFT)
+            elif isinstance(node, RepeatCommandNode):
+                start = len(code)
+                code += (OP_REPEAT, node.get_number(), 0)
+                body = len(code)
+                self._emit_list(node.get_command_list(), code)
+                code += (OP_LOOP, body)
+                code[start + 2] = len(code)
+
+
+class TurtleVM:
+    """
+    Runs compiled turtle programs.
+
+    The turtle state lives in local variables while the program runs; loop
+    counters are kept on a small stack. Tracing prints every instruction
+    and is off by default.
+    """
+
+    def __init__(self, record_path: bool = False, trace: bool = False):
+        """
+        Initialize the VM.
+
+        Args:
+            record_path (bool): Record every position the turtle visits
+            trace (bool): Print each executed instruction
+        """
+        self.record_path = record_path
+        self.trace = trace
+        self.reset()
+
+    def reset(self):
+        """Reset turtle to starting position."""
+        self.x = 0
+        self.y = 0
+        self.direction = 0
+        self.path = [(0, 0)]
+
+    def run(self, program: CompiledProgram) -> Tuple[int, int, int]:
+        """
+        Run a compiled program from the current turtle state.
+
+        Args:
+            program (CompiledProgram): The program to run
+
+        Returns:
+            tuple: Final (x, y, direction)
+
+        Raises:
+            ValueError: If a path is requested for a folded program
+        """
+        if self.record_path and program.folded:
+            raise ValueError("recording the path needs a program compiled with fold=False")
+        if self.trace:
+            self._run_traced(program)
+        else:
+            self._run_fast(program)
+        return self.x, self.y, self.direction
+
+    def _run_fast(self, program: CompiledProgram) -> None:
+        """The VM loop without tracing."""
+        code = program.code
+        moves = program.moves
+        x, y, direction = self.x, self.y, self.direction
+        path_append = self.path.append if self.record_path else None
+        counters = []
+        pc = 0
+        while True:
+            op = code[pc]
+            if op == OP_GO:
+                dx, dy = STEPS[direction]
+                x += dx
+                y += dy
+                if path_append is not None:
+                    path_append((x, y))
+                pc += 1
+            elif op == OP_RIGHT:
+                direction = (direction + 1) & 3
+                pc += 1
+            elif op == OP_LEFT:
+                direction = (direction - 1) & 3
+                pc += 1
+            elif op == OP_LOOP:
+                remaining = counters[-1] - 1
+                if remaining:
+                    counters[-1] = remaining
+                    pc = code[pc + 1]
+                else:
+                    counters.pop()
+                    pc += 2
+            elif op == OP_REPEAT:
+                count = code[pc + 1]
+                if count > 0:
+                    counters.append(count)
+                    pc += 3
+                else:
+                    pc = code[pc + 2]
+            elif op == OP_MOVE:
+                dx, dy, turn = moves[code[pc + 1]]
+                dx, dy = rotate(dx, dy, direction)
+                x += dx
+                y += dy
+                direction = (direction + turn) & 3
+                pc += 2
+            else:  # OP_HALT
+                break
+        self.x, self.y, self.direction = x, y, direction
+
+    def _run_traced(self, program: CompiledProgram) -> None:
+        """The VM loop with a printed trace of every instruction."""
+        code = program.code
+        counters = []
+        pc = 0
+        while code[pc] != OP_HALT:
+            op = code[pc]
+            if op == OP_GO:
+                dx, dy = STEPS[self.direction]
+                self.x += dx
+                self.y += dy
+                if self.record_path:
+                    self.path.append((self.x, self.y))
+                print(f"  {pc:4d} GO -> moved to ({self.x}, {self.y})")
+                pc += 1
+            elif op in (OP_RIGHT, OP_LEFT):
+                self.direction = (self.direction + (1 if op == OP_RIGHT else -1)) & 3
+                print(f"  {pc:4d} {OPCODE_NAMES[op]} -> now facing "
+                      f"{DIRECTION_NAMES[self.direction]}")
+                pc += 1
+            elif op == OP_REPEAT:
+                count = code[pc + 1]
+                print(f"  {pc:4d} REPEAT {count}")
+                if count > 0:
+                    counters.append(count)
+                    pc += 3
+                else:
+                    pc = code[pc + 2]
+            elif op == OP_LOOP:
+                counters[-1] -= 1
+                if counters[-1]:
+                    pc = code[pc + 1]
+                else:
+                    counters.pop()
+                    pc += 2
+            else:  # OP_MOVE
+                dx, dy, turn = program.moves[code[pc + 1]]
+                dx, dy = rotate(dx, dy, self.direction)
+                self.x += dx
+                self.y += dy
+                self.direction = (self.direction + turn) & 3
+                print(f"  {pc:4d} MOVE -> moved to ({self.x}, {self.y}), facing "
+                      f"{DIRECTION_NAMES[self.direction]}")
+                pc += 2
+
+    def get_path(self):
+        """Get the path taken by the turtle."""
+        return self.path.copy()
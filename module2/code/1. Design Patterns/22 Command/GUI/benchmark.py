@@ -0,0 +1,141 @@
+"""
+Benchmark for the drawing app's command history
+
+Records a long drawing session (default: 1M strokes) and compares the
+original storage, a deque of DrawCommand objects plus one dict per drawn
+point, with the columnar StrokeHistory/StrokeColumns:
+- memory used by the command history and by the drawn points
+- time to replay the history (MacroCommand.execute) onto a DrawCanvas
+- time to paint the canvas: the first paint composites every point into
+  the off-screen raster, later paints only add the new points
+- undo: restoring the raster from a checkpoint plus a short replay tail
+
+Runs without a display (Qt "offscreen" platform).
+
+Usage:
+    python3 benchmark.py [strokes]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from command.macro_command import MacroCommand
+from drawer.draw_canvas import DrawCanvas
+from drawer.draw_command import DrawCommand
+from drawer.stroke_history import StrokeColumns, StrokeHistory
+
+COLORS = ["red", "blue", "green", "black", "purple", "orange"]
+
+
+def generate_strokes(count):
+    """Random-walk mouse drags: (x, y, color, radius) tuples"""
+    rng = random.Random(0)
+    strokes = []
+    x, y, color = 250, 200, "red"
+    for i in range(count):
+        if i % 500 == 0:
+            color = rng.choice(COLORS)
+        x = min(max(x + rng.randint(-3, 3), 0), 499)
+        y = min(max(y + rng.randint(-3, 3), 0), 399)
+        strokes.append((x, y, color, 6))
+    return strokes
+
+
+def measure(label, build):
+    """Report the memory allocated by build() and return its result"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"  {label:<42} {size / 1e6:8.1f} MB  (built in {elapsed:.2f} s)")
+    return result
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<42} {elapsed * 1000:8.0f} ms")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    app = QApplication(sys.argv)
+    canvas = DrawCanvas(500, 400, None)
+    strokes = generate_strokes(count)
+    print(f"{count} strokes")
+
+    print("\nMemory:")
+    # commands are added to the containers directly, skipping the log line
+    # MacroCommand.append() prints for every command
+    commands = measure("deque of DrawCommand objects",
+                       lambda: deque(DrawCommand(canvas, *stroke) for stroke in strokes))
+    measure("list of point dicts",
+            lambda: [{'x': x, 'y': y, 'color': color, 'radius': radius}
+                     for x, y, color, radius in strokes])
+
+    def build_history():
+        history = StrokeHistory()
+        for cmd in commands:
+            history.append(cmd)
+        return history
+
+    history = measure("StrokeHistory (columns)", build_history)
+
+    def build_columns():
+        columns = StrokeColumns()
+        for stroke in strokes:
+            columns.append(*stroke)
+        return columns
+
+    measure("StrokeColumns (drawn points)", build_columns)
+    print(f"  column buffers: {history.nbytes() / 1e6:.1f} MB")
+
+    print("\nReplay onto the canvas (MacroCommand.execute):")
+    object_macro = MacroCommand()
+    object_macro.commands = commands
+    column_macro = MacroCommand(history)
+
+    canvas.clear_canvas()
+    timed("DrawCommand objects", object_macro.execute)
+    replayed = canvas.drawn_points
+    canvas.drawn_points = StrokeColumns()
+    timed("StrokeHistory columns", column_macro.execute)
+    assert list(replayed.strokes()) == list(canvas.drawn_points.strokes())
+
+    print("\nPaint:")
+    timed(f"first paint, rasterize {len(canvas.drawn_points)} points", canvas.grab)
+
+    def draw_and_paint():
+        canvas.draw_stroke(100, 100, "blue", 6)
+        canvas.grab()
+
+    timed("draw one more point and paint", draw_and_paint)
+
+    print("\nUndo (MacroCommand.undo + DrawCanvas.rewind, then paint):")
+    history.pop()  # the extra point drawn above is not in the history
+
+    def undo(steps):
+        for _ in range(steps):
+            history.pop()
+        canvas.rewind(len(history))
+        canvas.grab()
+
+    timed("undo 1 command", lambda: undo(1))
+    timed("undo 100 commands", lambda: undo(100))
+    timed("undo 1000 commands", lambda: undo(1000))
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
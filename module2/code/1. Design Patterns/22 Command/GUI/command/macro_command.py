@@ -16,9 +16,20 @@ class MacroCommand(Command):
     - Create macro recordings in applications
     """
     
-    def __init__(self):
-        """Initialize an empty macro command"""
-        self.commands = deque()
+    def __init__(self, commands=None):
+        """
+        Initialize an empty macro command.
+        
+        Args:
+            commands (optional): Empty container to keep the commands in,
+                                 e.g. a drawer.StrokeHistory that stores
+                                 DrawCommands in compact columns.
+                                 Defaults to a deque. A StrokeHistory
+                                 accepts any Command, but gives back
+                                 DrawCommands as equal rebuilt copies, not
+                                 the appended objects.
+        """
+        self.commands = deque() if commands is None else commands
     
     def execute(self):
         """
@@ -26,7 +37,13 @@ class MacroCommand(Command):
         
         This demonstrates the Composite pattern - a MacroCommand can be treated
         the same way as a single Command, but it actually executes multiple commands.
+        A command container that can replay itself (has an execute() method)
+        is asked to do so directly.
         """
+        replay = getattr(self.commands, 'execute', None)
+        if replay is not None:
+            replay()
+            return
         for cmd in self.commands:
             cmd.execute()
     
@@ -7,6 +7,7 @@ how to perform the actual drawing operations.
 
 from .drawable import Drawable
 from .draw_command import DrawCommand
+from .stroke_history import StrokeColumns, StrokeHistory
 from .draw_canvas import DrawCanvas
 
-__all__ = ['Drawable', 'DrawCommand', 'DrawCanvas']
+__all__ = ['Drawable', 'DrawCommand', 'StrokeColumns', 'StrokeHistory', 'DrawCanvas']
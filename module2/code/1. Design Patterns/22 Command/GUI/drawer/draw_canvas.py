@@ -1,7 +1,16 @@
+from collections import deque
+
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QImage
 from drawer.drawable import Drawable
+from drawer.stroke_history import StrokeColumns
+
+
+# A copy of the raster is kept every CHECKPOINT_INTERVAL points, so undo
+# only has to redraw the points since the closest checkpoint
+CHECKPOINT_INTERVAL = 500
+MAX_CHECKPOINTS = 10
 
 
 class DrawCanvas(QWidget, Drawable):
@@ -11,6 +20,10 @@ class DrawCanvas(QWidget, Drawable):
     This class serves as both the receiver (implements Drawable) and the user interface
     for drawing operations. Each mouse click/drag creates a DrawCommand that gets
     stored in the command history for undo/redo functionality.
+    
+    Drawn points are composited once into an off-screen raster (QImage), and
+    paint events only copy the part of the raster that changed, so painting
+    does not get slower as the drawing grows.
     """
     
     def __init__(self, width, height, history):
@@ -21,8 +34,15 @@ class DrawCanvas(QWidget, Drawable):
         self.color = 'red'
         self.radius = 6
         
-        # List to store drawn points for visual rendering
-        self.drawn_points = []
+        # Drawn points for visual rendering, kept in compact columns
+        # (x, y, color, radius) rather than one dict per point
+        self.drawn_points = StrokeColumns()
+        
+        # Off-screen raster holding the first _rastered drawn points, plus
+        # recent (point count, raster copy) checkpoints for undo
+        self.raster = self._blank_raster()
+        self._rastered = 0
+        self._checkpoints = deque(maxlen=MAX_CHECKPOINTS)
         
         # Set up the widget
         self.setFixedSize(width, height)
@@ -38,37 +58,102 @@ class DrawCanvas(QWidget, Drawable):
         This method is called by DrawCommand.execute()
         """
         # Store the point with current color for rendering
-        point_data = {
-            'x': x,
-            'y': y,
-            'color': self.color,
-            'radius': self.radius
-        }
-        self.drawn_points.append(point_data)
+        self.drawn_points.append(x, y, self.color, self.radius)
         
-        # Trigger a repaint of the widget
-        self.update()
+        # Trigger a repaint of the area around the point
+        self._damage(x, y, self.radius)
     
-    def paintEvent(self, event):
+    def draw_stroke(self, x, y, color, radius):
         """
-        PyQt6 paint event handler.
-        This method is called automatically when the widget needs to be redrawn.
+        Draw a point with an explicit color and radius.
+        Called when a StrokeHistory is replayed; the current drawing state
+        is left alone, so there is nothing to save and restore.
         """
-        painter = QPainter(self)
+        self.drawn_points.append(x, y, color, radius)
+        self._damage(x, y, radius)
+    
+    def _damage(self, x, y, radius):
+        """Schedule a repaint of the area covered by a point"""
+        self.update(x - radius - 1, y - radius - 1, radius * 2 + 3, radius * 2 + 3)
+    
+    def _blank_raster(self):
+        """Create an empty (transparent) raster the size of the canvas"""
+        image = QImage(self.canvas_width, self.canvas_height,
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        return image
+    
+    def _rasterize(self, start, stop):
+        """Composite drawn points [start, stop) into the raster"""
+        points = self.drawn_points
+        colors = [QColor(name) for name in points.palette]
+        painter = QPainter(self.raster)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Draw all stored points
-        for point in self.drawn_points:
-            # Set up the painter for this point
-            color = QColor(point['color'])
-            painter.setPen(QPen(color, 1))
-            painter.setBrush(QBrush(color))
+        # The pen and brush only change when the color does
+        current = None
+        for i in range(start, stop):
+            color = points.colors[i]
+            if color != current:
+                current = color
+                painter.setPen(QPen(colors[color], 1))
+                painter.setBrush(QBrush(colors[color]))
             
             # Draw the circle
-            x = point['x']
-            y = point['y']
-            radius = point['radius']
+            x = points.xs[i]
+            y = points.ys[i]
+            radius = points.radii[i]
             painter.drawEllipse(x - radius, y - radius, radius * 2, radius * 2)
+        painter.end()
+    
+    def _update_raster(self):
+        """Composite the points drawn since the last paint, taking checkpoints"""
+        count = len(self.drawn_points)
+        while self._rastered < count:
+            checkpoint = (self._rastered // CHECKPOINT_INTERVAL + 1) * CHECKPOINT_INTERVAL
+            stop = min(checkpoint, count)
+            self._rasterize(self._rastered, stop)
+            self._rastered = stop
+            if stop == checkpoint:
+                self._checkpoints.append((stop, self.raster.copy()))
+    
+    def paintEvent(self, event):
+        """
+        PyQt6 paint event handler.
+        This method is called automatically when the widget needs to be redrawn.
+        New points are composited into the raster first; then only the
+        damaged region of the raster is copied to the widget.
+        """
+        self._update_raster()
+        
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.drawImage(rect, self.raster, rect)
+    
+    def rewind(self, count):
+        """
+        Go back to showing only the first count drawn points (after an undo).
+        
+        The raster is restored from the closest checkpoint at or before
+        count, and only the points after it are drawn again, instead of
+        replaying the whole history.
+        
+        Args:
+            count (int): Number of points to keep
+        """
+        if count >= len(self.drawn_points):
+            return
+        self.drawn_points.truncate(count)
+        if self._rastered > count:
+            while self._checkpoints and self._checkpoints[-1][0] > count:
+                self._checkpoints.pop()
+            if self._checkpoints:
+                self._rastered, checkpoint = self._checkpoints[-1]
+                self.raster = checkpoint.copy()
+            else:
+                self._rastered = 0
+                self.raster = self._blank_raster()
+        self.update()
     
     def mousePressEvent(self, event):
         """Handle mouse press events (start of drawing)"""
@@ -158,6 +243,9 @@ class DrawCanvas(QWidget, Drawable):
     def clear_canvas(self):
         """Clear the visual representation of the canvas"""
         self.drawn_points.clear()
+        self.raster = self._blank_raster()
+        self._rastered = 0
+        self._checkpoints.clear()
         self.update()  # Trigger repaint
     
     def set_color(self, color):
@@ -17,3 +17,26 @@ class Drawable: # (metaclass=DrawableMetaClass):
             drawing operations are visualized.
         """
         pass
+
+    def draw_stroke(self, x, y, color, radius):
+        """
+        Draw a point with the given color and radius.
+        
+        Used when replaying commands straight from a StrokeHistory. The
+        default does what DrawCommand.execute() does: it switches to the
+        stroke's drawing state (if the drawable has one), draws, and
+        switches back. Drawables can override it with a faster version.
+        
+        Args:
+            x (int): X-coordinate for the drawing operation
+            y (int): Y-coordinate for the drawing operation
+            color (str): Color to use for drawing
+            radius (int): Radius to use for drawing
+        """
+        if hasattr(self, 'get_drawing_state'):
+            saved_state = self.get_drawing_state()
+            self.set_drawing_state(color, radius)
+            self.draw(x, y)
+            self.set_drawing_state(saved_state['color'], saved_state['radius'])
+        else:
+            self.draw(x, y)
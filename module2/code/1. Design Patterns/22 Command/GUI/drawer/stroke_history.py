@@ -0,0 +1,276 @@
+from array import array
+
+from drawer.draw_command import DrawCommand
+
+
+# Receiver index of a command kept as an object (its x column is the slot)
+_OBJECT = 0xFFFF
+
+
+class StrokeColumns:
+    """
+    Compact storage for drawn points (strokes).
+
+    Instead of one Python object per point, the x and y coordinates, the
+    color and the radius are kept in parallel arrays, one entry per stroke.
+    Colors are stored as indexes into a small palette of color names.
+
+    A stroke takes 12 bytes this way, instead of a few hundred for a dict
+    or a DrawCommand object. Appending and removing the last stroke are
+    O(1) (amortized).
+    """
+
+    def __init__(self):
+        """Initialize empty columns"""
+        self.xs = array('i')
+        self.ys = array('i')
+        self.colors = array('H')   # index into self.palette
+        self.radii = array('H')
+        self.palette = []          # color names, in order of first use
+        self._color_index = {}     # color name -> index in palette
+
+    def _color(self, color):
+        """Get the palette index of a color, adding it if needed"""
+        index = self._color_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._color_index[color] = index
+        return index
+
+    def append(self, x, y, color, radius):
+        """
+        Add a stroke at the end.
+
+        Args:
+            x (int): X-coordinate
+            y (int): Y-coordinate
+            color (str): Color name
+            radius (int): Radius of the point
+        """
+        self.xs.append(x)
+        self.ys.append(y)
+        self.colors.append(self._color(color))
+        self.radii.append(radius)
+
+    def pop(self):
+        """
+        Remove the last stroke.
+
+        Returns:
+            tuple: (x, y, color, radius) of the removed stroke
+
+        Raises:
+            IndexError: If there are no strokes
+        """
+        if not self.xs:
+            raise IndexError("pop from empty stroke columns")
+        return (self.xs.pop(), self.ys.pop(),
+                self.palette[self.colors.pop()], self.radii.pop())
+
+    def insert(self, index, x, y, color, radius):
+        """Insert a stroke at a position (O(n), like list.insert)"""
+        self.xs.insert(index, x)
+        self.ys.insert(index, y)
+        self.colors.insert(index, self._color(color))
+        self.radii.insert(index, radius)
+
+    def clear(self):
+        """Remove all strokes"""
+        del self.xs[:], self.ys[:], self.colors[:], self.radii[:]
+
+    def truncate(self, count):
+        """Keep only the first count strokes"""
+        del self.xs[count:], self.ys[count:], self.colors[count:], self.radii[count:]
+
+    def stroke(self, index):
+        """
+        Get one stroke.
+
+        Returns:
+            tuple: (x, y, color, radius)
+        """
+        return (self.xs[index], self.ys[index],
+                self.palette[self.colors[index]], self.radii[index])
+
+    def strokes(self):
+        """
+        Iterate over all strokes.
+
+        Yields:
+            tuple: (x, y, color, radius), with color as a palette index
+        """
+        return zip(self.xs, self.ys, self.colors, self.radii)
+
+    def nbytes(self):
+        """
+        Get the memory used by the columns (without the palette).
+
+        Returns:
+            int: Size of the column buffers in bytes
+        """
+        return sum(column.buffer_info()[1] * column.itemsize
+                   for column in (self.xs, self.ys, self.colors, self.radii))
+
+    def __len__(self):
+        """Number of strokes"""
+        return len(self.xs)
+
+    def __delitem__(self, index):
+        """Remove the stroke at a position (O(n) unless it is the last one)"""
+        del self.xs[index], self.ys[index], self.colors[index], self.radii[index]
+
+
+class StrokeHistory:
+    """
+    Columnar command storage for a MacroCommand holding DrawCommands.
+
+    It behaves like the deque of commands a MacroCommand normally uses
+    (append, pop, insert, indexing, iteration), but only keeps the fields of
+    each DrawCommand in StrokeColumns plus a receiver column. Commands are
+    rebuilt on demand when they are read back; execute() replays the history
+    straight from the columns without creating any command objects.
+
+    A DrawCommand read back (pop, indexing, iteration) is therefore a new
+    object equal to the one appended (same position, color, radius and
+    receiver), not that object itself. Other commands, such as nested
+    MacroCommands, are kept as objects and come back unchanged.
+
+    Usage:
+        history = MacroCommand(StrokeHistory())
+    """
+
+    def __init__(self):
+        """Initialize an empty history"""
+        self.columns = StrokeColumns()
+        self.receivers = array('H')  # index into self._drawables
+        self._drawables = []
+        self._drawable_index = {}    # id(drawable) -> index in _drawables
+        self._objects = []           # commands that are not DrawCommands
+
+    def _receiver(self, drawable):
+        """Get the index of a receiver, adding it if needed"""
+        index = self._drawable_index.get(id(drawable))
+        if index is None:
+            index = len(self._drawables)
+            self._drawables.append(drawable)
+            self._drawable_index[id(drawable)] = index
+        return index
+
+    def _store(self, cmd):
+        """Get the column fields of a command, keeping other commands as objects"""
+        if isinstance(cmd, DrawCommand):
+            return cmd.x, cmd.y, cmd.color, cmd.radius, self._receiver(cmd.drawable)
+        self._objects.append(cmd)
+        return len(self._objects) - 1, 0, None, 0, _OBJECT  # color None is never read
+
+    def _command(self, x, y, color, radius, receiver):
+        """Get the command of a row of the columns"""
+        if receiver == _OBJECT:
+            return self._objects[x]
+        return DrawCommand(self._drawables[receiver], x, y, color, radius)
+
+    def _release(self, slot):
+        """Forget a command kept as an object"""
+        objects = self._objects
+        objects[slot] = None
+        while objects and objects[-1] is None:
+            objects.pop()
+
+    def append(self, cmd):
+        """
+        Add a command at the end.
+
+        Args:
+            cmd (Command): The command to store; DrawCommands go into the
+                           columns, other commands are kept as objects
+        """
+        x, y, color, radius, receiver = self._store(cmd)
+        self.columns.append(x, y, color, radius)
+        self.receivers.append(receiver)
+
+    def pop(self):
+        """
+        Remove the last command (undo).
+
+        Returns:
+            Command: The removed command (a DrawCommand is rebuilt from the columns)
+
+        Raises:
+            IndexError: If the history is empty
+        """
+        x, y, color, radius = self.columns.pop()
+        receiver = self.receivers.pop()
+        cmd = self._command(x, y, color, radius, receiver)
+        if receiver == _OBJECT:
+            self._release(x)
+        return cmd
+
+    def insert(self, index, cmd):
+        """Insert a command at a position (O(n))"""
+        x, y, color, radius, receiver = self._store(cmd)
+        self.columns.insert(index, x, y, color, radius)
+        self.receivers.insert(index, receiver)
+
+    def clear(self):
+        """Remove all commands"""
+        self.columns.clear()
+        del self.receivers[:]
+        self._drawables.clear()
+        self._drawable_index.clear()
+        self._objects.clear()
+
+    def execute(self):
+        """
+        Replay every command from the columns.
+
+        Has the same effect as executing each command in order, but passes
+        the stored fields of DrawCommands straight to the receiver's
+        draw_stroke().
+        """
+        columns = self.columns
+        drawables = self._drawables
+        palette = columns.palette
+        for x, y, color, radius, receiver in zip(columns.xs, columns.ys, columns.colors,
+                                                 columns.radii, self.receivers):
+            if receiver == _OBJECT:
+                self._objects[x].execute()
+            else:
+                drawables[receiver].draw_stroke(x, y, palette[color], radius)
+
+    def nbytes(self):
+        """
+        Get the memory used by the columns.
+
+        Returns:
+            int: Size of the column buffers in bytes (commands kept as
+                 objects are not counted)
+        """
+        return self.columns.nbytes() + self.receivers.buffer_info()[1] * self.receivers.itemsize
+
+    def __len__(self):
+        """Number of commands"""
+        return len(self.receivers)
+
+    def __getitem__(self, index):
+        """Get the command at a position, rebuilt from the columns"""
+        return self._command(*self.columns.stroke(index), self.receivers[index])
+
+    def __delitem__(self, index):
+        """Remove the command at a position"""
+        if self.receivers[index] == _OBJECT:
+            self._release(self.columns.xs[index])
+        del self.columns[index]
+        del self.receivers[index]
+
+    def __iter__(self):
+        """Iterate over the commands, rebuilt one at a time"""
+        drawables = self._drawables
+        palette = self.columns.palette
+        for x, y, color, radius, receiver in zip(self.columns.xs, self.columns.ys,
+                                                 self.columns.colors, self.columns.radii,
+                                                 self.receivers):
+            if receiver == _OBJECT:
+                yield self._objects[x]
+            else:
+                yield DrawCommand(drawables[receiver], x, y, palette[color], radius)
@@ -5,6 +5,7 @@ from PyQt6.QtCore import QTimer, Qt
 from PyQt6.QtGui import QFont
 from command.macro_command import MacroCommand
 from drawer.draw_canvas import DrawCanvas
+from drawer.stroke_history import StrokeHistory
 
 class DrawingApp(QMainWindow):
     def __init__(self):
@@ -12,7 +13,9 @@ class DrawingApp(QMainWindow):
         self.setWindowTitle("Command Pattern Demo - Drawing App (PyQt6)")
         self.setFixedSize(640, 600)
         
-        self.history = MacroCommand()
+        # Commands are kept in compact columns instead of one object each;
+        # undo gives back an equal DrawCommand rebuilt from them
+        self.history = MacroCommand(StrokeHistory())
         
         self._create_widgets()
         self._setup_layout()
@@ -120,7 +123,8 @@ class DrawingApp(QMainWindow):
         """Undo the last command"""
         if not self.history.is_empty():
             self.history.undo()
-            self.canvas.repaint()
+            # restore from a raster checkpoint instead of replaying everything
+            self.canvas.rewind(self.history.size())
             print("Last command undone")
         else:
             print("No commands to undo")